@@ -30,3 +30,12 @@ T = typx.TypeVar( 'T' )
 
 
 dictproxy_empty: cabc.Mapping[ str, str ] = types.MappingProxyType( { } )
+
+
+def qualify_object( objct: object ) -> typx.Optional[ str ]:
+    ''' Produces fully-qualified name of object, if it has a name. '''
+    if inspect.ismodule( objct ): return objct.__name__
+    qname = getattr( objct, '__qualname__', None )
+    if not isinstance( qname, str ): return None
+    mname = getattr( objct, '__module__', None )
+    return f"{mname}.{qname}" if isinstance( mname, str ) else qname
@@ -34,12 +34,25 @@ fragments: _FragmentsTable = __.types.MappingProxyType( {
         processed and rendered.
     ''',
 
+    'documentables index':
+    ''' Index of documentable objects.
+
+        Maps objects to qualified names, kinds, and owners.
+        Built once per decoration run of a module.
+    ''',
+
     'fragment rectifier':
     ''' Cleans and normalizes documentation fragment. ''',
 
     'fragments name':
     ''' Name of class attribute which stores documentation fragments. ''',
 
+    'instrumenter':
+    ''' Receives durations of stages of docstring assembly.
+
+        If absent, then stages are not timed.
+    ''',
+
     'introspection':
     ''' Controls on introspection behavior.
 
@@ -57,11 +70,22 @@ fragments: _FragmentsTable = __.types.MappingProxyType( {
         Used by renderers for determing whether to fully-qualify a name.
     ''',
 
+    'invoker globals automatic':
+    ''' Bind invoker globals from module of decorated object?
+
+        If true and invoker globals are not supplied, then the globals of the
+        module, which defines the decorated object, are used.
+        No stack frames are inspected.
+    ''',
+
     'notifier': ''' Notifies of warnings and errors. ''',
 
     'renderer':
     ''' Produces docstring fragment from object and information about it. ''',
 
+    'resolution mode':
+    ''' How to resolve string annotations and forward references. ''',
+
     'resolver globals':
     ''' Dictionary of globals for annotation resolution.
 
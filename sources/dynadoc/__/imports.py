@@ -23,16 +23,25 @@
 # ruff: noqa: F401
 
 
+import                      ast
+import                      atexit
 import                      builtins
+import                      collections
 import collections.abc as   cabc
 import dataclasses as       dcls
 import                      enum
+import                      fnmatch
 import functools as         funct
+import                      hashlib
 import                      inspect
 import itertools as         itert
+import                      json
 import                      operator
+import                      os
 import                      re
 import                      sys
+import                      threading
+import                      time
 import                      types
 import                      warnings
 import                      weakref
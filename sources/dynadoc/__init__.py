@@ -24,11 +24,14 @@
 from . import __
 from . import assembly
 from . import context
+from . import counters
 from . import factories
+from . import fingerprints
 from . import interfaces
 from . import introspection
 from . import nomina
 from . import renderers
+from . import tracing
 from . import xtnsapi
 # --- BEGIN: Injected by Copier ---
 # --- END: Injected by Copier ---
@@ -49,7 +52,11 @@ def _notify( level: NotificationLevels, message: str ) -> None:
 _context = produce_context( notifier = _notify )
 _introspection_cc = ClassIntrospectionControl(
     inheritance = True,
-    introspectors = ( introspection.introspect_special_classes, ) )
+    introspectors = (
+        introspection.introspect_special_classes,
+        introspection.introspect_dataclasses,
+        introspection.introspect_named_tuples,
+        introspection.introspect_typed_dicts ) )
 _introspection = IntrospectionControl(
     class_control = _introspection_cc, targets = IntrospectionTargetsOmni )
 assign_module_docstring(
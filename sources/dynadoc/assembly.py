@@ -26,12 +26,157 @@
 
 
 from . import __
+from . import counters as _counters
 from . import factories as _factories
+from . import fingerprints as _fingerprints
 from . import renderers as _renderers
+from . import tracing as _tracing
 from . import xtnsapi as _xtnsapi
 
 
-_visitees: __.weakref.WeakSet[ _xtnsapi.Documentable ] = __.weakref.WeakSet( )
+_exclusions = _xtnsapi.VisiteesRegistry( )
+_visitees = _xtnsapi.VisiteesRegistry( )
+
+_introspection_limit_null = _xtnsapi.IntrospectionLimit( )
+_stages = _xtnsapi.InstrumentationStages
+
+_Fingerprintable: __.typx.TypeAlias = (
+    type[ object ] | __.cabc.Callable[ ..., object ] | __.types.ModuleType )
+# Strings, since method wrappers are not subscriptable at runtime.
+_ClassMethod: __.typx.TypeAlias = (
+    'classmethod[ __.typx.Any, ..., __.typx.Any ]' )
+_StaticMethod: __.typx.TypeAlias = 'staticmethod[ ..., __.typx.Any ]'
+
+
+@__.dcls.dataclass( frozen = True, kw_only = True, slots = True )
+class _FunctionDocstringRecord:
+    ''' Assembled docstring of function and inputs to its assembly. '''
+
+    context: _xtnsapi.Context
+    introspection: _xtnsapi.IntrospectionControl
+    renderer: _xtnsapi.Renderer
+    table: _xtnsapi.FragmentsTable
+    fragments: _xtnsapi.Fragments
+    preserve: bool
+    docstring_original: __.typx.Optional[ str ]
+    annotations: tuple[ tuple[ str, __.typx.Any ], ... ]
+    docstring: __.typx.Optional[ str ]
+
+
+@__.dcls.dataclass( frozen = True, kw_only = True, slots = True )
+class _DecorationRetention:
+    ''' Assembled docstring of object and fingerprint of its inputs. '''
+
+    fingerprint: str
+    docstring: __.typx.Optional[ str ]
+
+
+@__.dcls.dataclass( frozen = True, kw_only = True, slots = True )
+class _DecorationRun:
+    ''' State shared by decorations within one run. '''
+
+    incremental: bool = False
+    descriptions: dict[ int, tuple[ object, str ] ] = (
+        __.dcls.field( default_factory = dict[ int, tuple[ object, str ] ] ) )
+    functions_docstrings: dict[
+        __.types.CodeType, _FunctionDocstringRecord
+    ] = __.dcls.field(
+        default_factory = dict[ __.types.CodeType, _FunctionDocstringRecord ] )
+    sink: __.typx.Optional[ dict[ str, __.typx.Optional[ str ] ] ] = None
+    visitees: _xtnsapi.VisiteesRegistry = (
+        __.dcls.field( default_factory = lambda: _visitees ) )
+
+    def assign(
+        self, objct: object, docstring: __.typx.Optional[ str ]
+    ) -> None:
+        ''' Assigns docstring to object or, if sink exists, records it. '''
+        if self.sink is None: objct.__doc__ = docstring
+        else: self.sink[ _qualify( objct ) ] = docstring
+
+
+@__.dcls.dataclass( frozen = True, kw_only = True, slots = True )
+class _TemplatePrototype:
+    ''' Informations of class and inputs to their introspection. '''
+
+    context: _xtnsapi.Context
+    introspection: _xtnsapi.IntrospectionControl
+    table: _xtnsapi.FragmentsTable
+    bases: tuple[ type, ... ]
+    names: tuple[ str, ... ]
+    annotations: tuple[ tuple[ str, __.typx.Any ], ... ]
+    informations: tuple[ _xtnsapi.InformationBase, ... ]
+
+
+@__.dcls.dataclass( kw_only = True, slots = True )
+class _DocstringTemplate:
+    ''' Annotations cache and prototype shared by decorations. '''
+
+    cache: _xtnsapi.AnnotationsCache = (
+        __.dcls.field( default_factory = _xtnsapi.AnnotationsCache ) )
+    prototype: __.typx.Optional[ _TemplatePrototype ] = None
+
+    def introspect(
+        self,
+        objct: _xtnsapi.Documentable,
+        context: _xtnsapi.Context,
+        introspection: _xtnsapi.IntrospectionControl,
+        table: _xtnsapi.FragmentsTable,
+    ) -> _xtnsapi.Informations:
+        ''' Introspects object, substituting into prototype, if alike.
+
+            A class, which is alike to the prototype, only has its varying
+            annotations reduced and substituted into the informations of
+            the prototype. Otherwise, the object is fully introspected and,
+            if it is a class, it becomes the prototype.
+        '''
+        annotations = _access_template_annotations( objct )
+        if annotations is None:
+            return _xtnsapi.introspect(
+                objct,
+                context = context, introspection = introspection,
+                cache = self.cache, table = table )
+        class_ = __.typx.cast( type, objct )
+        if self.prototype is not None:
+            informations = _substitute_template_annotations(
+                self.prototype, class_, annotations,
+                context = context,
+                introspection = introspection,
+                cache = self.cache,
+                table = table )
+            if informations is not None: return informations
+        informations = tuple( _xtnsapi.introspect(
+            objct,
+            context = context, introspection = introspection,
+            cache = self.cache, table = table ) )
+        self.prototype = _TemplatePrototype(
+            context = context,
+            introspection = introspection,
+            table = table,
+            bases = class_.__bases__,
+            names = tuple( class_.__dict__ ),
+            annotations = annotations,
+            informations = informations )
+        return informations
+
+
+_run_default = _DecorationRun( )
+_value_absent = object( )
+
+_retentions_maximum = 65536
+_template_cache_maximum = 4096
+
+
+# Docstrings assembled by incremental runs are retained by qualified name,
+# so that they can be reused for equivalent objects after module reloads.
+# Least recently assembled docstrings are evicted beyond maximum.
+_retentions: dict[ str, _DecorationRetention ] = { }
+
+
+# Functions, which share code objects, e.g., closures produced by repeated
+# calls of same factory, can share docstrings assembled from same inputs.
+_functions_docstrings: __.weakref.WeakKeyDictionary[
+    __.types.CodeType, _FunctionDocstringRecord
+] = __.weakref.WeakKeyDictionary( )
 
 
 context_default: __.typx.Annotated[
@@ -63,36 +208,89 @@ def assign_module_docstring( # noqa: PLR0913
     preserve: _xtnsapi.PreserveArgument = True,
     renderer: _xtnsapi.RendererArgument = renderer_default,
     table: _xtnsapi.FragmentsTableArgument = __.dictproxy_empty,
-) -> None:
-    ''' Assembles docstring from fragments and assigns it to module. '''
+    incremental: _xtnsapi.IncrementalArgument = False,
+) -> __.typx.Annotated[
+    _xtnsapi.DocumentablesIndex,
+    _xtnsapi.Doc(
+        ''' Index of documentable objects surveyed within module.
+
+            May be queried after the docstrings are assigned.
+        ''' ),
+]:
+    ''' Assembles docstring from fragments and assigns it to module.
+
+        Builds an index of documentable objects within the module once, which
+        is shared by the surveyors and renderers for the whole run.
+
+        In incremental mode, the module can be decorated again after it is
+        reloaded. Docstrings are then reassembled only for objects with
+        changed inputs; others are reused from the previous runs.
+    '''
+    start = __.time.perf_counter_ns( )
     if isinstance( module, str ):
         module = __.sys.modules[ module ]
-    _decorate(
-        module,
-        context = context,
-        introspection = introspection,
-        preserve = preserve,
-        renderer = renderer,
-        fragments = fragments,
-        table = table )
+    try:
+        context = _prepare_context( module, context )
+        run = _DecorationRun( incremental = incremental )
+        index = _produce_index( module, context, introspection, run )
+        _decorate(
+            module,
+            context = context.with_index( index ),
+            introspection = introspection,
+            preserve = preserve,
+            renderer = renderer,
+            fragments = fragments,
+            table = table,
+            run = run )
+        _flush_notifications( context )
+    finally:
+        _counters.tallies.duration += __.time.perf_counter_ns( ) - start
+    return index
 
 
 def exclude( objct: _xtnsapi.D ) -> _xtnsapi.D:
     ''' Excludes object from docstring updates. '''
-    _visitees.add( objct )
+    _exclusions.add( objct )
     return objct
 
 
-def with_docstring(
+def produce_docstrings( # noqa: PLR0913
+    objct: _xtnsapi.Documentable, /,
     *fragments: _xtnsapi.FragmentsArgumentMultivalent,
     context: _xtnsapi.ContextArgument = context_default,
     introspection: _xtnsapi.IntrospectionArgument = introspection_default,
     preserve: _xtnsapi.PreserveArgument = True,
     renderer: _xtnsapi.RendererArgument = renderer_default,
     table: _xtnsapi.FragmentsTableArgument = __.dictproxy_empty,
-) -> _xtnsapi.Decorator[ _xtnsapi.D ]:
-    ''' Assembles docstring from fragments and decorates object with it. '''
-    def decorate( objct: _xtnsapi.D ) -> _xtnsapi.D:
+) -> __.typx.Annotated[
+    __.cabc.Mapping[ str, __.typx.Optional[ str ] ],
+    _xtnsapi.Doc(
+        ''' Assembled docstrings by fully-qualified names of objects. ''' ),
+]:
+    ''' Assembles docstrings for object and its attributes.
+
+        Same docstrings are assembled as by the decorators, but they are
+        returned rather than assigned. Objects are neither modified nor
+        recorded as visited; extant docstrings are read as they are.
+
+        Visited objects are local to the call. Records of docstrings
+        assembled for functions are consulted, but not written. Memoization
+        caches, which are weakly keyed by their subjects, are shared with
+        other calls: annotations records of classes, resolutions of string
+        annotations, public names of modules, and introspection controls
+        derived from limits. Their entries depend only on their inputs, so
+        concurrent calls may duplicate work, but do not alter each other's
+        results. Cumulative statistics are updated too.
+    '''
+    start = __.time.perf_counter_ns( )
+    sink: dict[ str, __.typx.Optional[ str ] ] = { }
+    try:
+        context = _prepare_context( objct, context )
+        run = _DecorationRun(
+            sink = sink, visitees = _xtnsapi.VisiteesRegistry( ) )
+        if __.inspect.ismodule( objct ):
+            context = context.with_index(
+                _produce_index( objct, context, introspection, run ) )
         _decorate(
             objct,
             context = context,
@@ -100,12 +298,212 @@ def with_docstring(
             preserve = preserve,
             renderer = renderer,
             fragments = fragments,
-            table = table )
+            table = table,
+            run = run )
+        _flush_notifications( context )
+    finally:
+        _counters.tallies.duration += __.time.perf_counter_ns( ) - start
+    return sink
+
+
+def produce_fingerprint( # noqa: PLR0913
+    objct: _xtnsapi.Documentable, /,
+    *fragments: _xtnsapi.FragmentsArgumentMultivalent,
+    context: _xtnsapi.ContextArgument = context_default,
+    introspection: _xtnsapi.IntrospectionArgument = introspection_default,
+    preserve: _xtnsapi.PreserveArgument = True,
+    renderer: _xtnsapi.RendererArgument = renderer_default,
+    table: _xtnsapi.FragmentsTableArgument = __.dictproxy_empty,
+) -> __.typx.Annotated[
+    str,
+    _xtnsapi.Doc(
+        ''' Hexadecimal digest of inputs to docstring assembly.
+
+            Same inputs produce same digest across processes, regardless
+            of hash seed.
+        ''' ),
+]:
+    ''' Produces stable fingerprint of inputs to docstring of object.
+
+        Covers the extant docstring, if preserved, the fragments with their
+        entries from the table, the introspection limit on the object, the
+        results of introspection, such as reduced annotations and their
+        extras, and the settings for decoration, such as the renderer.
+        Neither decorates the object nor records it as visited.
+    '''
+    context = _prepare_context( objct, context )
+    fqname = _qualify( objct )
+    fragments_ = _collect_fragments( objct, context, fqname ) or fragments
+    limit = (
+        objct.__dict__.get( context.introspection_limit_name )
+        if __.inspect.ismodule( objct )
+        else getattr( objct, context.introspection_limit_name, None ) )
+    descriptions: list[ str ] = [
+        repr( objct.__doc__ if preserve else None ),
+        _fingerprints.describe_value( tuple(
+            _process_fragments_argument( context, fragments_, table ) ) ),
+        _fingerprints.describe_value( limit ) ]
+    if introspection.enable:
+        informations = _xtnsapi.introspect(
+            objct,
+            context = context, introspection = introspection,
+            cache = _xtnsapi.AnnotationsCache( ), table = table )
+        values = tuple(
+            __.inspect.getattr_static( objct, information.name, _value_absent )
+            for information in informations
+            if isinstance( information, _xtnsapi.AttributeInformation ) )
+        descriptions.append( _fingerprints.describe_value(
+            ( tuple( informations ), values ) ) )
+    descriptions.extend( _describe_decoration_settings(
+        context, introspection, renderer, table, _DecorationRun( ) ) )
+    return _fingerprints.produce_digest( descriptions )
+
+
+def reset_visitees(
+    subtree: __.typx.Annotated[
+        __.typx.Optional[ _xtnsapi.Module ],
+        _xtnsapi.Doc(
+            ''' Module, or name of module, at root of subtree to forget.
+
+                If absent, then all visited objects are forgotten.
+            ''' ),
+    ] = None,
+) -> None:
+    ''' Forgets visited objects, so that they may be decorated again.
+
+        Objects excluded from docstring updates remain excluded.
+    '''
+    if subtree is None:
+        _visitees.advance( )
+        return
+    if not isinstance( subtree, str ): subtree = subtree.__name__
+    _visitees.discard_subtree( subtree )
+
+
+def with_docstring(
+    *fragments: _xtnsapi.FragmentsArgumentMultivalent,
+    context: _xtnsapi.ContextArgument = context_default,
+    introspection: _xtnsapi.IntrospectionArgument = introspection_default,
+    preserve: _xtnsapi.PreserveArgument = True,
+    renderer: _xtnsapi.RendererArgument = renderer_default,
+    table: _xtnsapi.FragmentsTableArgument = __.dictproxy_empty,
+) -> _xtnsapi.Decorator[ _xtnsapi.D ]:
+    ''' Assembles docstring from fragments and decorates object with it. '''
+    def decorate( objct: _xtnsapi.D ) -> _xtnsapi.D:
+        start = __.time.perf_counter_ns( )
+        try:
+            _decorate(
+                objct,
+                context = _prepare_context( objct, context ),
+                introspection = introspection,
+                preserve = preserve,
+                renderer = renderer,
+                fragments = fragments,
+                table = table )
+        finally:
+            _counters.tallies.duration += __.time.perf_counter_ns( ) - start
         return objct
 
     return decorate
 
 
+def with_docstring_template(
+    *fragments: _xtnsapi.FragmentsArgumentMultivalent,
+    context: _xtnsapi.ContextArgument = context_default,
+    introspection: _xtnsapi.IntrospectionArgument = introspection_default,
+    preserve: _xtnsapi.PreserveArgument = True,
+    renderer: _xtnsapi.RendererArgument = renderer_default,
+    table: _xtnsapi.FragmentsTableArgument = __.dictproxy_empty,
+) -> _xtnsapi.Decorator[ _xtnsapi.D ]:
+    ''' Assembles docstrings for objects produced from common template.
+
+        Intended for class factories, which produce many classes of same
+        structure. The decorator should be created once per factory and then
+        applied to each produced class. The first class is introspected
+        fully. A later class, which has the same bases, the same names in
+        its namespace, and the same annotation names as it, reuses its
+        informations; only annotations which vary are reduced and
+        substituted. Varying annotations must not be strings, forward
+        references, or class variables and must not carry descriptions or
+        other extras; otherwise, the class is introspected fully and
+        becomes the new prototype. The visibility decider is assumed to not
+        distinguish between such classes. Each class is still rendered.
+    '''
+    template = _DocstringTemplate( )
+
+    def decorate( objct: _xtnsapi.D ) -> _xtnsapi.D:
+        start = __.time.perf_counter_ns( )
+        cache = template.cache
+        # Bound retention. Safe to clear between decorations.
+        if len( cache.entries ) > _template_cache_maximum:
+            cache.entries.clear( )
+            cache.adjuncts.clear( )
+        try:
+            _decorate(
+                objct,
+                context = _prepare_context( objct, context ),
+                introspection = introspection,
+                preserve = preserve,
+                renderer = renderer,
+                fragments = fragments,
+                table = table,
+                cache = cache,
+                template = template )
+        finally:
+            _counters.tallies.duration += __.time.perf_counter_ns( ) - start
+        return objct
+
+    return decorate
+
+
+def _access_template_annotations(
+    objct: object
+) -> __.typx.Optional[ tuple[ tuple[ str, __.typx.Any ], ... ] ]:
+    ''' Accesses annotations of class for substitution into prototype.
+
+        Returns None for objects which are not classes and for classes
+        with inaccessible annotations.
+    '''
+    if not __.inspect.isclass( objct ): return None
+    try: annotations = __.inspect.get_annotations( objct )
+    except ( NameError, TypeError ): return None
+    return tuple( annotations.items( ) )
+
+
+def _are_annotations_identical(
+    annotations_a: tuple[ tuple[ str, __.typx.Any ], ... ],
+    annotations_b: tuple[ tuple[ str, __.typx.Any ], ... ],
+) -> bool:
+    ''' Compares annotations by names and identities of values. '''
+    if len( annotations_a ) != len( annotations_b ): return False
+    return all(
+        name_a == name_b and value_a is value_b
+        for ( name_a, value_a ), ( name_b, value_b )
+        in zip( annotations_a, annotations_b ) )
+
+
+def _are_contexts_identical(
+    context_a: _xtnsapi.Context, context_b: _xtnsapi.Context
+) -> bool:
+    ''' Compares contexts by identities of their fields.
+
+        Avoids comparison of globals dictionaries by value.
+    '''
+    if context_a is context_b: return True
+    return all(
+        getattr( context_a, field.name ) is getattr( context_b, field.name )
+        for field in __.dcls.fields( context_a ) )
+
+
+def _are_sequences_identical(
+    sequence_a: __.cabc.Sequence[ __.typx.Any ],
+    sequence_b: __.cabc.Sequence[ __.typx.Any ],
+) -> bool:
+    ''' Compares sequences by identities of their items. '''
+    if len( sequence_a ) != len( sequence_b ): return False
+    return all( a is b for a, b in zip( sequence_a, sequence_b ) )
+
+
 def _check_module_recursion(
     objct: object, /,
     introspection: _xtnsapi.IntrospectionControl,
@@ -122,6 +520,19 @@ def _check_module_recursion(
     return False
 
 
+def _classify_documentable(
+    objct: _xtnsapi.Documentable, surface: object
+) -> _xtnsapi.IntrospectionTargets:
+    ''' Determines kind of documentable object from its surface. '''
+    if __.inspect.ismodule( objct ):
+        return _xtnsapi.IntrospectionTargets.Module
+    if __.inspect.isclass( objct ):
+        return _xtnsapi.IntrospectionTargets.Class
+    if isinstance( surface, property ):
+        return _xtnsapi.IntrospectionTargets.Descriptor
+    return _xtnsapi.IntrospectionTargets.Function
+
+
 def _collect_fragments(
     objct: _xtnsapi.Documentable, /, context: _xtnsapi.Context, fqname: str
 ) -> _xtnsapi.Fragments:
@@ -134,19 +545,25 @@ def _collect_fragments(
     fragments: _xtnsapi.Fragments = (
         # Fragments can come from base class or metaclass.
         # We only care about fragments on class itself.
+        # Modules may have lazy attribute loaders, which must not trigger.
         objct.__dict__.get( context.fragments_name, ( ) )
-        if __.inspect.isclass( objct )
+        if __.inspect.isclass( objct ) or __.inspect.ismodule( objct )
         else getattr( objct, context.fragments_name, ( ) ) )
     if (    isinstance( fragments, ( bytes, str ) )
         or not isinstance( fragments, __.cabc.Sequence )
     ):
-        emessage = f"Invalid fragments sequence on {fqname}: {fragments!r}"
-        context.notifier( 'error', emessage )
+        context.notify(
+            'error',
+            lambda: f"Invalid fragments sequence on {fqname}: {fragments!r}",
+            code = 'fragments-invalid', qualname = fqname )
         fragments = ( )
     for fragment in fragments:
         if not isinstance( fragment, ( str, _xtnsapi.Doc ) ):
-            emessage = f"Invalid fragment on {fqname}: {fragment!r}"
-            context.notifier( 'error', emessage )
+            context.notify(
+                'error',
+                lambda fragment = fragment:
+                    f"Invalid fragment on {fqname}: {fragment!r}",
+                code = 'fragment-invalid', qualname = fqname )
     return fragments
 
 
@@ -241,6 +658,9 @@ def _decorate( # noqa: PLR0913
     renderer: _xtnsapi.Renderer,
     fragments: _xtnsapi.Fragments,
     table: _xtnsapi.FragmentsTable,
+    cache: __.typx.Optional[ _xtnsapi.AnnotationsCache ] = None,
+    run: _DecorationRun = _run_default,
+    template: __.typx.Optional[ _DocstringTemplate ] = None,
 ) -> None:
     ''' Decorates an object with assembled docstring.
 
@@ -248,8 +668,42 @@ def _decorate( # noqa: PLR0913
         of the object's attributes based on introspection control settings.
         Prevents multiple decoration of the same object.
     '''
-    if objct in _visitees: return # Prevent multiple decoration.
-    _visitees.add( objct )
+    if _is_settled( objct, run ): return # Prevent multiple decoration.
+    revisit = objct in run.visitees
+    run.visitees.add( objct )
+    kind = _classify_documentable( objct, objct ).name
+    if kind is not None: _counters.tallies.decorations[ kind ] += 1
+    tracer = _tracing.tracer
+    if tracer is not None: tracer.enter( objct )
+    try:
+        _decorate_visitee(
+            objct, revisit,
+            context = context,
+            introspection = introspection,
+            preserve = preserve,
+            renderer = renderer,
+            fragments = fragments,
+            table = table,
+            cache = cache,
+            run = run,
+            template = template )
+    finally:
+        if tracer is not None: tracer.exit( )
+
+
+def _decorate_visitee( # noqa: PLR0913
+    objct: _xtnsapi.Documentable, revisit: bool, /,
+    context: _xtnsapi.Context,
+    introspection: _xtnsapi.IntrospectionControl,
+    preserve: bool,
+    renderer: _xtnsapi.Renderer,
+    fragments: _xtnsapi.Fragments,
+    table: _xtnsapi.FragmentsTable,
+    cache: __.typx.Optional[ _xtnsapi.AnnotationsCache ],
+    run: _DecorationRun,
+    template: __.typx.Optional[ _DocstringTemplate ],
+) -> None:
+    ''' Decorates newly-visited object and its attributes. '''
     if introspection.targets:
         if __.inspect.isclass( objct ):
             _decorate_class_attributes(
@@ -258,7 +712,8 @@ def _decorate( # noqa: PLR0913
                 introspection = introspection,
                 preserve = preserve,
                 renderer = renderer,
-                table = table )
+                table = table,
+                run = run )
         elif __.inspect.ismodule( objct ):
             _decorate_module_attributes(
                 objct,
@@ -266,11 +721,35 @@ def _decorate( # noqa: PLR0913
                 introspection = introspection,
                 preserve = preserve,
                 renderer = renderer,
-                table = table )
-    if __.inspect.ismodule( objct ): fqname = objct.__name__
-    else: fqname = f"{objct.__module__}.{objct.__qualname__}"
+                table = table,
+                run = run )
+    fqname = _qualify( objct )
     fragments_ = _collect_fragments( objct, context, fqname )
     if not fragments_: fragments_ = fragments
+    if run.incremental:
+        _decorate_incremental(
+            objct, fqname, revisit,
+            context = context,
+            introspection = introspection,
+            preserve = preserve,
+            renderer = renderer,
+            fragments = fragments_,
+            table = table,
+            cache = cache,
+            run = run )
+        return
+    if type( objct ) is __.types.FunctionType:
+        _decorate_function(
+            objct,
+            context = context,
+            introspection = introspection,
+            preserve = preserve,
+            renderer = renderer,
+            fragments = fragments_,
+            table = table,
+            cache = cache,
+            run = run )
+        return
     _decorate_core(
         objct,
         context = context,
@@ -278,7 +757,10 @@ def _decorate( # noqa: PLR0913
         preserve = preserve,
         renderer = renderer,
         fragments = fragments_,
-        table = table )
+        table = table,
+        cache = cache,
+        run = run,
+        template = template )
 
 
 def _decorate_core( # noqa: PLR0913
@@ -289,12 +771,17 @@ def _decorate_core( # noqa: PLR0913
     renderer: _xtnsapi.Renderer,
     fragments: _xtnsapi.Fragments,
     table: _xtnsapi.FragmentsTable,
+    cache: __.typx.Optional[ _xtnsapi.AnnotationsCache ] = None,
+    run: _DecorationRun = _run_default,
+    template: __.typx.Optional[ _DocstringTemplate ] = None,
 ) -> None:
     ''' Core implementation of docstring decoration.
 
         Assembles a docstring from fragments, existing docstring (if
         preserved), and introspection results. Assigns the assembled docstring
-        to the object.
+        to the object. If an annotations cache is not supplied, then a fresh
+        one is used. If a template is supplied, then it performs the
+        introspection.
     '''
     fragments_: list[ str ] = [ ]
     if preserve and ( fragment := getattr( objct, '__doc__', None ) ):
@@ -302,19 +789,151 @@ def _decorate_core( # noqa: PLR0913
             fragment, source = _xtnsapi.FragmentSources.Docstring ) )
     fragments_.extend(
         _process_fragments_argument( context, fragments, table ) )
+    instrumenter = context.instrumenter
+    start = 0 # Nanoseconds since start of any instrumented stage.
     if introspection.enable:
-        cache = _xtnsapi.AnnotationsCache( )
+        if cache is None: cache = _xtnsapi.AnnotationsCache( )
+        if instrumenter is not None: start = __.time.perf_counter_ns( )
         informations = (
             _xtnsapi.introspect(
                 objct,
                 context = context, introspection = introspection,
-                cache = cache, table = table ) )
+                cache = cache, table = table )
+            if template is None
+            else template.introspect(
+                objct, context, introspection, table ) )
+        if instrumenter is not None:
+            _report_stage( instrumenter, _stages.Introspection, objct, start )
+            start = __.time.perf_counter_ns( )
+        fragment = renderer( objct, informations, context = context )
+        _counters.tallies.renditions += 1
+        if instrumenter is not None:
+            _report_stage( instrumenter, _stages.Rendering, objct, start )
         fragments_.append( context.fragment_rectifier(
-            renderer( objct, informations, context = context ),
-            source = _xtnsapi.FragmentSources.Renderer ) )
+            fragment, source = _xtnsapi.FragmentSources.Renderer ) )
     docstring = '\n\n'.join(
         fragment for fragment in filter( None, fragments_ ) ).rstrip( )
-    objct.__doc__ = docstring if docstring else None
+    _counters.tallies.docstrings_size += len(
+        docstring.encode( 'utf-8', 'surrogatepass' ) )
+    if instrumenter is not None: start = __.time.perf_counter_ns( )
+    run.assign( objct, docstring if docstring else None )
+    if instrumenter is not None:
+        _report_stage( instrumenter, _stages.Assignment, objct, start )
+
+
+def _decorate_function( # noqa: PLR0913
+    objct: __.types.FunctionType, /,
+    context: _xtnsapi.Context,
+    introspection: _xtnsapi.IntrospectionControl,
+    preserve: bool,
+    renderer: _xtnsapi.Renderer,
+    fragments: _xtnsapi.Fragments,
+    table: _xtnsapi.FragmentsTable,
+    cache: __.typx.Optional[ _xtnsapi.AnnotationsCache ] = None,
+    run: _DecorationRun = _run_default,
+) -> None:
+    ''' Decorates function, reusing docstring assembled for same code.
+
+        Docstring is reused only if the context, introspection control,
+        renderer, fragments, and annotations are identical to those from
+        which it was originally assembled.
+    '''
+    docstring_original = objct.__doc__
+    annotations = tuple( objct.__annotations__.items( ) )
+    # Contexts with indices reference every object in their modules. Records
+    # of their assemblies are kept only for the run, lest the modules be
+    # retained by the records, which are keyed by code objects of modules.
+    records = (
+        _functions_docstrings if context.index is None
+        else run.functions_docstrings )
+    record = records.get( objct.__code__ )
+    if (    record is not None
+        and record.introspection is introspection
+        and record.renderer is renderer
+        and record.table is table
+        and record.preserve == preserve
+        and record.docstring_original == docstring_original
+        and _are_contexts_identical( record.context, context )
+        and _are_sequences_identical( record.fragments, fragments )
+        and _are_annotations_identical( record.annotations, annotations )
+    ):
+        run.assign( objct, record.docstring )
+        return
+    _decorate_core(
+        objct,
+        context = context,
+        introspection = introspection,
+        preserve = preserve,
+        renderer = renderer,
+        fragments = fragments,
+        table = table,
+        cache = cache,
+        run = run )
+    if run.sink is not None: return # Docstring is not assigned to function.
+    records[ objct.__code__ ] = _FunctionDocstringRecord(
+        context = context,
+        introspection = introspection,
+        renderer = renderer,
+        table = table,
+        fragments = tuple( fragments ),
+        preserve = preserve,
+        docstring_original = docstring_original,
+        annotations = annotations,
+        docstring = objct.__doc__ )
+
+
+def _decorate_incremental( # noqa: PLR0913
+    objct: _xtnsapi.Documentable, fqname: str, revisit: bool, /,
+    context: _xtnsapi.Context,
+    introspection: _xtnsapi.IntrospectionControl,
+    preserve: bool,
+    renderer: _xtnsapi.Renderer,
+    fragments: _xtnsapi.Fragments,
+    table: _xtnsapi.FragmentsTable,
+    cache: __.typx.Optional[ _xtnsapi.AnnotationsCache ],
+    run: _DecorationRun,
+) -> None:
+    ''' Decorates object, reusing docstring retained for same inputs.
+
+        A revisited object, which still bears its retained docstring, is
+        left alone. Otherwise, the retained docstring is reused if the
+        fingerprint of the inputs to its assembly is unchanged.
+    '''
+    retention = _retentions.get( fqname )
+    if (    retention is not None
+        and revisit and objct.__doc__ == retention.docstring
+    ): return
+    fingerprint = _fingerprint_decoration(
+        objct,
+        context = context,
+        introspection = introspection,
+        preserve = preserve,
+        renderer = renderer,
+        fragments = fragments,
+        table = table,
+        run = run )
+    if retention is not None and retention.fingerprint == fingerprint:
+        objct.__doc__ = retention.docstring
+        return
+    decorator = (
+        _decorate_function if type( objct ) is __.types.FunctionType
+        else _decorate_core )
+    decorator(
+        objct, # pyright: ignore[reportArgumentType]
+        context = context,
+        introspection = introspection,
+        preserve = preserve,
+        renderer = renderer,
+        fragments = fragments,
+        table = table,
+        cache = cache,
+        run = run )
+    if fingerprint is None: return
+    _retentions.pop( fqname, None ) # Reinsertion marks as recent.
+    _retentions[ fqname ] = _DecorationRetention(
+        fingerprint = fingerprint, docstring = objct.__doc__ )
+    while len( _retentions ) > _retentions_maximum:
+        del _retentions[ next( iter( _retentions ) ) ]
 
 
 def _decorate_class_attributes( # noqa: PLR0913
@@ -324,6 +943,7 @@ def _decorate_class_attributes( # noqa: PLR0913
     preserve: bool,
     renderer: _xtnsapi.Renderer,
     table: _xtnsapi.FragmentsTable,
+    run: _DecorationRun = _run_default,
 ) -> None:
     ''' Decorates attributes of a class with assembled docstrings.
 
@@ -332,13 +952,15 @@ def _decorate_class_attributes( # noqa: PLR0913
     '''
     pmname = objct.__module__
     pqname = objct.__qualname__
-    for aname, attribute, surface_attribute in (
-        _survey_class_attributes( objct, context, introspection )
-    ):
+    survey: __.cabc.Iterable[ tuple[ str, _xtnsapi.Documentable, object ] ]
+    survey = _survey_class_attributes( objct, context, introspection )
+    if context.instrumenter is not None:
+        survey = _measure_survey( context.instrumenter, objct, survey )
+    for aname, attribute, surface_attribute in survey:
         fqname = f"{pmname}.{pqname}.{aname}"
-        introspection_ = _limit_introspection(
-            attribute, context, introspection, fqname )
-        introspection_ = introspection_.evaluate_limits_for( attribute )
+        introspection_ = _limit_introspection_for_member(
+            attribute, surface_attribute,
+            context, introspection, pmname, fqname )
         if not introspection_.enable: continue
         _decorate(
             attribute,
@@ -347,8 +969,9 @@ def _decorate_class_attributes( # noqa: PLR0913
             preserve = preserve,
             renderer = renderer,
             fragments = ( ),
-            table = table )
-        if attribute is not surface_attribute:
+            table = table,
+            run = run )
+        if run.sink is None and attribute is not surface_attribute:
             surface_attribute.__doc__ = attribute.__doc__
 
 
@@ -359,6 +982,7 @@ def _decorate_module_attributes( # noqa: PLR0913
     preserve: bool,
     renderer: _xtnsapi.Renderer,
     table: _xtnsapi.FragmentsTable,
+    run: _DecorationRun = _run_default,
 ) -> None:
     ''' Decorates attributes of a module with assembled docstrings.
 
@@ -366,13 +990,15 @@ def _decorate_module_attributes( # noqa: PLR0913
         and applies appropriate docstring decoration to each attribute.
     '''
     pmname = module.__name__
-    for aname, attribute, surface_attribute in (
-        _survey_module_attributes( module, context, introspection )
-    ):
+    survey: __.cabc.Iterable[ tuple[ str, _xtnsapi.Documentable, object ] ]
+    survey = _survey_module_attributes( module, context, introspection )
+    if context.instrumenter is not None:
+        survey = _measure_survey( context.instrumenter, module, survey )
+    for aname, attribute, surface_attribute in survey:
         fqname = f"{pmname}.{aname}"
-        introspection_ = _limit_introspection(
-            attribute, context, introspection, fqname )
-        introspection_ = introspection_.evaluate_limits_for( attribute )
+        introspection_ = _limit_introspection_for_member(
+            attribute, surface_attribute,
+            context, introspection, pmname, fqname )
         if not introspection_.enable: continue
         _decorate(
             attribute,
@@ -381,9 +1007,194 @@ def _decorate_module_attributes( # noqa: PLR0913
             preserve = preserve,
             renderer = renderer,
             fragments = ( ),
-            table = table )
-        if attribute is not surface_attribute: # pragma: no cover
-            surface_attribute.__doc__ = attribute.__doc__
+            table = table,
+            run = run )
+        if (    run.sink is None
+            and attribute is not surface_attribute
+        ): surface_attribute.__doc__ = attribute.__doc__ # pragma: no cover
+
+
+def _describe_decoration_settings(
+    context: _xtnsapi.Context,
+    introspection: _xtnsapi.IntrospectionControl,
+    renderer: _xtnsapi.Renderer,
+    table: _xtnsapi.FragmentsTable,
+    run: _DecorationRun,
+) -> tuple[ str, ... ]:
+    ''' Describes settings for decoration, memoizing them for run. '''
+    descriptions: list[ str ] = [ ]
+    for setting in ( context, introspection, renderer, table ):
+        entry = run.descriptions.get( id( setting ) )
+        if entry is None:
+            if setting is context: description = _describe_context( context )
+            else: description = _fingerprints.describe_value( setting )
+            # Retain setting, so that its identity is not reused during run.
+            entry = run.descriptions[ id( setting ) ] = (
+                setting, description )
+        descriptions.append( entry[ 1 ] )
+    return tuple( descriptions )
+
+
+def _describe_context( context: _xtnsapi.Context ) -> str:
+    ''' Describes context, representing namespaces by module names. '''
+    descriptions: list[ str ] = [ ]
+    for field in __.dcls.fields( context ):
+        value = getattr( context, field.name )
+        if field.name == 'index': continue
+        if field.name in (
+            'invoker_globals', 'resolver_globals', 'resolver_locals'
+        ): value = None if value is None else value.get( '__name__' )
+        descriptions.append( "{}={}".format(
+            field.name, _fingerprints.describe_value( value ) ) )
+    return ', '.join( descriptions )
+
+
+def _fingerprint_decoration( # noqa: PLR0913
+    objct: _xtnsapi.Documentable, /,
+    context: _xtnsapi.Context,
+    introspection: _xtnsapi.IntrospectionControl,
+    preserve: bool,
+    renderer: _xtnsapi.Renderer,
+    fragments: _xtnsapi.Fragments,
+    table: _xtnsapi.FragmentsTable,
+    run: _DecorationRun,
+) -> __.typx.Optional[ str ]:
+    ''' Fingerprints inputs to assembly of docstring for object.
+
+        The fingerprint covers the extant docstring, if preserved, the
+        fragments, the annotations and values of the object and its bases,
+        and the settings for decoration. Returns ``None`` if the annotations
+        cannot be accessed without evaluation.
+    '''
+    subject: _Fingerprintable = objct
+    possessors: __.cabc.Sequence[ _Fingerprintable ] = (
+        subject.__mro__[ : -1 ] if isinstance( subject, type )
+        else ( subject, ) )
+    descriptions: list[ str ] = [
+        repr( subject.__doc__ if preserve else None ),
+        _fingerprints.describe_value( tuple( fragments ) ) ]
+    for possessor in possessors:
+        try: annotations = __.inspect.get_annotations( possessor )
+        except ( NameError, TypeError, AttributeError ): return None
+        if isinstance( possessor, __.types.FunctionType ):
+            values = ( possessor.__defaults__, possessor.__kwdefaults__ )
+        else:
+            values = tuple(
+                possessor.__dict__.get( name, _value_absent )
+                for name in annotations )
+        descriptions.append(
+            _fingerprints.describe_value( ( annotations, values ) ) )
+    descriptions.extend( _describe_decoration_settings(
+        context, introspection, renderer, table, run ) )
+    return _fingerprints.produce_digest( descriptions )
+
+
+def _flush_notifications( context: _xtnsapi.Context ) -> None:
+    ''' Flushes buffered notifications at end of run, if requested. '''
+    notifier = context.notifier
+    if not getattr( notifier, 'flush_after_runs', False ): return
+    flush: __.typx.Optional[ __.cabc.Callable[ [ ], None ] ] = (
+        getattr( notifier, 'flush', None ) )
+    if flush is not None: flush( )
+
+
+def _index_members(
+    objct: _xtnsapi.Documentable, /,
+    context: _xtnsapi.Context,
+    introspection: _xtnsapi.IntrospectionControl,
+    index: _xtnsapi.DocumentablesIndex,
+    run: _DecorationRun,
+) -> None:
+    ''' Records documentable members of object in index, recursively.
+
+        Ownership of each member is determined once, here, rather than
+        repeatedly by each survey during decoration.
+    '''
+    survey: __.cabc.Iterable[ tuple[ str, _xtnsapi.Documentable, object ] ]
+    if __.inspect.isclass( objct ):
+        survey = _survey_class_attributes( objct, context, introspection )
+        pmname = objct.__module__
+        pfqname = f"{pmname}.{objct.__qualname__}"
+    elif __.inspect.ismodule( objct ):
+        survey = _survey_module_attributes( objct, context, introspection )
+        pmname = pfqname = objct.__name__
+    else: return
+    members: list[ _xtnsapi.DocumentableMember ] = [ ]
+    novices: list[ _xtnsapi.Documentable ] = [ ]
+    for aname, attribute, surface_attribute in survey:
+        # Prune subtrees which are excluded by rules.
+        if not _limit_introspection_by_rules(
+            attribute, surface_attribute,
+            introspection, pmname, f"{pfqname}.{aname}"
+        ).enable: continue
+        entry = index.access( attribute )
+        if entry is None:
+            entry = index.enter(
+                _produce_index_entry( attribute, surface_attribute, objct ) )
+            novices.append( attribute )
+        members.append( _xtnsapi.DocumentableMember(
+            name = aname, entry = entry, surface = surface_attribute ) )
+    index.enter_members( objct, members )
+    for novice in novices:
+        if _is_settled( novice, run ): continue # Will not be decorated.
+        _index_members( novice, context, introspection, index, run )
+
+
+def _is_settled( objct: object, run: _DecorationRun ) -> bool:
+    ''' Is object already decorated or excluded from decoration?
+
+        In incremental runs, visited modules are never settled, since they
+        survive reloads, and other visited objects are settled only while
+        they bear the docstrings retained for them.
+    '''
+    if objct in _exclusions: return True
+    if objct not in run.visitees: return False
+    if not run.incremental: return True
+    if __.inspect.ismodule( objct ): return False
+    retention = _retentions.get( _qualify( objct ) )
+    if retention is None: return True
+    return getattr( objct, '__doc__', None ) == retention.docstring
+
+
+def _limit_introspection_for_member( # noqa: PLR0913
+    objct: _xtnsapi.Documentable, surface: object, /,
+    context: _xtnsapi.Context,
+    introspection: _xtnsapi.IntrospectionControl,
+    pmname: str,
+    fqname: str,
+) -> _xtnsapi.IntrospectionControl:
+    ''' Limits introspection of member by rules, limit, and limiters. '''
+    instrumenter = context.instrumenter
+    start = __.time.perf_counter_ns( ) if instrumenter is not None else 0
+    introspection_ = _limit_introspection_by_rules(
+        objct, surface, introspection, pmname, fqname )
+    if introspection_.enable:
+        introspection_ = _limit_introspection(
+            objct, context, introspection_, fqname )
+        introspection_ = introspection_.evaluate_limits_for( objct )
+    if instrumenter is not None:
+        _report_stage(
+            instrumenter, _stages.Limitation, objct, start, fqname )
+    return introspection_
+
+
+def _limit_introspection_by_rules(
+    objct: _xtnsapi.Documentable, surface: object, /,
+    introspection: _xtnsapi.IntrospectionControl,
+    pmname: str,
+    fqname: str,
+) -> _xtnsapi.IntrospectionControl:
+    ''' Limits introspection based on declarative rules.
+
+        Rules are evaluated by name and kind only, without accessing any
+        attributes of the object.
+    '''
+    if not introspection.rules.rules: return introspection
+    kind = _classify_documentable( objct, surface )
+    mname = (
+        objct.__name__ if kind is _xtnsapi.IntrospectionTargets.Module
+        else pmname )
+    return introspection.evaluate_rules_for( fqname, mname, kind )
 
 
 def _limit_introspection(
@@ -398,18 +1209,51 @@ def _limit_introspection(
         specified by the object being documented. This allows objects
         to control how deeply they are introspected.
     '''
-    limit: _xtnsapi.IntrospectionLimit = (
-        getattr(
+    limit: _xtnsapi.IntrospectionLimit
+    if __.inspect.ismodule( objct ): # Avoid triggering lazy attribute loaders.
+        limit = objct.__dict__.get(
+            context.introspection_limit_name, _introspection_limit_null )
+    else:
+        limit = getattr(
             objct,
             context.introspection_limit_name,
-            _xtnsapi.IntrospectionLimit( ) ) )
+            _introspection_limit_null )
+    if limit is _introspection_limit_null: return introspection
     if not isinstance( limit, _xtnsapi.IntrospectionLimit ):
-        emessage = f"Invalid introspection limit on {fqname}: {limit!r}"
-        context.notifier( 'error', emessage )
+        context.notify(
+            'error',
+            lambda: f"Invalid introspection limit on {fqname}: {limit!r}",
+            code = 'introspection-limit-invalid', qualname = fqname )
         return introspection
     return introspection.with_limit( limit )
 
 
+def _measure_survey(
+    instrumenter: _xtnsapi.Instrumenter,
+    objct: _xtnsapi.Documentable,
+    survey: __.cabc.Iterable[ tuple[ str, _xtnsapi.Documentable, object ] ],
+) -> __.cabc.Sequence[ tuple[ str, _xtnsapi.Documentable, object ] ]:
+    ''' Completes survey of attributes, reporting its duration. '''
+    start = __.time.perf_counter_ns( )
+    members = tuple( survey )
+    _report_stage( instrumenter, _stages.Survey, objct, start )
+    return members
+
+
+def _prepare_context(
+    objct: object, context: _xtnsapi.Context
+) -> _xtnsapi.Context:
+    ''' Prepares context for decoration of object.
+
+        Instruments callbacks, if there is an instrumenter, and binds
+        invoker globals from module of object, if automatic.
+    '''
+    context = context.with_instrumented_callbacks( )
+    if not context.invoker_globals_automatic: return context
+    if context.invoker_globals is not None: return context
+    return context.with_invoker_globals_from( objct )
+
+
 def _process_fragments_argument(
     context: _xtnsapi.Context,
     fragments: _xtnsapi.Fragments,
@@ -428,18 +1272,168 @@ def _process_fragments_argument(
         elif isinstance( fragment, str ):
             if fragment not in table:
                 emessage = f"Fragment '{fragment}' not in provided table."
-                context.notifier( 'error', emessage )
+                context.notify( 'error', emessage, code = 'fragment-absent' )
                 continue
             fragment_r = table[ fragment ]
         else:
-            emessage = f"Fragment {fragment!r} is invalid. Must be Doc or str."
-            context.notifier( 'error', emessage )
+            context.notify(
+                'error',
+                lambda fragment = fragment:
+                    f"Fragment {fragment!r} is invalid. Must be Doc or str.",
+                code = 'fragment-invalid' )
             continue
         fragments_.append( context.fragment_rectifier(
             fragment_r, source = _xtnsapi.FragmentSources.Argument ) )
     return fragments_
 
 
+def _produce_index(
+    module: __.types.ModuleType, /,
+    context: _xtnsapi.Context,
+    introspection: _xtnsapi.IntrospectionControl,
+    run: _DecorationRun = _run_default,
+) -> _xtnsapi.DocumentablesIndex:
+    ''' Produces index of documentable objects within module. '''
+    index = _xtnsapi.DocumentablesIndex( targets = introspection.targets )
+    index.enter( _produce_index_entry( module, module, None ) )
+    if introspection.targets and not _is_settled( module, run ):
+        _index_members( module, context, introspection, index, run )
+    return index
+
+
+def _produce_index_entry(
+    objct: _xtnsapi.Documentable,
+    surface: object,
+    owner: __.typx.Optional[ _xtnsapi.Documentable ],
+) -> _xtnsapi.DocumentableEntry:
+    ''' Produces index entry for documentable object. '''
+    if __.inspect.ismodule( objct ):
+        return _xtnsapi.DocumentableEntry(
+            objct = objct,
+            kind = _xtnsapi.IntrospectionTargets.Module,
+            mname = objct.__name__, qname = '', qname_head = '',
+            owner = owner )
+    qname = objct.__qualname__
+    return _xtnsapi.DocumentableEntry(
+        objct = objct,
+        kind = _classify_documentable( objct, surface ),
+        mname = objct.__module__,
+        qname = qname,
+        qname_head = qname.split( '.', maxsplit = 1 )[ 0 ],
+        owner = owner )
+
+
+def _qualify( objct: object ) -> str:
+    ''' Produces fully-qualified name of object. '''
+    if __.inspect.ismodule( objct ): return objct.__name__
+    mname = getattr( objct, '__module__', None )
+    qname = getattr( objct, '__qualname__', None )
+    return f"{mname}.{qname}"
+
+
+def _reduce_template_annotation(
+    annotation: __.typx.Any,
+    context: _xtnsapi.Context,
+    cache: _xtnsapi.AnnotationsCache,
+) -> __.typx.Any:
+    ''' Reduces annotation for substitution into informations of prototype.
+
+        Returns absence sentinel for strings and forward references, which
+        may need resolution, and for annotations with extras or class
+        variable trait, which may affect descriptions, defaults,
+        associations, or visibility.
+    '''
+    if isinstance( annotation, ( str, __.typx.ForwardRef ) ):
+        return _value_absent
+    adjuncts = _xtnsapi.AdjunctsData( )
+    annotation_r = _xtnsapi.reduce_annotation(
+        annotation, context, adjuncts, cache )
+    if adjuncts.extras or 'ClassVar' in adjuncts.traits: return _value_absent
+    return annotation_r
+
+
+def _report_stage(
+    instrumenter: _xtnsapi.Instrumenter,
+    stage: _xtnsapi.InstrumentationStages,
+    objct: object,
+    start: int,
+    name: __.typx.Optional[ str ] = None,
+) -> None:
+    ''' Reports duration of stage, since start, to instrumenter. '''
+    elapsed = __.time.perf_counter_ns( ) - start
+    _counters.tallies.durations[ stage ] += elapsed
+    instrumenter( _xtnsapi.InstrumentationEvent(
+        stage = stage,
+        objct = objct,
+        name = name or _qualify( objct ),
+        elapsed = elapsed ) )
+
+
+def _substitute_template_annotations( # noqa: PLR0913
+    prototype: _TemplatePrototype,
+    possessor: type,
+    annotations: tuple[ tuple[ str, __.typx.Any ], ... ],
+    context: _xtnsapi.Context,
+    introspection: _xtnsapi.IntrospectionControl,
+    cache: _xtnsapi.AnnotationsCache,
+    table: _xtnsapi.FragmentsTable,
+) -> __.typx.Optional[ tuple[ _xtnsapi.InformationBase, ... ] ]:
+    ''' Substitutes varying annotations into informations of prototype.
+
+        Returns None if the class is not alike to the prototype or if a
+        varying annotation cannot be substituted.
+    '''
+    if not (
+            prototype.introspection is introspection
+        and prototype.table is table
+        and _are_contexts_identical( prototype.context, context )
+        and _are_sequences_identical( prototype.bases, possessor.__bases__ )
+        and prototype.names == tuple( possessor.__dict__ )
+        and len( prototype.annotations ) == len( annotations )
+    ): return None
+    substitutions: dict[ str, __.typx.Any ] = { }
+    for ( name, annotation ), ( name_, annotation_ ) in zip(
+        prototype.annotations, annotations
+    ):
+        if name != name_: return None
+        if annotation is annotation_: continue
+        reductions = tuple(
+            _reduce_template_annotation( annotation__, context, cache )
+            for annotation__ in ( annotation, annotation_ ) )
+        if _value_absent in reductions: return None
+        substitutions[ name ] = reductions[ 1 ]
+    return tuple(
+        __.dcls.replace(
+            information, annotation = substitutions[ information.name ] )
+        if (    isinstance( information, _xtnsapi.AttributeInformation )
+            and information.name in substitutions )
+        else information
+        for information in prototype.informations )
+
+
+def _survey_attributes_from_index(
+    possessor: _xtnsapi.Documentable, /,
+    context: _xtnsapi.Context,
+    introspection: _xtnsapi.IntrospectionControl,
+) -> __.typx.Optional[
+    __.cabc.Sequence[ tuple[ str, _xtnsapi.Documentable, object ] ]
+]:
+    ''' Surveys attributes of an object from index, if possible.
+
+        Returns absence if the object was not surveyed by the index or if
+        the introspection targets exceed those considered by the index.
+    '''
+    index = context.index
+    if index is None: return None
+    targets = introspection.targets
+    if targets & ~index.targets: return None
+    members = index.access_members( possessor )
+    if members is None: return None
+    return tuple(
+        ( member.name, member.entry.objct, member.surface )
+        for member in members if member.entry.kind & targets )
+
+
 def _survey_class_attributes(
     possessor: type, /,
     context: _xtnsapi.Context,
@@ -452,13 +1446,26 @@ def _survey_class_attributes(
         attribute may differ from attribute in cases like properties where the
         attribute's getter method holds the documentation.
     '''
+    members = (
+        _survey_attributes_from_index( possessor, context, introspection ) )
+    if members is not None:
+        yield from members
+        return
     pmname = possessor.__module__
     pqname = possessor.__qualname__
-    for aname, attribute in __.inspect.getmembers( possessor ):
+    tallies = _counters.tallies
+    # Only attributes defined on the class itself can be documented with it,
+    # so the class dictionary is surveyed rather than members across MRO.
+    for aname, attribute in sorted( possessor.__dict__.items( ) ):
+        if isinstance( attribute, ( classmethod, staticmethod ) ):
+            method = __.typx.cast( '_ClassMethod | _StaticMethod', attribute )
+            attribute = method.__func__ # noqa: PLW2901
+        tallies.members_examined += 1
         attribute_, update_surface = (
             _consider_class_attribute(
                 attribute, context, introspection, pmname, pqname, aname ) )
         if attribute_ is None: continue
+        tallies.members_accepted += 1
         if update_surface:
             yield aname, attribute_, attribute
             continue
@@ -476,13 +1483,24 @@ def _survey_module_attributes(
         representing documentable attributes of the module. The surface
         attribute may differ from attribute in cases where the actual
         documented object is not directly accessible.
+
+        Only attributes already present in the module dictionary are
+        surveyed; lazy attribute loaders (:pep:`562`) are never triggered.
     '''
+    members = (
+        _survey_attributes_from_index( possessor, context, introspection ) )
+    if members is not None:
+        yield from members
+        return
     pmname = possessor.__name__
-    for aname, attribute in __.inspect.getmembers( possessor ):
+    tallies = _counters.tallies
+    for aname, attribute in sorted( possessor.__dict__.items( ) ):
+        tallies.members_examined += 1
         attribute_, update_surface = (
             _consider_module_attribute(
                 attribute, context, introspection, pmname, aname ) )
         if attribute_ is None: continue
+        tallies.members_accepted += 1
         if update_surface: # pragma: no cover
             yield aname, attribute_, attribute
             continue
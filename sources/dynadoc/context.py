@@ -22,6 +22,7 @@
 
 
 from . import __
+from . import counters as _counters
 from . import interfaces as _interfaces
 from . import nomina as _nomina
 
@@ -68,13 +69,151 @@ class Context:
         __.typx.Optional[ _nomina.Variables ],
         _interfaces.Fname( 'resolver locals' ),
     ] = None
+    index: __.typx.Annotated[
+        __.typx.Optional[ 'DocumentablesIndex' ],
+        _interfaces.Fname( 'documentables index' ),
+    ] = None
+    invoker_globals_automatic: __.typx.Annotated[
+        bool,
+        _interfaces.Fname( 'invoker globals automatic' ),
+    ] = False
+    resolution_mode: __.typx.Annotated[
+        _interfaces.ResolutionModes,
+        _interfaces.Fname( 'resolution mode' ),
+    ] = _interfaces.ResolutionModes.Accept
+    instrumenter: __.typx.Annotated[
+        __.typx.Optional[ _interfaces.Instrumenter ],
+        _interfaces.Fname( 'instrumenter' ),
+    ] = None
+
+    def is_notification_enabled(
+        self, level: _interfaces.NotifierLevelArgument
+    ) -> bool:
+        ''' Would notifier emit notification at level?
+
+            Notifiers without a level query emit at all levels.
+        '''
+        query = getattr( self.notifier, 'is_level_enabled', None )
+        if query is None: return True
+        return query( level )
+
+    def notify(
+        self,
+        level: _interfaces.NotifierLevelArgument,
+        message: _interfaces.NotifierMessageLazyArgument,
+        code: _interfaces.NotifierCodeArgument = '',
+        qualname: _interfaces.NotifierQualnameArgument = None,
+    ) -> None:
+        ''' Notifies of warning or error via notifier, counting it.
+
+            Messages are formatted only if the level is enabled. Notifiers,
+            which can record structured notifications, receive the code and
+            qualified name along with the message.
+        '''
+        _counters.tallies.notifications[ level ] += 1
+        if not self.is_notification_enabled( level ): return
+        if not isinstance( message, str ): message = message( )
+        notifier = self.notifier
+        if isinstance( notifier, _InstrumentedCallback ):
+            notifier = notifier.with_attribution( None, qualname )
+        recorder = getattr( notifier, 'record_notification', None )
+        if recorder is None:
+            notifier( level, message )
+            return
+        recorder( _interfaces.Notification(
+            level = level, code = code, qualname = qualname,
+            message = message ) )
+
+    def with_index(
+        self,
+        index: __.typx.Annotated[
+            'DocumentablesIndex',
+            _interfaces.Fname( 'documentables index' ),
+        ],
+    ) -> __.typx.Self:
+        ''' Returns new context with index of documentable objects. '''
+        return type( self )(
+            notifier = self.notifier,
+            fragment_rectifier = self.fragment_rectifier,
+            visibility_decider = self.visibility_decider,
+            fragments_name = self.fragments_name,
+            introspection_limit_name = self.introspection_limit_name,
+            invoker_globals = self.invoker_globals,
+            resolver_globals = self.resolver_globals,
+            resolver_locals = self.resolver_locals,
+            index = index,
+            invoker_globals_automatic = self.invoker_globals_automatic,
+            resolution_mode = self.resolution_mode,
+            instrumenter = self.instrumenter )
+
+    def with_instrumented_callbacks( self ) -> __.typx.Self:
+        ''' Returns new context with callbacks which report durations.
+
+            Returns same context if there is no instrumenter or if the
+            callbacks are already instrumented.
+        '''
+        instrumenter = self.instrumenter
+        if instrumenter is None: return self
+        if isinstance( self.notifier, _InstrumentedCallback ): return self
+        stages = _interfaces.InstrumentationStages
+        return type( self )(
+            notifier = _InstrumentedCallback(
+                callback = self.notifier,
+                instrumenter = instrumenter,
+                stage = stages.Notification ),
+            fragment_rectifier = _InstrumentedCallback(
+                callback = self.fragment_rectifier,
+                instrumenter = instrumenter,
+                stage = stages.Rectification ),
+            visibility_decider = _InstrumentedCallback(
+                callback = self.visibility_decider,
+                instrumenter = instrumenter,
+                stage = stages.VisibilityDecision ),
+            fragments_name = self.fragments_name,
+            introspection_limit_name = self.introspection_limit_name,
+            invoker_globals = self.invoker_globals,
+            resolver_globals = self.resolver_globals,
+            resolver_locals = self.resolver_locals,
+            index = self.index,
+            invoker_globals_automatic = self.invoker_globals_automatic,
+            resolution_mode = self.resolution_mode,
+            instrumenter = instrumenter )
 
     def with_invoker_globals(
         self,
         level: _interfaces.GlobalsLevelArgument = 2
     ) -> __.typx.Self:
-        ''' Returns new context with invoker globals from stack frame. '''
-        iglobals = __.inspect.stack( )[ level ].frame.f_globals
+        ''' Returns new context with invoker globals from stack frame.
+
+            Only the requested frame is accessed; no frame records or source
+            lines are produced for the rest of the stack.
+        '''
+        iglobals = _access_frame_globals( level )
+        return self._with_invoker_globals( iglobals )
+
+    def with_invoker_globals_from(
+        self,
+        objct: __.typx.Annotated[
+            object,
+            _interfaces.Doc(
+                ''' Module or object defined within module. ''' ),
+        ],
+    ) -> __.typx.Self:
+        ''' Returns new context with invoker globals from module of object.
+
+            Returns same context if module cannot be determined.
+        '''
+        if __.inspect.ismodule( objct ): module = objct
+        else:
+            mname = getattr( objct, '__module__', None )
+            if not isinstance( mname, str ): return self
+            module = __.sys.modules.get( mname )
+            if module is None: return self
+        return self._with_invoker_globals( module.__dict__ )
+
+    def _with_invoker_globals(
+        self, iglobals: _nomina.Variables
+    ) -> __.typx.Self:
         return type( self )(
             notifier = self.notifier,
             fragment_rectifier = self.fragment_rectifier,
@@ -83,7 +222,83 @@ class Context:
             introspection_limit_name = self.introspection_limit_name,
             invoker_globals = iglobals,
             resolver_globals = self.resolver_globals,
-            resolver_locals = self.resolver_locals )
+            resolver_locals = self.resolver_locals,
+            index = self.index,
+            invoker_globals_automatic = self.invoker_globals_automatic,
+            resolution_mode = self.resolution_mode,
+            instrumenter = self.instrumenter )
+
+
+@__.dcls.dataclass( frozen = True, kw_only = True, slots = True )
+class _InstrumentedCallback:
+    ''' Callback which reports its durations to instrumenter.
+
+        Visibility decisions are attributed to the possessors, which are
+        passed to the decider. Other callbacks are attributed to the object
+        and name, if any, which are bound to them.
+    '''
+
+    callback: __.cabc.Callable[ ..., __.typx.Any ]
+    instrumenter: _interfaces.Instrumenter
+    stage: _interfaces.InstrumentationStages
+    objct: __.typx.Any = None
+    name: __.typx.Optional[ str ] = None
+
+    def __getattr__( self, name: str ) -> __.typx.Any:
+        # Methods of callback, such as for recording of notifications, are
+        # instrumented too. Fields are excluded to avoid infinite recursion.
+        if name in _instrumented_callback_fields:
+            raise AttributeError( name )
+        attribute = getattr( self.callback, name )
+        if not callable( attribute ): return attribute
+        return __.dcls.replace( self, callback = attribute )
+
+    def __call__(
+        self, *posargs: __.typx.Any, **nomargs: __.typx.Any
+    ) -> __.typx.Any:
+        start = __.time.perf_counter_ns( )
+        try: return self.callback( *posargs, **nomargs )
+        finally:
+            elapsed = __.time.perf_counter_ns( ) - start
+            _counters.tallies.durations[ self.stage ] += elapsed
+            objct, name = self.objct, self.name
+            if (    self.stage is _visibility_decision_stage
+                and posargs and objct is None
+            ):
+                objct = posargs[ 0 ]
+                name = __.qualify_object( objct )
+            self.instrumenter( _interfaces.InstrumentationEvent(
+                stage = self.stage, objct = objct, name = name,
+                elapsed = elapsed ) )
+
+    def with_attribution(
+        self, objct: __.typx.Any, name: __.typx.Optional[ str ]
+    ) -> __.typx.Self:
+        ''' Returns callback, which attributes durations to object. '''
+        return __.dcls.replace( self, objct = objct, name = name )
+
+
+_instrumented_callback_fields = frozenset(
+    field.name for field in __.dcls.fields( _InstrumentedCallback ) )
+_visibility_decision_stage = (
+    _interfaces.InstrumentationStages.VisibilityDecision )
+
+
+def _access_frame_globals( level: int ) -> _nomina.Variables:
+    ''' Accesses globals of stack frame at level above caller.
+
+        Level 0 is the frame of the caller of this function.
+    '''
+    try: return __.sys._getframe( level + 1 ).f_globals # noqa: SLF001
+    except AttributeError: pass # Python implementation without '_getframe'.
+    except ValueError: raise IndexError( level ) from None
+    frame = __.inspect.currentframe( )
+    for _ in range( level + 1 ):
+        if frame is None: break
+        frame = frame.f_back
+    # Same exception as from indexing of stack, which was used formerly.
+    if frame is None: raise IndexError( level )
+    return frame.f_globals
 
 
 ContextArgument: __.typx.TypeAlias = __.typx.Annotated[
@@ -152,6 +367,9 @@ class ClassIntrospectionControl:
         ''' Returns new control with applied limits. '''
         inheritance = self.inheritance and not limit.avoid_inheritance
         scan_attributes = self.scan_attributes and not limit.ignore_attributes
+        if (    inheritance == self.inheritance
+            and scan_attributes == self.scan_attributes
+        ): return self
         return type( self )(
             inheritance = inheritance,
             introspectors = self.introspectors,
@@ -173,6 +391,17 @@ class ModuleIntrospectionLimit:
 class ModuleIntrospectionControl:
     ''' Controls on module introspection behavior. '''
 
+    lazy_attributes: __.typx.Annotated[
+        bool,
+        _interfaces.Doc(
+            ''' Document lazily-loaded attributes without loading them?
+
+                Lazily-loaded attributes are names in the ``__all__`` of a
+                module, which are not yet present in its dictionary. Such
+                attributes are usually provided by a module-level
+                ``__getattr__`` function (:pep:`562`).
+            ''' ),
+    ] = False
     scan_attributes: __.typx.Annotated[
         bool,
         _interfaces.Doc( ''' Scan attributes not covered by annotations? ''' ),
@@ -187,8 +416,14 @@ class ModuleIntrospectionControl:
         ]
     ) -> __.typx.Self:
         ''' Returns new control with applied limits. '''
+        lazy_attributes = self.lazy_attributes and not limit.ignore_attributes
         scan_attributes = self.scan_attributes and not limit.ignore_attributes
-        return type( self )( scan_attributes = scan_attributes )
+        if (    lazy_attributes == self.lazy_attributes
+            and scan_attributes == self.scan_attributes
+        ): return self
+        return type( self )(
+            lazy_attributes = lazy_attributes,
+            scan_attributes = scan_attributes )
 
 
 class IntrospectionLimiter( __.typx.Protocol ):
@@ -236,6 +471,163 @@ IntrospectionTargetsOmni: __.typx.Annotated[
 ] = IntrospectionTargetsSansModule | IntrospectionTargets.Module
 
 
+@__.dcls.dataclass( frozen = True, kw_only = True, slots = True )
+class DocumentableEntry:
+    ''' Information about documentable object in index. '''
+
+    objct: __.typx.Annotated[
+        _nomina.Documentable,
+        _interfaces.Doc( ''' Indexed object. ''' ),
+    ]
+    kind: __.typx.Annotated[
+        IntrospectionTargets,
+        _interfaces.Doc( ''' Kind of indexed object. ''' ),
+    ]
+    mname: __.typx.Annotated[
+        str,
+        _interfaces.Doc( ''' Name of module to which object belongs. ''' ),
+    ]
+    qname: __.typx.Annotated[
+        str,
+        _interfaces.Doc(
+            ''' Qualified name of object within its module.
+
+                Empty for modules.
+            ''' ),
+    ]
+    qname_head: __.typx.Annotated[
+        str,
+        _interfaces.Doc(
+            ''' First component of qualified name.
+
+                Used to determine whether name is qualified by globals.
+            ''' ),
+    ]
+    owner: __.typx.Annotated[
+        __.typx.Optional[ _nomina.Documentable ],
+        _interfaces.Doc(
+            ''' Object which owns the indexed object.
+
+                Absent for root of index.
+            ''' ),
+    ] = None
+
+    @property
+    def fqname( self ) -> str:
+        ''' Fully-qualified name of object. '''
+        if not self.qname: return self.mname
+        return f"{self.mname}.{self.qname}"
+
+
+@__.dcls.dataclass( frozen = True, kw_only = True, slots = True )
+class DocumentableMember:
+    ''' Documentable attribute of indexed object. '''
+
+    name: __.typx.Annotated[
+        str, _interfaces.Doc( ''' Name of attribute on its owner. ''' ) ]
+    entry: __.typx.Annotated[
+        DocumentableEntry,
+        _interfaces.Doc( ''' Index entry of documentable object. ''' ),
+    ]
+    surface: __.typx.Annotated[
+        object,
+        _interfaces.Doc(
+            ''' Attribute as it appears on its owner.
+
+                May differ from documentable object, such as for properties,
+                where the getter method holds the documentation.
+            ''' ),
+    ]
+
+
+@__.dcls.dataclass( frozen = True, kw_only = True, slots = True )
+class DocumentablesIndex:
+    ''' Index of documentable objects, usually within a package.
+
+        Maps objects to their qualified names, kinds, and owners, and owners
+        to their documentable members. Built once per decoration run and
+        shared by surveyors and renderers.
+    '''
+
+    targets: __.typx.Annotated[
+        IntrospectionTargets,
+        _interfaces.Doc( ''' Kinds of objects considered by index. ''' ),
+    ] = IntrospectionTargets.Null
+    entries: __.typx.Annotated[
+        dict[ int, DocumentableEntry ],
+        _interfaces.Doc( ''' Entries by identity of indexed object. ''' ),
+    ] = __.dcls.field( default_factory = dict[ int, DocumentableEntry ] )
+    members: __.typx.Annotated[
+        dict[ int, tuple[ DocumentableMember, ... ] ],
+        _interfaces.Doc( ''' Members by identity of owning object. ''' ),
+    ] = __.dcls.field(
+        default_factory = dict[ int, tuple[ DocumentableMember, ... ] ] )
+    names: __.typx.Annotated[
+        dict[ str, DocumentableEntry ],
+        _interfaces.Doc( ''' Entries by fully-qualified name. ''' ),
+    ] = __.dcls.field( default_factory = dict[ str, DocumentableEntry ] )
+
+    def __iter__( self ) -> __.cabc.Iterator[ DocumentableEntry ]:
+        return iter( self.entries.values( ) )
+
+    def __len__( self ) -> int:
+        return len( self.entries )
+
+    def access(
+        self,
+        objct: __.typx.Annotated[
+            object, _interfaces.Doc( ''' Object to look up in index. ''' )
+        ],
+    ) -> __.typx.Optional[ DocumentableEntry ]:
+        ''' Accesses entry for object, if it is indexed. '''
+        return self.entries.get( id( objct ) )
+
+    def access_members(
+        self,
+        owner: __.typx.Annotated[
+            object,
+            _interfaces.Doc( ''' Object for which to look up members. ''' ),
+        ],
+    ) -> __.typx.Optional[ __.cabc.Sequence[ DocumentableMember ] ]:
+        ''' Accesses documentable members of object, if surveyed. '''
+        return self.members.get( id( owner ) )
+
+    def enter(
+        self,
+        entry: __.typx.Annotated[
+            DocumentableEntry,
+            _interfaces.Doc( ''' Entry to add to index. ''' ),
+        ],
+    ) -> DocumentableEntry:
+        ''' Adds entry to index, returning it. '''
+        self.entries[ id( entry.objct ) ] = entry
+        self.names.setdefault( entry.fqname, entry )
+        return entry
+
+    def enter_members(
+        self,
+        owner: __.typx.Annotated[
+            object, _interfaces.Doc( ''' Object which owns members. ''' )
+        ],
+        members: __.typx.Annotated[
+            __.cabc.Sequence[ DocumentableMember ],
+            _interfaces.Doc( ''' Documentable members of object. ''' ),
+        ],
+    ) -> None:
+        ''' Records documentable members of object. '''
+        self.members[ id( owner ) ] = tuple( members )
+
+    def query(
+        self,
+        fqname: __.typx.Annotated[
+            str,
+            _interfaces.Doc( ''' Fully-qualified name of object. ''' ),
+        ],
+    ) -> __.typx.Optional[ DocumentableEntry ]:
+        ''' Queries entry by fully-qualified name of object. '''
+        return self.names.get( fqname )
+
+
 @__.dcls.dataclass( frozen = True, kw_only = True, slots = True )
 class IntrospectionLimit:
     ''' Limits on introspection behavior. '''
@@ -257,6 +649,123 @@ class IntrospectionLimit:
     ] = IntrospectionTargets.Null
 
 
+@__.dcls.dataclass( frozen = True, kw_only = True, slots = True )
+class IntrospectionRule:
+    ''' Declarative rule which limits introspection of matching objects.
+
+        Patterns are shell-style globs, where ``*`` may also match across
+        dots. E.g., ``*._internal`` matches every ``_internal`` module or
+        attribute and ``mypackage.generated.*`` matches everything within
+        ``mypackage.generated``. Since objects with disabled introspection
+        are not recursed into, matching an object prunes its whole subtree.
+    '''
+
+    name: __.typx.Annotated[
+        str,
+        _interfaces.Doc(
+            ''' Pattern for fully-qualified name of object. ''' ),
+    ] = '*'
+    module: __.typx.Annotated[
+        str,
+        _interfaces.Doc( ''' Pattern for name of module of object. ''' ),
+    ] = '*'
+    kinds: __.typx.Annotated[
+        IntrospectionTargets,
+        _interfaces.Doc( ''' Kinds of objects to which rule applies. ''' ),
+    ] = IntrospectionTargetsOmni
+    limit: __.typx.Annotated[
+        IntrospectionLimit,
+        _interfaces.Doc(
+            ''' Limit to apply to matching objects.
+
+                Default is to disable introspection, which excludes matching
+                objects from documentation.
+            ''' ),
+    ] = IntrospectionLimit( disable = True )
+
+
+@__.dcls.dataclass( kw_only = True, slots = True )
+class _IntrospectionRulesNode:
+    ''' Node in prefix trie of introspection rules. '''
+
+    children: dict[ str, '_IntrospectionRulesNode' ] = __.dcls.field(
+        default_factory = dict[ str, '_IntrospectionRulesNode' ] )
+    rules: list[ tuple[ int, IntrospectionRule, __.re.Pattern[ str ] ] ] = (
+        __.dcls.field( default_factory = list[
+            tuple[ int, IntrospectionRule, __.re.Pattern[ str ] ] ] ) )
+
+
+_glob_metacharacters = frozenset( '*?[' )
+
+
+@__.dcls.dataclass( frozen = True, kw_only = True, slots = True )
+class IntrospectionRules:
+    ''' Introspection rules, compiled into prefix trie.
+
+        Literal leading components of each name pattern determine its
+        position in the trie. Evaluation of a name only considers rules along
+        its path through the trie, so that unrelated rules cost nothing.
+    '''
+
+    rules: __.typx.Annotated[
+        __.cabc.Sequence[ IntrospectionRule ],
+        _interfaces.Doc( ''' Rules, in order of application. ''' ),
+    ] = ( )
+    trie: __.typx.Annotated[
+        _IntrospectionRulesNode,
+        _interfaces.Doc( ''' Compiled prefix trie of rules. ''' ),
+        _interfaces.Visibilities.Conceal,
+    ] = __.dcls.field( init = False, repr = False, compare = False )
+
+    def __post_init__( self ) -> None:
+        root = _IntrospectionRulesNode( )
+        for order, rule in enumerate( self.rules ):
+            node = root
+            for component in rule.name.split( '.' ):
+                if _glob_metacharacters.intersection( component ): break
+                node = node.children.setdefault(
+                    component, _IntrospectionRulesNode( ) )
+            regex = __.re.compile( __.fnmatch.translate( rule.name ) )
+            node.rules.append( ( order, rule, regex ) )
+        object.__setattr__( self, 'trie', root )
+
+    def evaluate(
+        self,
+        fqname: __.typx.Annotated[
+            str,
+            _interfaces.Doc( ''' Fully-qualified name of object. ''' ),
+        ],
+        mname: __.typx.Annotated[
+            str,
+            _interfaces.Doc( ''' Name of module of object. ''' ),
+        ],
+        kind: __.typx.Annotated[
+            IntrospectionTargets,
+            _interfaces.Doc( ''' Kind of object. ''' ),
+        ],
+    ) -> __.cabc.Sequence[ IntrospectionLimit ]:
+        ''' Returns limits from rules which match object, in order. '''
+        if not self.rules: return ( )
+        node = self.trie
+        candidates = list( node.rules )
+        for component in fqname.split( '.' ):
+            node_ = node.children.get( component )
+            if node_ is None: break
+            node = node_
+            candidates.extend( node.rules )
+        if not candidates: return ( )
+        candidates.sort( key = lambda candidate: candidate[ 0 ] )
+        return tuple(
+            rule.limit for _, rule, regex in candidates
+            if  rule.kinds & kind
+            and regex.match( fqname )
+            and (   rule.module == '*'
+                or  __.fnmatch.fnmatchcase( mname, rule.module ) ) )
+
+
+_derivations_maximum = 64
+
+
 @__.dcls.dataclass( frozen = True, kw_only = True, slots = True )
 class IntrospectionControl:
 
@@ -279,6 +788,15 @@ class IntrospectionControl:
         _interfaces.Doc(
             ''' Functions that can apply limits to introspection. ''' ),
     ] = ( )
+    rules: __.typx.Annotated[
+        IntrospectionRules,
+        _interfaces.Doc(
+            ''' Declarative rules that can apply limits to introspection.
+
+                Evaluated by name and kind of object, before any other
+                limits, and without accessing attributes of the object.
+            ''' ),
+    ] = IntrospectionRules( )
     targets: __.typx.Annotated[
         IntrospectionTargets,
         _interfaces.Doc(
@@ -286,6 +804,11 @@ class IntrospectionControl:
     ] = IntrospectionTargets.Null
     # TODO? Maximum depth.
     #       (Suggested by multiple LLMs; not convinced that it is needed.)
+    # Interned derivations by identities of limits. Not part of identity.
+    _derivations: dict[ int, tuple[ __.typx.Any, __.typx.Any ] ] = (
+        __.dcls.field(
+            default_factory = dict[ int, tuple[ __.typx.Any, __.typx.Any ] ],
+            init = False, repr = False, compare = False ) )
 
     def evaluate_limits_for(
         self,
@@ -300,6 +823,27 @@ class IntrospectionControl:
             introspection_ = limiter( objct, introspection_ )
         return introspection_
 
+    def evaluate_rules_for(
+        self,
+        fqname: __.typx.Annotated[
+            str,
+            _interfaces.Doc( ''' Fully-qualified name of object. ''' ),
+        ],
+        mname: __.typx.Annotated[
+            str,
+            _interfaces.Doc( ''' Name of module of object. ''' ),
+        ],
+        kind: __.typx.Annotated[
+            IntrospectionTargets,
+            _interfaces.Doc( ''' Kind of object. ''' ),
+        ],
+    ) -> 'IntrospectionControl':
+        ''' Determine which introspection rules apply to object. '''
+        introspection_ = self
+        for limit in self.rules.evaluate( fqname, mname, kind ):
+            introspection_ = introspection_.with_limit( limit )
+        return introspection_
+
     def with_limit(
         self,
         limit: __.typx.Annotated[
@@ -308,17 +852,37 @@ class IntrospectionControl:
                 ''' Limits to apply to this introspection control. ''' ),
         ]
     ) -> __.typx.Self:
-        ''' Returns new control with applied limits. '''
+        ''' Returns new control with applied limits.
+
+            Derived controls are interned on the control by identities of
+            limits, so that repeated derivations do not allocate. If the
+            limit does not change anything, then the control itself is
+            returned.
+        '''
+        derivations = self._derivations
+        derivation = derivations.get( id( limit ) )
+        if derivation is not None: return derivation[ 1 ]
         enable = self.enable and not limit.disable
         class_control = self.class_control.with_limit( limit.class_limit )
         module_control = self.module_control.with_limit( limit.module_limit )
         targets = self.targets & ~limit.targets_exclusions
-        return type( self )(
-            enable = enable,
-            class_control = class_control,
-            module_control = module_control,
-            limiters = self.limiters,
-            targets = targets )
+        if (    enable == self.enable
+            and class_control is self.class_control
+            and module_control is self.module_control
+            and targets == self.targets
+        ): introspection = self
+        else:
+            introspection = type( self )(
+                enable = enable,
+                class_control = class_control,
+                module_control = module_control,
+                limiters = self.limiters,
+                rules = self.rules,
+                targets = targets )
+        if len( derivations ) >= _derivations_maximum: derivations.clear( )
+        # Retain limit so that its identity remains valid.
+        derivations[ id( limit ) ] = ( limit, introspection )
+        return introspection
 
 
 IntrospectionArgument: __.typx.TypeAlias = __.typx.Annotated[
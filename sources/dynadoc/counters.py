@@ -0,0 +1,143 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Cumulative statistics for docstring assembly within process. '''
+
+
+from . import __
+from . import interfaces as _interfaces
+
+
+@__.dcls.dataclass( kw_only = True, slots = True )
+class _Tallies:
+    ''' Mutable counters, which are updated during docstring assembly. '''
+
+    decorations: __.collections.Counter[ str ] = (
+        __.dcls.field( default_factory = __.collections.Counter[ str ] ) )
+    reductions: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    members_examined: int = 0
+    members_accepted: int = 0
+    renditions: int = 0
+    docstrings_size: int = 0
+    notifications: __.collections.Counter[ str ] = (
+        __.dcls.field( default_factory = __.collections.Counter[ str ] ) )
+    durations: __.collections.Counter[ _interfaces.InstrumentationStages ] = (
+        __.dcls.field( default_factory = (
+            __.collections.Counter[ _interfaces.InstrumentationStages ] ) ) )
+    duration: int = 0
+
+
+@__.dcls.dataclass( frozen = True, kw_only = True, slots = True )
+class Statistics:
+    ''' Snapshot of cumulative statistics for docstring assembly. '''
+
+    decorations: __.typx.Annotated[
+        __.cabc.Mapping[ str, int ],
+        _interfaces.Doc(
+            ''' Numbers of objects decorated by kind.
+
+                Kinds are names of introspection targets.
+            ''' ),
+    ]
+    reductions: __.typx.Annotated[
+        int, _interfaces.Doc( ''' Number of annotations reduced. ''' ) ]
+    cache_hits: __.typx.Annotated[
+        int,
+        _interfaces.Doc(
+            ''' Number of reductions, including nested ones, from cache.
+            ''' ),
+    ]
+    cache_misses: __.typx.Annotated[
+        int,
+        _interfaces.Doc(
+            ''' Number of reductions, including nested ones, not from cache.
+            ''' ),
+    ]
+    members_examined: __.typx.Annotated[
+        int,
+        _interfaces.Doc( ''' Number of attributes examined by surveys. ''' ),
+    ]
+    members_accepted: __.typx.Annotated[
+        int,
+        _interfaces.Doc(
+            ''' Number of attributes accepted as documentable by surveys.
+            ''' ),
+    ]
+    renditions: __.typx.Annotated[
+        int, _interfaces.Doc( ''' Number of calls to renderers. ''' ) ]
+    docstrings_size: __.typx.Annotated[
+        int,
+        _interfaces.Doc(
+            ''' Number of bytes in assembled docstrings, as UTF-8. ''' ),
+    ]
+    notifications: __.typx.Annotated[
+        __.cabc.Mapping[ str, int ],
+        _interfaces.Doc( ''' Numbers of notifications by level. ''' ),
+    ]
+    durations: __.typx.Annotated[
+        __.cabc.Mapping[ _interfaces.InstrumentationStages, int ],
+        _interfaces.Doc(
+            ''' Nanoseconds spent in stages of docstring assembly.
+
+                Only stages instrumented while a context had an instrumenter
+                are recorded. Stages may nest.
+            ''' ),
+    ]
+    duration: __.typx.Annotated[
+        int,
+        _interfaces.Doc(
+            ''' Nanoseconds spent in decorators and assignment functions.
+            ''' ),
+    ]
+
+
+# Updated in place, so that references from other modules remain valid.
+tallies = _Tallies( )
+
+
+def access_statistics( ) -> Statistics:
+    ''' Returns snapshot of cumulative statistics for docstring assembly.
+
+        Statistics are accumulated across all threads of the process and
+        are approximate under concurrent docstring assembly.
+    '''
+    return Statistics(
+        decorations = __.types.MappingProxyType(
+            dict( tallies.decorations ) ),
+        reductions = tallies.reductions,
+        cache_hits = tallies.cache_hits,
+        cache_misses = tallies.cache_misses,
+        members_examined = tallies.members_examined,
+        members_accepted = tallies.members_accepted,
+        renditions = tallies.renditions,
+        docstrings_size = tallies.docstrings_size,
+        notifications = __.types.MappingProxyType(
+            dict( tallies.notifications ) ),
+        durations = __.types.MappingProxyType( dict( tallies.durations ) ),
+        duration = tallies.duration )
+
+
+def reset_statistics( ) -> None:
+    ''' Resets cumulative statistics for docstring assembly. '''
+    tallies_ = _Tallies( )
+    for field in __.dcls.fields( tallies ):
+        setattr( tallies, field.name, getattr( tallies_, field.name ) )
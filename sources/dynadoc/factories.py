@@ -26,6 +26,18 @@ from . import __
 from . import xtnsapi as _xtnsapi
 
 
+_notification_levels_all: frozenset[ _xtnsapi.NotificationLevels ] = (
+    frozenset( ( 'admonition', 'error' ) ) )
+# Keyed by identity, since notifiers are mutable and unhashable.
+_notifiers_flushable: __.weakref.WeakValueDictionary[
+    int, 'BufferedNotifier'
+] = __.weakref.WeakValueDictionary( )
+
+
+# Numbers of occurrences per qualified name, if any.
+_NotificationsTallies: __.typx.TypeAlias = dict[ __.typx.Optional[ str ], int ]
+
+
 # _package_location = __.Path( __file__ ).parent
 def notify( level: _xtnsapi.NotificationLevels, message: str ) -> None:
     # TODO: Python 3.12: Use 'skip_file_prefixes' option.
@@ -34,6 +46,149 @@ def notify( level: _xtnsapi.NotificationLevels, message: str ) -> None:
         # skip_file_prefixes = ( str( _package_location ), ) )
 
 
+class _WeaklyReferenceable:
+    ''' Base which permits weak references to slotted dataclasses. '''
+
+    __slots__ = ( '__weakref__', )
+
+
+@__.dcls.dataclass( kw_only = True, slots = True )
+class BufferedNotifier( _WeaklyReferenceable ):
+    ''' Notifier which buffers and deduplicates notifications.
+
+        Notifications with identical levels, codes, and messages are
+        counted per qualified name rather than emitted again. The buffered
+        notifications are summarized in one message, which is passed to
+        the emitter, when the buffer is flushed: at the end of each run of
+        module decoration, if requested, and at exit, if still alive.
+    '''
+
+    emitter: __.typx.Annotated[
+        _xtnsapi.Notifier,
+        _xtnsapi.Doc( ''' Notifier which receives summaries. ''' ),
+    ] = notify
+    flush_after_runs: __.typx.Annotated[
+        bool,
+        _xtnsapi.Doc(
+            ''' Flush after each run of module decoration?
+
+                Otherwise, notifications accumulate across runs and are
+                summarized only at exit or by explicit flush.
+            ''' ),
+    ] = True
+    flush_at_exit: __.typx.Annotated[
+        bool,
+        _xtnsapi.Doc( ''' Flush when interpreter exits? ''' ),
+    ] = True
+    levels: __.typx.Annotated[
+        frozenset[ _xtnsapi.NotificationLevels ],
+        _xtnsapi.Doc(
+            ''' Levels at which notifications are buffered.
+
+                Notifications at other levels are discarded unformatted.
+            ''' ),
+    ] = _notification_levels_all
+    notifications: __.typx.Annotated[
+        dict[ _xtnsapi.Notification, _NotificationsTallies ],
+        _xtnsapi.Doc(
+            ''' Buffered notifications, without qualified names, with
+                numbers of occurrences per qualified name.
+            ''' ),
+    ] = __.dcls.field(
+        default_factory = dict[
+            _xtnsapi.Notification, _NotificationsTallies ] )
+
+    def __post_init__( self ) -> None:
+        if self.flush_at_exit: _notifiers_flushable[ id( self ) ] = self
+
+    def __call__(
+        self,
+        level: _xtnsapi.NotifierLevelArgument,
+        message: _xtnsapi.NotifierMessageArgument,
+    ) -> None:
+        self.record_notification(
+            _xtnsapi.Notification( level = level, message = message ) )
+
+    def flush( self ) -> None:
+        ''' Emits summary of buffered notifications and clears buffer. '''
+        if not self.notifications: return
+        notifications = tuple( self.notifications.items( ) )
+        self.notifications.clear( )
+        total = sum(
+            sum( tallies.values( ) ) for _, tallies in notifications )
+        lines = [
+            f"Summary of {total} notifications "
+            f"({len( notifications )} distinct):" ]
+        for notification, tallies in notifications:
+            lines.extend( _summarize_notification( notification, tallies ) )
+        level: _xtnsapi.NotificationLevels = (
+            'error' if any(
+                notification.level == 'error'
+                for notification, _ in notifications )
+            else 'admonition' )
+        self.emitter( level, '\n'.join( lines ) )
+
+    def is_level_enabled(
+        self, level: _xtnsapi.NotifierLevelArgument
+    ) -> bool:
+        ''' Are notifications at level buffered? '''
+        return level in self.levels
+
+    def record_notification(
+        self, notification: _xtnsapi.Notification
+    ) -> None:
+        ''' Buffers notification, counting its occurrences per name. '''
+        if notification.level not in self.levels: return
+        qualname = notification.qualname
+        if qualname is not None:
+            notification = __.dcls.replace( notification, qualname = None )
+        tallies = self.notifications.setdefault( notification, { } )
+        tallies[ qualname ] = tallies.get( qualname, 0 ) + 1
+
+
+@__.dcls.dataclass( frozen = True, kw_only = True, slots = True )
+class FilteredNotifier:
+    ''' Notifier which passes notifications at enabled levels to another.
+
+        Notifications at other levels are discarded without their messages
+        being formatted.
+    '''
+
+    notifier: __.typx.Annotated[
+        _xtnsapi.Notifier,
+        _xtnsapi.Doc( ''' Notifier which receives enabled notifications. ''' ),
+    ] = notify
+    levels: __.typx.Annotated[
+        frozenset[ _xtnsapi.NotificationLevels ],
+        _xtnsapi.Doc( ''' Levels at which notifications are passed. ''' ),
+    ] = frozenset( ( 'error', ) )
+
+    def __call__(
+        self,
+        level: _xtnsapi.NotifierLevelArgument,
+        message: _xtnsapi.NotifierMessageArgument,
+    ) -> None:
+        if level in self.levels: self.notifier( level, message )
+
+    def is_level_enabled(
+        self, level: _xtnsapi.NotifierLevelArgument
+    ) -> bool:
+        ''' Are notifications at level passed and enabled downstream? '''
+        if level not in self.levels: return False
+        query = getattr( self.notifier, 'is_level_enabled', None )
+        return query is None or query( level )
+
+    def record_notification(
+        self, notification: _xtnsapi.Notification
+    ) -> None:
+        ''' Passes structured notification, if its level is enabled. '''
+        if notification.level not in self.levels: return
+        recorder = getattr( self.notifier, 'record_notification', None )
+        if recorder is None:
+            self.notifier( notification.level, notification.message )
+        else: recorder( notification )
+
+
 def rectify_fragment(
     fragment: str, source: _xtnsapi.FragmentSources
 ) -> str:
@@ -56,6 +211,11 @@ def produce_context( # noqa: PLR0913
         _xtnsapi.fragments_name_default ),
     introspection_limit_name: _xtnsapi.IntrospectionLimitNameArgument = (
         _xtnsapi.introspection_limit_name_default ),
+    invoker_globals_automatic: _xtnsapi.InvokerGlobalsAutomaticArgument = (
+        False ),
+    resolution_mode: _xtnsapi.ResolutionModeArgument = (
+        _xtnsapi.ResolutionModes.Accept ),
+    instrumenter: _xtnsapi.InstrumenterArgument = None,
 ) -> _xtnsapi.Context:
     ''' Produces context data transfer object.
 
@@ -67,4 +227,39 @@ def produce_context( # noqa: PLR0913
         visibility_decider = visibility_decider,
         invoker_globals = invoker_globals,
         resolver_globals = resolver_globals,
-        resolver_locals = resolver_locals )
+        resolver_locals = resolver_locals,
+        invoker_globals_automatic = invoker_globals_automatic,
+        resolution_mode = resolution_mode,
+        instrumenter = instrumenter )
+
+
+def _flush_notifiers( ) -> None:
+    ''' Flushes buffered notifiers, which are still alive, at exit. '''
+    for notifier in tuple( _notifiers_flushable.values( ) ):
+        notifier.flush( )
+
+
+def _summarize_notification(
+    notification: _xtnsapi.Notification, tallies: _NotificationsTallies
+) -> list[ str ]:
+    ''' Summarizes buffered notification with its occurrences per name.
+
+        A notification from only one object is summarized on one line.
+        Otherwise, each qualified name is listed on its own line.
+    '''
+    label = notification.level
+    if notification.code: label = f"{label} [{notification.code}]"
+    count = sum( tallies.values( ) )
+    suffix = f" (x{count})" if count > 1 else ''
+    if len( tallies ) == 1:
+        qualname = next( iter( tallies ) )
+        if qualname: label = f"{label} {qualname}"
+        return [ f"  {label}: {notification.message}{suffix}" ]
+    lines = [ f"  {label}: {notification.message}{suffix}" ]
+    for qualname, count_ in tallies.items( ):
+        suffix_ = f" (x{count_})" if count_ > 1 else ''
+        lines.append( f"    in {qualname or '(unknown)'}{suffix_}" )
+    return lines
+
+
+__.atexit.register( _flush_notifiers )
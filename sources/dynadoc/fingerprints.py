@@ -0,0 +1,128 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Fingerprints of inputs to docstring assembly. '''
+
+
+from . import __
+from . import xtnsapi as _xtnsapi
+
+
+_address_regex = __.re.compile( r' at 0x[0-9a-fA-F]+' )
+_digest_size = 20
+
+
+def describe_value( value: object ) -> str:
+    ''' Describes value canonically, independently of object identities.
+
+        Classes, functions, and modules are described by their qualified
+        names. Containers, dataclass instances, and typing constructs are
+        described recursively. Other objects are described by representation
+        with memory addresses removed.
+    '''
+    return _describe_value( value, set( ) )
+
+
+def produce_digest( descriptions: __.cabc.Iterable[ str ] ) -> str:
+    ''' Produces hexadecimal digest of descriptions.
+
+        Digest is independent of process and hash seed.
+    '''
+    hasher = __.hashlib.blake2b( digest_size = _digest_size )
+    for description in descriptions:
+        encoded = description.encode( 'utf-8', 'surrogatepass' )
+        # Prefix lengths, so that boundaries between descriptions matter.
+        hasher.update( len( encoded ).to_bytes( 8, 'little' ) )
+        hasher.update( encoded )
+    return hasher.hexdigest( )
+
+
+def _describe_callable( value: object ) -> str:
+    ''' Describes class or routine by its qualified name. '''
+    mname = getattr( value, '__module__', None ) or ''
+    qname = (
+        getattr( value, '__qualname__', None )
+        or getattr( value, '__name__', None ) or type( value ).__qualname__ )
+    return f"{mname}.{qname}"
+
+
+def _describe_value(
+    value: object, seen: set[ int ]
+) -> str:
+    ''' Describes value, guarding against cycles through containers. '''
+    if isinstance( value, __.enum.Enum ):
+        return f"{_describe_callable( type( value ) )}.{value.name}"
+    if value is None or isinstance( value, ( bool, int, float, str, bytes ) ):
+        return repr( value )
+    if isinstance( value, __.types.ModuleType ):
+        return f"<module {value.__name__}>"
+    if isinstance( value, _xtnsapi.Doc ):
+        return f"Doc({value.documentation!r})"
+    if id( value ) in seen: return '<cycle>'
+    seen.add( id( value ) )
+    try: return _describe_composite( value, seen )
+    finally: seen.discard( id( value ) )
+
+
+def _describe_composite( # noqa: PLR0911
+    value: object, seen: set[ int ]
+) -> str:
+    ''' Describes typing construct, routine, or composite object. '''
+    origin = __.typx.get_origin( value )
+    if origin is not None:
+        arguments = ', '.join(
+            _describe_value( argument, seen )
+            for argument in __.typx.get_args( value ) )
+        return f"{_describe_value( origin, seen )}[{arguments}]"
+    if __.inspect.isclass( value ) or __.inspect.isroutine( value ):
+        return _describe_callable( value )
+    if isinstance( value, __.funct.partial ):
+        return "partial({})".format( ', '.join( (
+            _describe_value( value.func, seen ),
+            _describe_value( value.args, seen ),
+            _describe_value( value.keywords, seen ) ) ) )
+    if __.dcls.is_dataclass( value ):
+        fields = ', '.join(
+            "{}={}".format(
+                field.name,
+                _describe_value( getattr( value, field.name ), seen ) )
+            for field in __.dcls.fields( value ) if field.compare )
+        return f"{_describe_callable( type( value ) )}({fields})"
+    if isinstance( value, __.cabc.Mapping ):
+        mapping = __.typx.cast(
+            __.cabc.Mapping[ __.typx.Any, __.typx.Any ], value )
+        items = sorted(
+            "{}: {}".format(
+                _describe_value( key, seen ), _describe_value( item, seen ) )
+            for key, item in mapping.items( ) )
+        return "{}{{{}}}".format(
+            _describe_callable( type( mapping ) ), ', '.join( items ) )
+    if isinstance( value, ( frozenset, set ) ):
+        unordered = __.typx.cast( __.cabc.Iterable[ __.typx.Any ], value )
+        elements = sorted(
+            _describe_value( element, seen ) for element in unordered )
+        return "{}{{{}}}".format(
+            _describe_callable( type( unordered ) ), ', '.join( elements ) )
+    if isinstance( value, ( list, tuple ) ):
+        ordered = __.typx.cast( __.cabc.Iterable[ __.typx.Any ], value )
+        elements = ', '.join(
+            _describe_value( element, seen ) for element in ordered )
+        return f"{_describe_callable( type( ordered ) )}[{elements}]"
+    return _address_regex.sub( '', repr( value ) )
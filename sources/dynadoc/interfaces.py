@@ -97,6 +97,10 @@ GlobalsLevelArgument: __.typx.TypeAlias = __.typx.Annotated[
             Default is 2, which is the caller of the caller.
         ''' ),
 ]
+NotifierCodeArgument: __.typx.TypeAlias = __.typx.Annotated[
+    str,
+    Doc( ''' Stable identifier for kind of notification. ''' ),
+]
 NotifierLevelArgument: __.typx.TypeAlias = __.typx.Annotated[
     _nomina.NotificationLevels,
     Doc( ''' Severity level of the notification. ''' ),
@@ -105,6 +109,18 @@ NotifierMessageArgument: __.typx.TypeAlias = __.typx.Annotated[
     str,
     Doc( ''' Message content to notify about. ''' ),
 ]
+NotifierMessageLazyArgument: __.typx.TypeAlias = __.typx.Annotated[
+    str | __.cabc.Callable[ [ ], str ],
+    Doc(
+        ''' Message content to notify about or function which produces it.
+
+            Function is called only if notification at level is enabled.
+        ''' ),
+]
+NotifierQualnameArgument: __.typx.TypeAlias = __.typx.Annotated[
+    __.typx.Optional[ str ],
+    Doc( ''' Fully-qualified name of object concerned, if known. ''' ),
+]
 PossessorArgument: __.typx.TypeAlias = __.typx.Annotated[
     _nomina.Documentable,
     Doc(
@@ -177,6 +193,15 @@ class AnnotationsCache:
         dict[ __.typx.Any, __.typx.Any ],
         Doc( ''' Mapping from original annotations to reduced forms. ''' ),
     ] = __.dcls.field( default_factory = dict[ __.typx.Any, __.typx.Any ] )
+    adjuncts: __.typx.Annotated[
+        dict[ __.typx.Any, AdjunctsData ],
+        Doc(
+            ''' Mapping from original annotations to adjuncts data.
+
+                Adjuncts data contains only what was collected during
+                reduction of the original annotation.
+            ''' ),
+    ] = __.dcls.field( default_factory = dict[ __.typx.Any, AdjunctsData ] )
 
     def access(
         self, original: __.typx.Annotated[
@@ -195,6 +220,23 @@ class AnnotationsCache:
         try: return self.entries.get( original, absent )
         except TypeError: return self.entries.get( id( original ), absent )
 
+    def access_adjuncts(
+        self, original: __.typx.Annotated[
+            __.typx.Any,
+            Doc( ''' Original annotation to look up in cache. ''' ),
+        ]
+    ) -> __.typx.Annotated[
+        __.typx.Optional[ AdjunctsData ],
+        Doc(
+            ''' Adjuncts data collected during reduction.
+
+                None if not found.
+            ''' ),
+    ]:
+        ''' Accesses adjuncts data for entry, if it exists. '''
+        try: return self.adjuncts.get( original )
+        except TypeError: return self.adjuncts.get( id( original ) )
+
     def enter(
         self,
         original: __.typx.Annotated[
@@ -205,18 +247,137 @@ class AnnotationsCache:
             __.typx.Any,
             Doc( ''' Reduced form of annotation to store as value. ''' ),
         ] = incomplete,
+        adjuncts: __.typx.Annotated[
+            __.typx.Optional[ AdjunctsData ],
+            Doc( ''' Adjuncts data collected during reduction. ''' ),
+        ] = None,
     ) -> __.typx.Any:
         ''' Adds reduced annotation to cache, returning it.
 
             Cache key is original annotation.
             If reduction is not specified, then an incompletion sentinel is
             added as the value for the entry.
+            If adjuncts data is supplied, then it is stored alongside, so
+            that later lookups can be complete without repeated reduction.
         '''
-        try: self.entries[ original ] = reduction
-        except TypeError: self.entries[ id( original ) ] = reduction
+        key = original
+        try: self.entries[ key ] = reduction
+        except TypeError:
+            key = id( original )
+            self.entries[ key ] = reduction
+        if adjuncts is not None: self.adjuncts[ key ] = adjuncts
+        else: self.adjuncts.pop( key, None )
         return reduction
 
 
+_visitees_sweep_threshold_minimum = 1024
+
+
+# Weak reference to object or, if not weakly referenceable, object itself.
+_VisiteeReference: __.typx.TypeAlias = __.weakref.ref[ object ] | object
+
+
+@__.dcls.dataclass( kw_only = True, slots = True )
+class VisiteesRegistry:
+    ''' Registry of visited objects, based on object identities.
+
+        Never invokes hashing or equality methods of registered objects.
+        Objects, which can be weakly referenced, are held weakly, without
+        callbacks; stale entries are swept as the registry grows. Other
+        objects are held strongly, so that their identities remain valid.
+
+        Entries belong to generations. Advancing the generation forgets all
+        earlier entries in constant time.
+    '''
+
+    entries: __.typx.Annotated[
+        dict[ int, tuple[ _VisiteeReference, int ] ],
+        Doc(
+            ''' Mapping from object identities to references and
+                generations. ''' ),
+    ] = __.dcls.field(
+        default_factory = dict[ int, tuple[ _VisiteeReference, int ] ] )
+    generation: __.typx.Annotated[
+        int, Doc( ''' Current generation of entries. ''' )
+    ] = 0
+    sweep_threshold: __.typx.Annotated[
+        int, Doc( ''' Number of entries at which to sweep stale ones. ''' )
+    ] = _visitees_sweep_threshold_minimum
+
+    def __contains__( self, objct: object ) -> bool:
+        entry = self.entries.get( id( objct ) )
+        if entry is None: return False
+        reference, generation = entry
+        if generation != self.generation: return False
+        if isinstance( reference, __.weakref.ref ):
+            return reference( ) is objct
+        return reference is objct
+
+    def __len__( self ) -> int:
+        return sum( 1 for _ in self.survey( ) )
+
+    def add( self, objct: object ) -> None:
+        ''' Registers object as visited in current generation. '''
+        reference: _VisiteeReference
+        try: reference = __.weakref.ref( objct )
+        except TypeError: reference = objct
+        self.entries[ id( objct ) ] = ( reference, self.generation )
+        if len( self.entries ) >= self.sweep_threshold: self.sweep( )
+
+    def advance( self ) -> None:
+        ''' Advances generation, which forgets all registered objects.
+
+            Entries from earlier generations are removed by later sweeps.
+        '''
+        self.generation += 1
+
+    def discard( self, objct: object ) -> None:
+        ''' Forgets object, if it is registered. '''
+        if objct in self: del self.entries[ id( objct ) ]
+
+    def discard_subtree(
+        self,
+        mname: __.typx.Annotated[
+            str, Doc( ''' Name of module at root of subtree. ''' )
+        ],
+    ) -> None:
+        ''' Forgets module and all registered objects defined within it.
+
+            Submodules and their objects are forgotten too.
+        '''
+        prefix = f"{mname}."
+        for objct in tuple( self.survey( ) ):
+            if __.inspect.ismodule( objct ): mname_ = objct.__name__
+            else: mname_ = getattr( objct, '__module__', None )
+            if not isinstance( mname_, str ): continue
+            if mname_ == mname or mname_.startswith( prefix ):
+                del self.entries[ id( objct ) ]
+
+    def survey( self ) -> __.cabc.Iterator[ object ]:
+        ''' Iterates over live objects of current generation. '''
+        for reference, generation in tuple( self.entries.values( ) ):
+            if generation != self.generation: continue
+            if isinstance( reference, __.weakref.ref ):
+                # Narrowing by class loses the type of the referent.
+                referent = __.typx.cast( __.weakref.ref[ object ], reference )
+                objct = referent( )
+                if objct is None: continue
+                yield objct
+            else: yield reference
+
+    def sweep( self ) -> None:
+        ''' Removes stale entries and adjusts sweep threshold. '''
+        entries = self.entries
+        for ident, ( reference, generation ) in tuple( entries.items( ) ):
+            if generation != self.generation or (
+                isinstance( reference, __.weakref.ref )
+                and reference( ) is None
+            ): del entries[ ident ]
+        # Amortize sweeps over growth of registry.
+        self.sweep_threshold = max(
+            _visitees_sweep_threshold_minimum, 2 * len( entries ) )
+
+
 class AttributeAssociations( __.enum.Enum ):
     ''' Association level of an attribute with its containing entity. '''
 
@@ -225,6 +386,23 @@ class AttributeAssociations( __.enum.Enum ):
     Instance    = __.enum.auto( )
 
 
+class ResolutionModes( __.enum.Enum ):
+    ''' How string annotations and forward references are resolved.
+
+        Accept means to use them as-is.
+        Evaluate means to evaluate them against the namespace of the
+        possessor and the resolver globals and locals, falling back to
+        acceptance, if evaluation fails.
+        Parse means to parse them and evaluate only their names and
+        ``Annotated`` metadata, so that partially resolvable annotations
+        are reconstructed as far as possible.
+    '''
+
+    Accept      = __.enum.auto( )
+    Evaluate    = __.enum.auto( )
+    Parse       = __.enum.auto( )
+
+
 class ValuationModes( __.enum.Enum ):
     ''' Annotation for how default value is determined.
 
@@ -300,6 +478,36 @@ class InformationBase:
     ]
 
 
+@__.dcls.dataclass( frozen = True, kw_only = True, slots = True )
+class ParameterRecord:
+    ''' Lightweight record of function parameter.
+
+        Mirrors the attributes of :py:class:`inspect.Parameter`, which are
+        needed for documentation, without the cost of signature construction.
+    '''
+
+    name: __.typx.Annotated[
+        str,
+        Doc( ''' Name of the function parameter. ''' ),
+    ]
+    kind: __.typx.Annotated[
+        __.inspect._ParameterKind,
+        Doc( ''' Kind of parameter: positional, keyword, variadic. ''' ),
+    ]
+    default: __.typx.Annotated[
+        __.typx.Any,
+        Doc( ''' Default value or 'empty' marker if there is none. ''' ),
+    ] = __.inspect.Parameter.empty
+    annotation: __.typx.Annotated[
+        __.typx.Any,
+        Doc( ''' Annotation or 'empty' marker if there is none. ''' ),
+    ] = __.inspect.Parameter.empty
+
+
+ParameterSpecification: __.typx.TypeAlias = (
+    __.inspect.Parameter | ParameterRecord )
+
+
 @__.dcls.dataclass( frozen = True, kw_only = True, slots = True )
 class ArgumentInformation( InformationBase ):
     ''' Information about a function argument. '''
@@ -309,8 +517,8 @@ class ArgumentInformation( InformationBase ):
         Doc( ''' Name of the function parameter. ''' ),
     ]
     paramspec: __.typx.Annotated[
-        __.inspect.Parameter,
-        Doc( ''' Inspection parameter object with various details. ''' ),
+        ParameterSpecification,
+        Doc( ''' Parameter record or object with various details. ''' ),
     ]
     default: __.typx.Annotated[
         Default,
@@ -349,8 +557,90 @@ class ReturnInformation( InformationBase ):
 Informations: __.typx.TypeAlias = __.cabc.Sequence[ InformationBase ]
 
 
+class InstrumentationStages( __.enum.Enum ):
+    ''' Stages of docstring assembly which can be instrumented.
+
+        Stages may nest. E.g., reductions of annotations occur during
+        introspection and rectifications of fragments can occur during
+        rendering.
+    '''
+
+    Assignment          = __.enum.auto( ) # docstring to object
+    Introspection       = __.enum.auto( )
+    Limitation          = __.enum.auto( ) # rules, limits, and limiters
+    Notification        = __.enum.auto( ) # notifier callback
+    Rectification       = __.enum.auto( ) # fragment rectifier callback
+    Reduction           = __.enum.auto( ) # of annotation
+    Rendering           = __.enum.auto( )
+    Survey              = __.enum.auto( ) # of attributes
+    VisibilityDecision  = __.enum.auto( ) # visibility decider callback
+
+
+@__.dcls.dataclass( frozen = True, kw_only = True, slots = True )
+class InstrumentationEvent:
+    ''' Duration of stage of docstring assembly. '''
+
+    stage: __.typx.Annotated[
+        InstrumentationStages,
+        Doc( ''' Stage of docstring assembly. ''' ),
+    ]
+    objct: __.typx.Annotated[
+        __.typx.Any,
+        Doc(
+            ''' Object processed during stage.
+
+                Annotation for reductions. Possessor of attribute for
+                visibility decisions. Absent for notifications and fragment
+                rectifications.
+            ''' ),
+    ] = None
+    name: __.typx.Annotated[
+        __.typx.Optional[ str ],
+        Doc(
+            ''' Fully-qualified name of object, if documentable.
+
+                For notifications, name of object concerned, if known.
+            ''' ),
+    ] = None
+    elapsed: __.typx.Annotated[
+        int,
+        Doc( ''' Elapsed time in nanoseconds. ''' ),
+    ]
+
+
+class Instrumenter( __.typx.Protocol ):
+    ''' Receives durations of stages of docstring assembly. '''
+
+    @staticmethod
+    def __call__(
+        event: __.typx.Annotated[
+            InstrumentationEvent,
+            Doc( ''' Duration of stage with object processed during it. ''' ),
+        ],
+    ) -> None:
+        ''' (Signature for instrumenter callback.) '''
+        raise NotImplementedError # pragma: no cover
+
+
+@__.dcls.dataclass( frozen = True, kw_only = True, slots = True )
+class Notification:
+    ''' Structured notification of warning or error. '''
+
+    level: NotifierLevelArgument
+    code: NotifierCodeArgument = ''
+    qualname: NotifierQualnameArgument = None
+    message: NotifierMessageArgument
+
+
 class Notifier( __.typx.Protocol ):
-    ''' Notifies of warnings and errors. '''
+    ''' Notifies of warnings and errors.
+
+        Notifiers, which also have a ``record_notification`` method, receive
+        structured notifications through it rather than being called.
+        Notifiers, which also have an ``is_level_enabled`` method, are
+        consulted by it before messages are formatted; notifications at
+        disabled levels are discarded without being formatted.
+    '''
 
     @staticmethod
     def __call__(
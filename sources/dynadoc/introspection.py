@@ -23,6 +23,7 @@
 
 from . import __
 from . import context as _context
+from . import counters as _counters
 from . import interfaces as _interfaces
 from . import nomina as _nomina
 
@@ -30,6 +31,89 @@ from . import nomina as _nomina
 _default_default = _interfaces.Default( )
 _default_suppress = _interfaces.Default(
     mode = _interfaces.ValuationModes.Suppress )
+_parameter_empty = __.inspect.Parameter.empty
+
+
+@__.dcls.dataclass( frozen = True, slots = True )
+class _AnnotationReduction:
+    ''' Reduced annotation with its description and adjuncts. '''
+
+    annotation: __.typx.Any
+    description: str
+    adjuncts: _interfaces.AdjunctsData
+
+
+@__.dcls.dataclass( kw_only = True, slots = True )
+class _ClassAnnotationsRecord:
+    ''' Accessed and reduced annotations of class.
+
+        Only annotations, which are defined directly on the class, are
+        recorded. Subclasses merge the records of their ancestors.
+    '''
+
+    origin: __.typx.Any
+    qualname: _interfaces.NotifierQualnameArgument
+    rectifier: _interfaces.FragmentRectifier
+    table: _nomina.FragmentsTable
+    resolution: tuple[ __.typx.Any, ... ]
+    annotations: __.cabc.Mapping[ str, __.typx.Any ]
+    reductions: __.typx.Optional[
+        __.cabc.Mapping[ str, _AnnotationReduction ] ] = None
+
+
+_reduction_absent = _AnnotationReduction(
+    _interfaces.absent, '', _interfaces.AdjunctsData( ) )
+
+
+_ResolutionKey: __.typx.TypeAlias = tuple[ str, int, int, bool ]
+
+
+@__.dcls.dataclass( frozen = True, kw_only = True, slots = True )
+class _ResolutionNamespace:
+    ''' Namespace for resolution of annotations, with its cache. '''
+
+    globals: dict[ str, __.typx.Any ]
+    locals: __.typx.Optional[ __.cabc.Mapping[ str, __.typx.Any ] ]
+    owner: __.typx.Optional[ object ]
+    resolutions: __.typx.Optional[
+        dict[ _ResolutionKey, tuple[ __.typx.Any, ... ] ] ]
+
+
+try: import annotationlib as _annotationlib # pyright: ignore
+except ImportError: _annotationlib = None # Python < 3.14
+_evaluate_forward_ref = getattr( __.typx, 'evaluate_forward_ref', None )
+# Cache of resolutions per namespace owner (module or class).
+# Results, which reference their owner, are not cached, else never collected.
+# Neither are results for classes, which reference collectable objects,
+# since those could be other classes, whose results reference the first.
+_resolutions: __.weakref.WeakKeyDictionary[
+    object, dict[ _ResolutionKey, tuple[ __.typx.Any, ... ] ]
+] = __.weakref.WeakKeyDictionary( )
+_unresolvable = object( )
+# Kinds of dataclass pseudo-fields are private to the dataclasses module.
+_dataclass_field_classvar: object = (
+    getattr( __.dcls, '_FIELD_CLASSVAR', None ) )
+_dataclass_field_initvar: object = getattr( __.dcls, '_FIELD_INITVAR', None )
+# Objects from these modules live as long as the interpreter.
+_modules_permanent = frozenset( (
+    'builtins', 'collections.abc', 'types', 'typing', 'typing_extensions',
+    _interfaces.__name__ ) )
+_primitives = (
+    str, bytes, int, float, complex, type( None ), type( Ellipsis ) )
+
+
+# Records are invalidated by change of class annotations object identity.
+# Records, which reference collectable objects, such as other classes, are
+# not cached, else classes referencing each other are never collected.
+_classes_annotations: __.weakref.WeakKeyDictionary[
+    type, _ClassAnnotationsRecord ] = __.weakref.WeakKeyDictionary( )
+
+# Sets are invalidated by change of '__all__' object identity or length.
+# Sets from mutable sequences are also dropped per module introspection.
+_modules_publics: __.weakref.WeakKeyDictionary[
+    __.types.ModuleType,
+    tuple[ __.cabc.Collection[ str ], int, frozenset[ str ] ],
+] = __.weakref.WeakKeyDictionary( )
 
 
 IntrospectIntrospectionArgument: __.typx.TypeAlias = __.typx.Annotated[
@@ -63,6 +147,73 @@ def introspect(
     return ( )
 
 
+def introspect_dataclasses( # noqa: PLR0913
+    possessor: _interfaces.PossessorClassArgument, /,
+    context: _context.ContextArgument,
+    introspection: _context.IntrospectionArgument,
+    annotations: _interfaces.AnnotationsArgument,
+    cache: _interfaces.AnnotationsCacheArgument,
+    table: _interfaces.FragmentsTableArgument,
+) -> __.typx.Optional[ _interfaces.Informations ]:
+    ''' Introspects dataclasses from their computed fields.
+
+        Fields, their defaults, and class variables are taken from
+        ``__dataclass_fields__`` of the class itself; plain subclasses of
+        dataclasses are left to generic introspection. Init-only variables
+        are omitted and attributes are not scanned.
+    '''
+    fields: __.typx.Optional[
+        __.cabc.Mapping[ str, __.dcls.Field[ __.typx.Any ] ] ]
+    fields = possessor.__dict__.get( '__dataclass_fields__' )
+    if not isinstance( fields, __.cabc.Mapping ): return None
+    inheritance = introspection.class_control.inheritance
+    records: list[ tuple[ str, _interfaces.AttributeAssociations, bool ] ]
+    records = [ ]
+    for name, field in fields.items( ):
+        if not inheritance and name not in annotations: continue
+        # Classified by field, since annotations may be unresolved strings.
+        kind = getattr( field, '_field_type', None )
+        if kind is _dataclass_field_initvar: continue
+        if field.default is __.dcls.MISSING:
+            defaulted = field.default_factory is not __.dcls.MISSING
+        else: defaulted = True
+        association = (
+            _interfaces.AttributeAssociations.Class
+            if kind is _dataclass_field_classvar
+            else _interfaces.AttributeAssociations.Instance )
+        records.append( ( name, association, defaulted ) )
+    return _introspect_class_fields(
+        possessor, context, introspection, records, cache, table )
+
+
+def introspect_named_tuples( # noqa: PLR0913
+    possessor: _interfaces.PossessorClassArgument, /,
+    context: _context.ContextArgument,
+    introspection: _context.IntrospectionArgument,
+    annotations: _interfaces.AnnotationsArgument,
+    cache: _interfaces.AnnotationsCacheArgument,
+    table: _interfaces.FragmentsTableArgument,
+) -> __.typx.Optional[ _interfaces.Informations ]:
+    ''' Introspects named tuples from their computed fields.
+
+        Fields and their defaults are taken from ``_fields`` and
+        ``_field_defaults``. Attributes are not scanned.
+    '''
+    # Membership test rather than 'issubclass' avoids generic narrowing.
+    if tuple not in possessor.__mro__: return None
+    fields_: object = getattr( possessor, '_fields', None )
+    defaults_: object = getattr( possessor, '_field_defaults', None )
+    if not isinstance( fields_, tuple ) or not isinstance( defaults_, dict ):
+        return None
+    fields = __.typx.cast( tuple[ str, ... ], fields_ )
+    defaults = __.typx.cast( dict[ str, __.typx.Any ], defaults_ )
+    association = _interfaces.AttributeAssociations.Instance
+    return _introspect_class_fields(
+        possessor, context, introspection,
+        ( ( name, association, name in defaults ) for name in fields ),
+        cache, table )
+
+
 def introspect_special_classes( # noqa: PLR0913
     possessor: _interfaces.PossessorClassArgument, /,
     context: _context.ContextArgument,
@@ -104,11 +255,39 @@ def is_attribute_visible(
         if it exists.
     '''
     if __.inspect.ismodule( possessor ):
-        publics = getattr( possessor, '__all__', None )
+        publics = _access_module_publics( possessor )
         if publics is not None: return name in publics
     return bool( description ) or not name.startswith( '_' )
 
 
+def introspect_typed_dicts( # noqa: PLR0913
+    possessor: _interfaces.PossessorClassArgument, /,
+    context: _context.ContextArgument,
+    introspection: _context.IntrospectionArgument,
+    annotations: _interfaces.AnnotationsArgument,
+    cache: _interfaces.AnnotationsCacheArgument,
+    table: _interfaces.FragmentsTableArgument,
+) -> __.typx.Optional[ _interfaces.Informations ]:
+    ''' Introspects typed dictionaries from their computed keys.
+
+        Keys are taken from ``__required_keys__`` and ``__optional_keys__``,
+        which already account for inheritance. Attributes are not scanned.
+    '''
+    if not __.typx.is_typeddict( possessor ): return None
+    required: frozenset[ str ] = getattr(
+        possessor, '__required_keys__', frozenset[ str ]( ) )
+    optional: frozenset[ str ] = getattr(
+        possessor, '__optional_keys__', frozenset[ str ]( ) )
+    keys = required | optional
+    association = _interfaces.AttributeAssociations.Instance
+    # Typed dictionary annotations already include those of ancestors.
+    return _introspect_class_fields(
+        possessor, context, introspection,
+        (   ( name, association, False )
+            for name in annotations if name in keys ),
+        cache, table )
+
+
 def reduce_annotation(
     annotation: __.typx.Any,
     context: _context.Context,
@@ -121,49 +300,159 @@ def reduce_annotation(
         and simplifying complex generic types. Uses cache to avoid redundant
         processing and prevent infinite recursion from reference cycles.
     '''
-    annotation_r = cache.access( annotation )
-    # Avoid infinite recursion from reference cycles.
-    if annotation_r is _interfaces.incomplete:
-        emessage = (
-            f"Annotation with circular reference {annotation!r}; "
-            "returning Any." )
-        context.notifier( 'admonition', emessage )
-        return cache.enter( annotation, __.typx.Any )
-    # TODO: Short-circuit on cache hit.
-    #       Need to ensure copy of adjuncts data is retrieved too.
-    # if annotation_r is not _interfaces.absent: return annotation_r
-    if isinstance( annotation, str ): # Cannot do much with unresolved strings.
-        return cache.enter( annotation, annotation )
-    if isinstance( annotation, __.typx.ForwardRef ): # Extract string.
-        return cache.enter( annotation, annotation.__forward_arg__ )
-    cache.enter( annotation ) # mark as incomplete
-    return cache.enter(
-        annotation,
-        _reduce_annotation_core( annotation, context, adjuncts, cache ) )
+    _counters.tallies.reductions += 1
+    instrumenter = context.instrumenter
+    if instrumenter is None:
+        return _reduce_annotation( annotation, context, adjuncts, cache )
+    stage = _interfaces.InstrumentationStages.Reduction
+    start = __.time.perf_counter_ns( )
+    annotation_r = _reduce_annotation( annotation, context, adjuncts, cache )
+    elapsed = __.time.perf_counter_ns( ) - start
+    _counters.tallies.durations[ stage ] += elapsed
+    instrumenter( _interfaces.InstrumentationEvent(
+        stage = stage, objct = annotation, elapsed = elapsed ) )
+    return annotation_r
 
 
 def _access_annotations(
     possessor: _nomina.Documentable, /, context: _context.Context
 ) -> __.cabc.Mapping[ str, __.typx.Any ]:
-    # TODO? Option to attempt resolution of strings.
-    #       Probably after retrieval of annotations dictionary
-    #       to prevent 'NameError' from ruining everything.
-    #       Would leave unresolvable strings as strings.
     # TODO? Option 'strict' to force resolution of all strings.
     # TODO: Switch to '__.typx.get_annotations'.
-    ''' Accesses annotations from documentable object. '''
-    # nomargs: _nomina.Variables = dict( eval_str = True )
-    # nomargs[ 'globals' ] = context.resolver_globals
-    # nomargs[ 'locals' ] = context.resolver_locals
-    try:
-        # return __.types.MappingProxyType(
-        #     __.inspect.get_annotations( possessor, **nomargs ) )
-        return __.types.MappingProxyType(
-            __.inspect.get_annotations( possessor ) )
+    ''' Accesses annotations from documentable object.
+
+        String annotations and forward references are resolved, if the
+        resolution mode of the context requests it. Unresolvable ones are
+        left as-is, rather than ruining access to all annotations.
+    '''
+    try: annotations = _get_annotations( possessor, context )
     except ( NameError, TypeError ) as exc:
-        emessage = f"Cannot access annotations for {possessor!r}: {exc}"
-        context.notifier( 'error', emessage )
+        context.notify(
+            'error',
+            lambda exc = exc:
+                f"Cannot access annotations for {possessor!r}: {exc}",
+            code = 'annotations-inaccessible',
+            qualname = __.qualify_object( possessor ) )
         return __.dictproxy_empty
+    match context.resolution_mode:
+        case _interfaces.ResolutionModes.Evaluate:
+            annotations = _resolve_annotations(
+                possessor, annotations, context )
+        case _interfaces.ResolutionModes.Parse:
+            annotations = _resolve_annotations(
+                possessor, annotations, context, parse = True )
+        case _: pass
+    return __.types.MappingProxyType( annotations )
+
+
+def _access_class_annotations_record(
+    possessor: type, /,
+    context: _context.Context,
+    table: _nomina.FragmentsTable,
+) -> _ClassAnnotationsRecord:
+    ''' Accesses record of annotations defined directly on class.
+
+        Record is reused, if the annotations object of the class, the
+        fragments rectifier and table, and the resolution mode and resolver
+        namespaces are unchanged since it was produced.
+    '''
+    attributes = possessor.__dict__
+    origin = attributes.get(
+        '__annotations__', attributes.get( '__annotate__' ) )
+    rectifier = context.fragment_rectifier
+    resolution = (
+        context.resolution_mode,
+        context.resolver_globals,
+        context.resolver_locals )
+    record = _classes_annotations.get( possessor )
+    if (    record is not None
+        and record.origin is origin
+        and record.rectifier is rectifier
+        and record.table is table
+        and all( map( __.operator.is_, record.resolution, resolution ) )
+    ): return record
+    record = _ClassAnnotationsRecord(
+        origin = origin,
+        qualname = __.qualify_object( possessor ),
+        rectifier = rectifier,
+        table = table,
+        resolution = resolution,
+        annotations = _access_annotations( possessor, context ) )
+    if (    isinstance( origin, ( dict, type( None ) ) )
+        and context.resolver_globals is None
+        and context.resolver_locals is None
+        and not any(
+            _references_collectables( annotation )
+            for annotation in record.annotations.values( ) )
+    ): _classes_annotations[ possessor ] = record
+    return record
+
+
+def _access_class_annotations_records(
+    possessor: type, /,
+    context: _context.Context,
+    introspection: _context.IntrospectionControl,
+    table: _nomina.FragmentsTable,
+) -> __.cabc.Sequence[ _ClassAnnotationsRecord ]:
+    ''' Accesses annotations records for class and, maybe, its ancestors.
+
+        Records are ordered from most distant ancestor to class itself.
+    '''
+    classes: __.cabc.Iterable[ type ] = (
+        reversed( possessor.__mro__ )
+        if introspection.class_control.inheritance else ( possessor, ) )
+    return tuple(
+        _access_class_annotations_record( class_, context, table )
+        for class_ in classes )
+
+
+def _access_class_annotations_reductions(
+    record: _ClassAnnotationsRecord,
+    context: _context.Context,
+    cache: _interfaces.AnnotationsCache,
+    table: _nomina.FragmentsTable,
+) -> __.cabc.Mapping[ str, _AnnotationReduction ]:
+    ''' Accesses reduced annotations from record, reducing on first use. '''
+    if record.reductions is not None: return record.reductions
+    reductions: dict[ str, _AnnotationReduction ] = { }
+    for name, annotation in record.annotations.items( ):
+        adjuncts = _interfaces.AdjunctsData( )
+        annotation_ = reduce_annotation(
+            annotation, context, adjuncts, cache )
+        description = _compile_description(
+            context, adjuncts, table, record.qualname )
+        reductions[ name ] = _AnnotationReduction(
+            annotation_, description, adjuncts )
+    record.reductions = __.types.MappingProxyType( reductions )
+    return record.reductions
+
+
+def _access_module_publics(
+    possessor: __.types.ModuleType
+) -> __.typx.Optional[ frozenset[ str ] ]:
+    ''' Accesses names from ``__all__`` of module as set, if it exists.
+
+        Static access avoids triggering lazy attribute loaders. The set is
+        cached, so that membership tests do not scan the sequence. Sets
+        from lists, which may be edited in place, are dropped at the start
+        of each introspection of the module.
+    '''
+    publics = possessor.__dict__.get( '__all__' )
+    if publics is None: return None
+    entry = _modules_publics.get( possessor )
+    if (    entry is not None
+        and entry[ 0 ] is publics and entry[ 1 ] == len( publics )
+    ): return entry[ 2 ]
+    names = frozenset( publics )
+    _modules_publics[ possessor ] = ( publics, len( publics ), names )
+    return names
+
+
+def _forget_module_publics( possessor: __.types.ModuleType ) -> None:
+    ''' Forgets cached names of module, unless from an immutable tuple. '''
+    entry = _modules_publics.get( possessor )
+    if entry is not None and not isinstance( entry[ 0 ], tuple ):
+        del _modules_publics[ possessor ]
 
 
 def _classes_sequence_to_union(
@@ -176,13 +465,15 @@ def _classes_sequence_to_union(
     '''
     if not isinstance( annotation, __.cabc.Sequence ):
         return annotation
-    return __.funct.reduce( __.operator.or_, annotation )
+    # Single construction rather than quadratic series of unions.
+    return __.typx.Union[ tuple( annotation ) ] # pyright: ignore
 
 
 def _compile_description(
     context: _context.Context,
     adjuncts: _interfaces.AdjunctsData,
     table: _nomina.FragmentsTable,
+    qualname: _interfaces.NotifierQualnameArgument,
 ) -> str:
     ''' Compiles a description from adjuncts data.
 
@@ -197,7 +488,9 @@ def _compile_description(
             name = extra.name
             if name not in table:
                 emessage = f"Fragment '{name}' not in provided table."
-                context.notifier( 'error', emessage )
+                context.notify(
+                    'error', emessage,
+                    code = 'fragment-absent', qualname = qualname )
             else: fragments.append( table[ name ] )
     return '\n\n'.join(
         context.fragment_rectifier(
@@ -243,7 +536,7 @@ def _filter_reconstitute_annotation(
     adjuncts_.traits.add( origin.__name__ )
     match len( arguments ):
         case 1:
-            arguments_r.append( reduce_annotation(
+            arguments_r.append( _reduce_annotation(
                 arguments[ 0 ], context, adjuncts_, cache ) )
         case _:
             arguments_r.extend( _reduce_annotation_arguments(
@@ -253,22 +546,63 @@ def _filter_reconstitute_annotation(
     #       (Union with one argument returns the argument.)
     try:
         if origin in ( __.types.UnionType, __.typx.Union ):
-            # Unions cannot be reconstructed from sequences.
-            # TODO: Python 3.11: Unpack into subscript.
-            annotation = __.funct.reduce( __.operator.or_, arguments_r )
+            # PEP 604 unions cannot be subscripted, but typing unions can.
+            # Also, typing unions accept strings as forward references.
+            annotation = (
+                __.typx.Union[ tuple( arguments_r ) ] ) # pyright: ignore
         else:
             match len( arguments_r ):
                 case 1: annotation = origin[ arguments_r[ 0 ] ]
                 case _: annotation = origin[ tuple( arguments_r ) ]
     except TypeError as exc:
-        emessage = (
-            f"Cannot reconstruct {origin.__name__!r} "
-            f"with reduced annotations for arguments. Reason: {exc}" )
-        context.notifier( 'error', emessage )
+        context.notify(
+            'error',
+            lambda exc = exc: (
+                f"Cannot reconstruct {origin.__name__!r} "
+                f"with reduced annotations for arguments. Reason: {exc}" ),
+            code = 'annotation-unreconstructable' )
         return origin
     return annotation
 
 
+def _evaluate_string(
+    string: str, namespace: _ResolutionNamespace
+) -> __.typx.Any:
+    ''' Evaluates string annotation in namespace.
+
+        Nested forward references are evaluated too, if supported by the
+        available version of ``typing_extensions``.
+    '''
+    if _evaluate_forward_ref is None:
+        return eval( # noqa: S307
+            string, namespace.globals, namespace.locals )
+    return _evaluate_forward_ref(
+        __.typx.ForwardRef( string ),
+        globals = namespace.globals,
+        locals = namespace.locals )
+
+
+def _get_annotations(
+    possessor: _nomina.Documentable, /, context: _context.Context
+) -> __.cabc.Mapping[ str, __.typx.Any ]:
+    ''' Gets annotations in format suitable for resolution mode.
+
+        If ``annotationlib`` is available (Python 3.14+), then deferred
+        annotations are requested in forward reference format. Names, which
+        cannot be evaluated, become forward references rather than causing
+        all annotations of the possessor to be discarded. For parse mode,
+        annotations are requested in string format, since they are parsed.
+    '''
+    if _annotationlib is None: return __.inspect.get_annotations( possessor )
+    formats = _annotationlib.Format # pyright: ignore
+    match context.resolution_mode:
+        case _interfaces.ResolutionModes.Parse:
+            format_ = formats.STRING # pyright: ignore
+        case _: format_ = formats.FORWARDREF # pyright: ignore
+    return _annotationlib.get_annotations( # pyright: ignore
+        possessor, format = format_ ) # pyright: ignore
+
+
 def _introspect_class(
     possessor: type, /,
     context: _context.Context,
@@ -283,14 +617,11 @@ def _introspect_class(
         special class introspectors first, then falls back to standard
         introspection.
     '''
-    annotations_: dict[ str, __.typx.Any ] = { }
-    if introspection.class_control.inheritance:
-        # Descendant annotations override ancestor annotations.
-        for class_ in reversed( possessor.__mro__ ):
-            annotations_b = _access_annotations( class_, context )
-            annotations_.update( annotations_b )
-        annotations = annotations_
-    else: annotations = _access_annotations( possessor, context )
+    records = _access_class_annotations_records(
+        possessor, context, introspection, table )
+    annotations: dict[ str, __.typx.Any ] = { }
+    # Descendant annotations override ancestor annotations.
+    for record in records: annotations.update( record.annotations )
     informations: list[ _interfaces.InformationBase ] = [ ]
     for introspector in introspection.class_control.introspectors:
         informations_ = introspector(
@@ -301,8 +632,10 @@ def _introspect_class(
             informations.extend( informations_ )
             break
     else:
+        reductions = _merge_class_annotations_reductions(
+            records, context, cache, table )
         informations.extend( _introspect_class_annotations(
-            possessor, context, annotations, cache, table ) )
+            possessor, context, reductions ) )
         if introspection.class_control.scan_attributes:
             informations.extend( _introspect_class_attributes(
                 possessor, context, annotations ) )
@@ -312,36 +645,21 @@ def _introspect_class(
 def _introspect_class_annotations(
     possessor: type, /,
     context: _context.Context,
-    annotations: __.cabc.Mapping[ str, __.typx.Any ],
-    cache: _interfaces.AnnotationsCache,
-    table: _nomina.FragmentsTable,
+    reductions: __.cabc.Mapping[ str, _AnnotationReduction ],
 ) -> __.cabc.Sequence[ _interfaces.InformationBase ]:
     ''' Introspects annotations of a class.
 
-        Processes class annotations to extract information about class
-        attributes, including their types, descriptions from Doc objects,
-        and whether they are class or instance variables.
+        Processes reduced class annotations to extract information about
+        class attributes, including their types, descriptions from Doc
+        objects, and whether they are class or instance variables.
+        Visibility is decided for the possessor, since reductions may be
+        inherited from ancestors.
     '''
     informations: list[ _interfaces.InformationBase ] = [ ]
-    for name, annotation in annotations.items( ):
-        adjuncts = _interfaces.AdjunctsData( )
-        annotation_ = reduce_annotation(
-            annotation, context, adjuncts, cache )
-        description = _compile_description( context, adjuncts, table )
-        if not _is_attribute_visible(
-            possessor, name, annotation_, context, adjuncts, description
-        ): continue
-        association = (
-            _interfaces.AttributeAssociations.Class
-            if 'ClassVar' in adjuncts.traits
-            else _interfaces.AttributeAssociations.Instance )
-        default = _determine_default_valuator( context, adjuncts )
-        informations.append( _interfaces.AttributeInformation(
-            name = name,
-            annotation = annotation_,
-            description = description,
-            association = association,
-            default = default ) )
+    for name, reduction in reductions.items( ):
+        information = _produce_class_attribute_information(
+            possessor, name, reduction, context )
+        if information is not None: informations.append( information )
     return informations
 
 
@@ -385,28 +703,94 @@ def _introspect_function(
     '''
     annotations = _access_annotations( possessor, context )
     if not annotations: return ( )
+    qualname = __.qualify_object( possessor )
     informations: list[ _interfaces.InformationBase ] = [ ]
-    try: signature = __.inspect.signature( possessor )
-    except ValueError as exc:
-        context.notifier(
-            'error',
-            f"Could not assess signature for {possessor.__qualname__!r}. "
-            f"Reason: {exc}" )
-        return ( )
-    if signature.parameters:
+    parameters = _access_parameters_from_code( possessor, annotations )
+    if parameters is None:
+        try: signature = __.inspect.signature( possessor )
+        except ValueError as exc:
+            context.notify(
+                'error',
+                lambda exc = exc: (
+                    "Could not assess signature for "
+                    f"{possessor.__qualname__!r}. Reason: {exc}" ),
+                code = 'signature-inaccessible', qualname = qualname )
+            return ( )
+        parameters = tuple( signature.parameters.values( ) )
+    if parameters:
         informations.extend( _introspect_function_valences(
-            annotations, signature, context, cache, table ) )
+            annotations, parameters, context, cache, table, qualname ) )
     if 'return' in annotations:
         informations.extend( _introspect_function_return(
-            annotations[ 'return' ], context, cache, table ) )
+            annotations[ 'return' ], context, cache, table, qualname ) )
     return tuple( informations )
 
 
+def _access_parameters_from_code(
+    possessor: __.cabc.Callable[ ..., __.typx.Any ],
+    annotations: __.cabc.Mapping[ str, __.typx.Any ],
+) -> __.typx.Optional[ __.cabc.Sequence[ _interfaces.ParameterRecord ] ]:
+    ''' Derives parameter records directly from code of plain function.
+
+        Returns None for wrappers, functions with custom signatures, and
+        anything which is not a plain Python function. Signature inspection
+        is necessary in those cases.
+    '''
+    if type( possessor ) is not __.types.FunctionType: return None
+    attributes = possessor.__dict__
+    if '__wrapped__' in attributes or '__signature__' in attributes:
+        return None
+    code = possessor.__code__
+    names = code.co_varnames
+    count_positional = code.co_argcount
+    count_positional_only = code.co_posonlyargcount
+    count_keyword_only = code.co_kwonlyargcount
+    defaults = possessor.__defaults__ or ( )
+    kwdefaults = possessor.__kwdefaults__ or { }
+    empty = _parameter_empty
+    kinds = __.inspect.Parameter
+    records: list[ _interfaces.ParameterRecord ] = [ ]
+    offset = count_positional - len( defaults )
+    for i in range( count_positional ):
+        name = names[ i ]
+        records.append( _interfaces.ParameterRecord(
+            name = name,
+            kind = (
+                kinds.POSITIONAL_ONLY if i < count_positional_only
+                else kinds.POSITIONAL_OR_KEYWORD ),
+            default = defaults[ i - offset ] if i >= offset else empty,
+            annotation = annotations.get( name, empty ) ) )
+    i = count_positional + count_keyword_only
+    if code.co_flags & __.inspect.CO_VARARGS:
+        name = names[ i ]
+        records.append( _interfaces.ParameterRecord(
+            name = name,
+            kind = kinds.VAR_POSITIONAL,
+            annotation = annotations.get( name, empty ) ) )
+        i += 1
+    records.extend(
+        _interfaces.ParameterRecord(
+            name = name,
+            kind = kinds.KEYWORD_ONLY,
+            default = kwdefaults.get( name, empty ),
+            annotation = annotations.get( name, empty ) )
+        for name in names[
+            count_positional : count_positional + count_keyword_only ] )
+    if code.co_flags & __.inspect.CO_VARKEYWORDS:
+        name = names[ i ]
+        records.append( _interfaces.ParameterRecord(
+            name = name,
+            kind = kinds.VAR_KEYWORD,
+            annotation = annotations.get( name, empty ) ) )
+    return tuple( records )
+
+
 def _introspect_function_return(
     annotation: __.typx.Any,
     context: _context.Context,
     cache: _interfaces.AnnotationsCache,
     table: _nomina.FragmentsTable,
+    qualname: _interfaces.NotifierQualnameArgument,
 ) -> __.cabc.Sequence[ _interfaces.InformationBase ]:
     ''' Introspects function return annotation.
 
@@ -416,7 +800,7 @@ def _introspect_function_return(
     informations: list[ _interfaces.InformationBase ] = [ ]
     adjuncts = _interfaces.AdjunctsData( )
     annotation_ = reduce_annotation( annotation, context, adjuncts, cache )
-    description = _compile_description( context, adjuncts, table )
+    description = _compile_description( context, adjuncts, table, qualname )
     informations.append(
         _interfaces.ReturnInformation(
             annotation = annotation_, description = description ) )
@@ -429,31 +813,34 @@ def _introspect_function_return(
     return tuple( informations )
 
 
-def _introspect_function_valences(
+def _introspect_function_valences( # noqa: PLR0913
     annotations: __.cabc.Mapping[ str, __.typx.Any ],
-    signature: __.inspect.Signature,
+    parameters: __.cabc.Sequence[ _interfaces.ParameterSpecification ],
     context: _context.Context,
     cache: _interfaces.AnnotationsCache,
     table: _nomina.FragmentsTable,
+    qualname: _interfaces.NotifierQualnameArgument,
 ) -> __.cabc.Sequence[ _interfaces.ArgumentInformation ]:
     ''' Introspects function parameters to extract argument information.
 
-        Processes function signature and annotations to create information
+        Processes function parameters and annotations to create information
         about function arguments, including their types, descriptions, and
         default value handling.
     '''
     informations: list[ _interfaces.ArgumentInformation ] = [ ]
-    for name, param in signature.parameters.items( ):
+    for param in parameters:
+        name = param.name
         annotation = annotations.get( name, param.annotation )
         adjuncts = _interfaces.AdjunctsData( )
-        if annotation is param.empty:
+        if annotation is _parameter_empty:
             annotation_ = _interfaces.absent
             description = None
         else:
             annotation_ = reduce_annotation(
                 annotation, context, adjuncts, cache )
-            description = _compile_description( context, adjuncts, table )
-        if param.default is param.empty: default = _default_suppress
+            description = _compile_description(
+                context, adjuncts, table, qualname )
+        if param.default is _parameter_empty: default = _default_suppress
         else: default = _determine_default_valuator( context, adjuncts )
         informations.append( _interfaces.ArgumentInformation(
             name = name,
@@ -476,13 +863,17 @@ def _introspect_module(
         Gathers information about module annotations and potentially about
         module attributes based on introspection control settings.
     '''
+    _forget_module_publics( possessor )
     annotations = _access_annotations( possessor, context )
-    if not annotations: return ( )
     informations: list[ _interfaces.InformationBase ] = [ ]
-    informations.extend( _introspect_module_annotations(
-        possessor, context, annotations, cache, table ) )
-    if introspection.module_control.scan_attributes:
-        informations.extend( _introspect_module_attributes(
+    if annotations:
+        informations.extend( _introspect_module_annotations(
+            possessor, context, annotations, cache, table ) )
+        if introspection.module_control.scan_attributes:
+            informations.extend( _introspect_module_attributes(
+                possessor, context, annotations ) )
+    if introspection.module_control.lazy_attributes:
+        informations.extend( _introspect_module_attributes_lazy(
             possessor, context, annotations ) )
     return tuple( informations )
 
@@ -500,11 +891,13 @@ def _introspect_module_annotations(
         attributes, including their types and descriptions from Doc objects.
     '''
     informations: list[ _interfaces.InformationBase ] = [ ]
+    qualname = __.qualify_object( possessor )
     for name, annotation in annotations.items( ):
         adjuncts = _interfaces.AdjunctsData( )
         annotation_ = reduce_annotation(
             annotation, context, adjuncts, cache )
-        description = _compile_description( context, adjuncts, table )
+        description = _compile_description(
+            context, adjuncts, table, qualname )
         if not _is_attribute_visible(
             possessor, name, annotation_, context, adjuncts, description
         ): continue
@@ -531,7 +924,8 @@ def _introspect_module_attributes(
     informations: list[ _interfaces.InformationBase ] = [ ]
     adjuncts = _interfaces.AdjunctsData( ) # dummy value
     attribute: object
-    for name, attribute in __.inspect.getmembers( possessor ):
+    # Static access to avoid triggering lazy attribute loaders.
+    for name, attribute in sorted( possessor.__dict__.items( ) ):
         if name in annotations: continue # already processed
         if not _is_attribute_visible(
             possessor, name, _interfaces.absent, context, adjuncts, None
@@ -546,6 +940,64 @@ def _introspect_module_attributes(
     return informations
 
 
+def _introspect_module_attributes_lazy(
+    possessor: __.types.ModuleType, /,
+    context: _context.Context,
+    annotations: __.cabc.Mapping[ str, __.typx.Any ],
+) -> __.cabc.Sequence[ _interfaces.InformationBase ]:
+    ''' Introspects lazily-loaded attributes of a module.
+
+        Considers names from ``__all__`` which are absent from the module
+        dictionary. These are documented without being loaded, so their
+        values are suppressed.
+    '''
+    publics = possessor.__dict__.get( '__all__', ( ) )
+    attributes = possessor.__dict__
+    informations: list[ _interfaces.InformationBase ] = [ ]
+    adjuncts = _interfaces.AdjunctsData( ) # dummy value
+    for name in publics:
+        if name in attributes or name in annotations: continue
+        if not _is_attribute_visible(
+            possessor, name, _interfaces.absent, context, adjuncts, None
+        ): continue
+        informations.append( _interfaces.AttributeInformation(
+            name = name,
+            annotation = _interfaces.absent,
+            description = None,
+            association = _interfaces.AttributeAssociations.Module,
+            default = _default_suppress ) )
+    return informations
+
+
+def _introspect_class_fields( # noqa: PLR0913
+    possessor: type, /,
+    context: _context.Context,
+    introspection: _context.IntrospectionControl,
+    fields: __.cabc.Iterable[
+        tuple[ str, _interfaces.AttributeAssociations, bool ] ],
+    cache: _interfaces.AnnotationsCache,
+    table: _nomina.FragmentsTable,
+) -> _interfaces.Informations:
+    ''' Introspects fields already computed by class framework.
+
+        Each field is described by its name, association, and whether it
+        has a default value. Fields without annotations are documented
+        without them.
+    '''
+    records = _access_class_annotations_records(
+        possessor, context, introspection, table )
+    reductions = _merge_class_annotations_reductions(
+        records, context, cache, table )
+    informations: list[ _interfaces.InformationBase ] = [ ]
+    for name, association, defaulted in fields:
+        reduction = reductions.get( name, _reduction_absent )
+        information = _produce_class_attribute_information(
+            possessor, name, reduction, context,
+            association = association, defaulted = defaulted )
+        if information is not None: informations.append( information )
+    return tuple( informations )
+
+
 def _is_attribute_visible( # noqa: PLR0913
     possessor: _nomina.Documentable,
     name: str,
@@ -572,6 +1024,285 @@ def _is_attribute_visible( # noqa: PLR0913
                 possessor, name, annotation, description )
 
 
+def _is_resolution_cacheable(
+    result: __.typx.Any, owner: object, context: _context.Context
+) -> bool:
+    ''' Can resolution be cached without keeping its owner alive? '''
+    if result is _unresolvable: return True
+    if not isinstance( owner, type ):
+        return not _references_owner( result, owner )
+    return (
+            context.resolver_globals is None
+        and context.resolver_locals is None
+        and not _references_collectables( result ) )
+
+
+def _merge_adjuncts(
+    adjuncts: _interfaces.AdjunctsData,
+    adjuncts_r: _interfaces.AdjunctsData,
+) -> None:
+    ''' Merges adjuncts data from reduction into adjuncts data. '''
+    adjuncts.extras.extend( adjuncts_r.extras )
+    traits = adjuncts.traits # Frozen container. Union in place.
+    traits |= adjuncts_r.traits
+
+
+def _merge_class_annotations_reductions(
+    records: __.cabc.Sequence[ _ClassAnnotationsRecord ],
+    context: _context.Context,
+    cache: _interfaces.AnnotationsCache,
+    table: _nomina.FragmentsTable,
+) -> __.cabc.Mapping[ str, _AnnotationReduction ]:
+    ''' Merges reduced annotations from records.
+
+        Descendant reductions override ancestor reductions.
+    '''
+    if len( records ) == 1:
+        return _access_class_annotations_reductions(
+            records[ 0 ], context, cache, table )
+    reductions: dict[ str, _AnnotationReduction ] = { }
+    for record in records:
+        reductions.update(
+            _access_class_annotations_reductions(
+                record, context, cache, table ) )
+    return reductions
+
+
+def _parse_annotation(
+    string: str,
+    namespace: _ResolutionNamespace,
+    context: _context.Context,
+) -> tuple[ __.typx.Any, bool ]:
+    ''' Reconstructs annotation from parse tree of its string form.
+
+        Returns reconstructed annotation and whether it is complete.
+        Unresolvable names are left as strings within the reconstruction.
+    '''
+    tree = _parse_annotation_string( string )
+    if tree is None: return _unresolvable, False
+    unresolved: list[ str ] = [ ]
+    annotation = _reconstruct_annotation(
+        tree, namespace, context, unresolved )
+    return annotation, not unresolved
+
+
+@__.funct.lru_cache( maxsize = 4096 )
+def _parse_annotation_string( string: str ) -> __.typx.Optional[ __.ast.expr ]:
+    ''' Parses annotation string. Shared across all namespaces. '''
+    try: return __.ast.parse( string.strip( ), mode = 'eval' ).body
+    except SyntaxError: return None
+
+
+def _produce_class_attribute_information( # noqa: PLR0913
+    possessor: type,
+    name: str,
+    reduction: _AnnotationReduction,
+    context: _context.Context,
+    association: __.typx.Optional[
+        _interfaces.AttributeAssociations ] = None,
+    defaulted: bool = True,
+) -> __.typx.Optional[ _interfaces.AttributeInformation ]:
+    ''' Produces information on class attribute from reduced annotation.
+
+        Returns None if the attribute is not visible. If association is not
+        supplied, then it is determined from the annotation.
+    '''
+    annotation_ = reduction.annotation
+    adjuncts = reduction.adjuncts
+    description = reduction.description
+    if not _is_attribute_visible(
+        possessor, name, annotation_, context, adjuncts, description
+    ): return None
+    if association is None:
+        association = (
+            _interfaces.AttributeAssociations.Class
+            if 'ClassVar' in adjuncts.traits
+            else _interfaces.AttributeAssociations.Instance )
+    default = (
+        _determine_default_valuator( context, adjuncts ) if defaulted
+        else _default_suppress )
+    return _interfaces.AttributeInformation(
+        name = name,
+        annotation = annotation_,
+        description = description,
+        association = association,
+        default = default )
+
+
+def _produce_resolution_namespace(
+    possessor: _nomina.Documentable, context: _context.Context
+) -> _ResolutionNamespace:
+    ''' Produces namespace for resolution of annotations on possessor.
+
+        Globals are from module of possessor. Locals are the resolver locals,
+        class namespace (if possessor is class), and resolver globals, in
+        order of precedence.
+    '''
+    owner: __.typx.Optional[ object ] = None
+    locals_: list[ __.cabc.Mapping[ str, __.typx.Any ] ] = [ ]
+    if context.resolver_locals is not None:
+        locals_.append( context.resolver_locals )
+    if __.inspect.ismodule( possessor ):
+        globals_ = possessor.__dict__
+        owner = possessor
+    else:
+        mname = getattr( possessor, '__module__', None )
+        module = __.sys.modules.get( mname ) if mname else None
+        globals_ = (
+            getattr( possessor, '__globals__', None )
+            or ( module.__dict__ if module is not None else { } ) )
+        if __.inspect.isclass( possessor ):
+            locals_.append( possessor.__dict__ )
+            owner = possessor
+        elif module is not None and module.__dict__ is globals_:
+            owner = module
+    if context.resolver_globals is not None:
+        locals_.append( context.resolver_globals )
+    resolutions = None
+    if owner is not None:
+        resolutions = _resolutions.get( owner )
+        if resolutions is None:
+            resolutions = _resolutions[ owner ] = { }
+    # Chain map only reads from its maps here.
+    maps = __.typx.cast(
+        list[ __.cabc.MutableMapping[ str, __.typx.Any ] ], locals_ )
+    return _ResolutionNamespace(
+        globals = globals_,
+        locals = __.collections.ChainMap( *maps ) if maps else None,
+        owner = owner,
+        resolutions = resolutions )
+
+
+def _reconstruct_annotation( # noqa: PLR0911
+    node: __.ast.expr,
+    namespace: _ResolutionNamespace,
+    context: _context.Context,
+    unresolved: list[ str ],
+) -> __.typx.Any:
+    ''' Reconstructs annotation from node of parse tree.
+
+        Only names, attributes, and ``Annotated`` metadata are evaluated.
+        Anything which cannot be evaluated or reconstructed is left as its
+        source text and recorded as unresolved.
+    '''
+    def evaluate( node_: __.ast.expr ) -> __.typx.Any:
+        source = __.ast.unparse( node_ )
+        result = _resolve_annotation( source, namespace, context )
+        if result is source: unresolved.append( source )
+        return result
+
+    match node:
+        case __.ast.Constant( value = str( ) as value ): # Nested string.
+            tree = _parse_annotation_string( value )
+            if tree is None:
+                unresolved.append( value )
+                return value
+            return _reconstruct_annotation(
+                tree, namespace, context, unresolved )
+        case __.ast.Constant( value = value ): return value
+        case __.ast.Name( ) | __.ast.Attribute( ): return evaluate( node )
+        case __.ast.List( elts = elements ):
+            return [
+                _reconstruct_annotation(
+                    element, namespace, context, unresolved )
+                for element in elements ]
+        case __.ast.BinOp( left = left, op = __.ast.BitOr( ), right = right ):
+            operands = tuple(
+                _reconstruct_annotation(
+                    operand, namespace, context, unresolved )
+                for operand in ( left, right ) )
+            try: return __.typx.Union[ operands ] # pyright: ignore
+            except TypeError: return evaluate( node )
+        case __.ast.Subscript( value = value, slice = slice_ ):
+            return _reconstruct_annotation_subscript(
+                node, value, slice_, namespace, context, unresolved )
+        case _: return evaluate( node )
+
+
+def _reconstruct_annotation_subscript( # noqa: PLR0913
+    node: __.ast.Subscript,
+    value: __.ast.expr,
+    slice_: __.ast.expr,
+    namespace: _ResolutionNamespace,
+    context: _context.Context,
+    unresolved: list[ str ],
+) -> __.typx.Any:
+    ''' Reconstructs subscripted annotation from node of parse tree. '''
+    origin = _reconstruct_annotation( value, namespace, context, unresolved )
+    if isinstance( origin, str ): # Unresolved origin; keep source text.
+        source = __.ast.unparse( node )
+        unresolved.append( source )
+        return source
+    elements = (
+        slice_.elts if isinstance( slice_, __.ast.Tuple ) else [ slice_ ] )
+    arguments: list[ __.typx.Any ]
+    if origin is __.typx.Literal:
+        try: arguments = [ __.ast.literal_eval( e ) for e in elements ]
+        except ValueError:
+            source = __.ast.unparse( node )
+            unresolved.append( source )
+            return source
+    elif origin is __.typx.Annotated:
+        arguments = [ _reconstruct_annotation(
+            elements[ 0 ], namespace, context, unresolved ) ]
+        for element in elements[ 1 : ]:
+            source = __.ast.unparse( element )
+            metadata = _resolve_annotation( source, namespace, context )
+            if metadata is source: unresolved.append( source )
+            else: arguments.append( metadata )
+        if len( arguments ) == 1: return arguments[ 0 ]
+    else:
+        arguments = [
+            _reconstruct_annotation( element, namespace, context, unresolved )
+            for element in elements ]
+    try:
+        return origin[
+            arguments[ 0 ] if len( arguments ) == 1 else tuple( arguments ) ]
+    except TypeError:
+        source = __.ast.unparse( node )
+        unresolved.append( source )
+        return source
+
+
+def _reduce_annotation(
+    annotation: __.typx.Any,
+    context: _context.Context,
+    adjuncts: _interfaces.AdjunctsData,
+    cache: _interfaces.AnnotationsCache,
+) -> __.typx.Any:
+    ''' Reduces annotation, consulting and populating cache. '''
+    annotation_r = cache.access( annotation )
+    # Avoid infinite recursion from reference cycles.
+    if annotation_r is _interfaces.incomplete:
+        context.notify(
+            'admonition',
+            lambda: (
+                f"Annotation with circular reference {annotation!r}; "
+                "returning Any." ),
+            code = 'annotation-circular',
+            qualname = __.qualify_object( annotation ) )
+        return cache.enter( annotation, __.typx.Any )
+    if annotation_r is not _interfaces.absent:
+        adjuncts_r = cache.access_adjuncts( annotation )
+        if adjuncts_r is not None: # Short-circuit on complete cache hit.
+            _counters.tallies.cache_hits += 1
+            _merge_adjuncts( adjuncts, adjuncts_r )
+            return annotation_r
+    _counters.tallies.cache_misses += 1
+    if isinstance( annotation, str ): # Cannot do much with unresolved strings.
+        return cache.enter( annotation, annotation )
+    if isinstance( annotation, __.typx.ForwardRef ): # Extract string.
+        return cache.enter( annotation, annotation.__forward_arg__ )
+    cache.enter( annotation ) # mark as incomplete
+    # Reduction does not depend on incoming adjuncts data,
+    # so collect fresh adjuncts data which can be reused on cache hits.
+    adjuncts_r = _interfaces.AdjunctsData( )
+    annotation_r = _reduce_annotation_core(
+        annotation, context, adjuncts_r, cache )
+    _merge_adjuncts( adjuncts, adjuncts_r )
+    return cache.enter( annotation, annotation_r, adjuncts = adjuncts_r )
+
+
 def _reduce_annotation_arguments(
     origin: __.typx.Any,
     arguments: __.cabc.Sequence[ __.typx.Any ],
@@ -589,10 +1320,114 @@ def _reduce_annotation_arguments(
         return _reduce_annotation_for_callable(
             arguments, context, adjuncts.copy( ), cache )
     return tuple(
-        reduce_annotation( argument, context, adjuncts.copy( ), cache )
+        _reduce_annotation( argument, context, adjuncts.copy( ), cache )
         for argument in arguments )
 
 
+def _references_collectables( annotation: __.typx.Any ) -> bool:
+    ''' Determines if annotation references objects which may be collected.
+
+        Origins and arguments of generic annotations, classes of raises
+        annotations, and surrogates of defaults are considered. Other
+        objects are permanent only if their modules are.
+    '''
+    if isinstance( annotation, _primitives ): return False
+    if isinstance( annotation, _interfaces.Raises ):
+        classes = annotation.classes
+        if isinstance( classes, type ): classes = ( classes, )
+        return any( map( _references_collectables, classes ) )
+    if isinstance( annotation, _interfaces.Default ):
+        return _references_collectables( annotation.surrogate )
+    components: __.cabc.Sequence[ __.typx.Any ]
+    if isinstance( annotation, list ): # Callable parameters.
+        components = __.typx.cast( list[ __.typx.Any ], annotation )
+    else:
+        origin = __.typx.get_origin( annotation )
+        if origin is None:
+            holder = (
+                annotation if isinstance( annotation, type )
+                else type( annotation ) )
+            return holder.__module__ not in _modules_permanent
+        components = ( origin, *__.typx.get_args( annotation ) )
+    return any( map( _references_collectables, components ) )
+
+
+def _references_owner( annotation: __.typx.Any, owner: object ) -> bool:
+    ''' Determines if annotation references owner of its namespace.
+
+        Origins and arguments of generic annotations, including those of
+        callables, are considered.
+    '''
+    if annotation is owner: return True
+    components: __.cabc.Iterable[ __.typx.Any ] = (
+        __.typx.cast( list[ __.typx.Any ], annotation )
+        if isinstance( annotation, list ) # Callable parameters.
+        else (  __.typx.get_origin( annotation ),
+                *__.typx.get_args( annotation ) ) )
+    return any(
+        _references_owner( component, owner )
+        for component in components if component is not None )
+
+
+def _resolve_annotation(
+    annotation: str | __.typx.ForwardRef,
+    namespace: _ResolutionNamespace,
+    context: _context.Context,
+    parse: bool = False,
+) -> __.typx.Any:
+    ''' Resolves string annotation or forward reference, if possible.
+
+        Results are cached per namespace. Failures and partial resolutions
+        are cached too, but are retried if the module namespace has grown
+        since, as names defined later in a module may become available.
+    '''
+    string = (
+        annotation if isinstance( annotation, str )
+        else annotation.__forward_arg__ )
+    rglobals = context.resolver_globals
+    rlocals = context.resolver_locals
+    key = ( string, id( rglobals ), id( rlocals ), parse )
+    resolutions = namespace.resolutions
+    if resolutions is not None and ( entry := resolutions.get( key ) ):
+        rglobals_, rlocals_, result, size = entry
+        if (    rglobals_ is rglobals and rlocals_ is rlocals
+            and size in ( None, len( namespace.globals ) )
+        ): return annotation if result is _unresolvable else result
+    if parse:
+        result, complete = _parse_annotation( string, namespace, context )
+    else:
+        complete = True
+        try: result = _evaluate_string( string, namespace )
+        except Exception:
+            result, complete = _unresolvable, False
+    if resolutions is not None and _is_resolution_cacheable(
+        result, namespace.owner, context
+    ):
+        size = None if complete else len( namespace.globals )
+        resolutions[ key ] = ( rglobals, rlocals, result, size )
+    return annotation if result is _unresolvable else result
+
+
+def _resolve_annotations(
+    possessor: _nomina.Documentable,
+    annotations: __.cabc.Mapping[ str, __.typx.Any ],
+    context: _context.Context,
+    parse: bool = False,
+) -> __.cabc.Mapping[ str, __.typx.Any ]:
+    ''' Resolves string annotations and forward references in mapping. '''
+    if not any(
+        isinstance( annotation, ( str, __.typx.ForwardRef ) )
+        for annotation in annotations.values( )
+    ): return annotations
+    namespace = _produce_resolution_namespace( possessor, context )
+    return {
+        name: (
+            _resolve_annotation( annotation, namespace, context, parse )
+            if isinstance( annotation, ( str, __.typx.ForwardRef ) )
+            else annotation )
+        for name, annotation in annotations.items( ) }
+
+
 def _reduce_annotation_core(
     annotation: __.typx.Any,
     context: _context.Context,
@@ -614,7 +1449,7 @@ def _reduce_annotation_core(
     if not arguments: return annotation
     if origin is __.typx.Annotated:
         adjuncts.extras.extend( arguments[ 1 : ] )
-        return reduce_annotation(
+        return _reduce_annotation(
             annotation.__origin__, context, adjuncts, cache )
     return _filter_reconstitute_annotation(
         origin, arguments, context, adjuncts, cache )
@@ -637,8 +1472,8 @@ def _reduce_annotation_for_callable(
         farguments_r = Ellipsis
     else:
         farguments_r = [
-            reduce_annotation( element, context, adjuncts.copy( ), cache )
+            _reduce_annotation( element, context, adjuncts.copy( ), cache )
             for element in farguments ]
     freturn_r = (
-        reduce_annotation( freturn, context, adjuncts.copy( ), cache ) )
+        _reduce_annotation( freturn, context, adjuncts.copy( ), cache ) )
     return ( farguments_r, freturn_r )
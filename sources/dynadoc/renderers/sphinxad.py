@@ -137,8 +137,9 @@ def _produce_fragment_partial(
     if isinstance( information, __.ReturnInformation ):
         return (
             _produce_return_text( possessor, information, context, style ) )
-    context.notifier(
-        'admonition', f"Unrecognized information: {information!r}" )
+    context.notify(
+        'admonition', lambda: f"Unrecognized information: {information!r}",
+        code = 'information-unrecognized' )
     return ''
 
 
@@ -212,7 +213,8 @@ def _produce_module_attribute_text(
     name = information.name
     match information.default.mode:
         case __.ValuationModes.Accept:
-            value = getattr( possessor, name, __.absent )
+            # Static access to avoid triggering lazy attribute loaders.
+            value = possessor.__dict__.get( name, __.absent )
         case __.ValuationModes.Suppress:
             value = __.absent
         case __.ValuationModes.Surrogate: # pragma: no branch
@@ -295,7 +297,12 @@ def _qualify_object_name( # noqa: PLR0911
 
         Determines the appropriate fully-qualified name for an object,
         considering builtin types, module namespaces, and qualname attributes.
+        Objects from the documentables index of the context, if any, are
+        qualified from their precomputed names.
     '''
+    if context.index is not None:
+        entry = context.index.access( objct )
+        if entry is not None: return _qualify_indexed_name( entry, context )
     if objct is Ellipsis: return '...'
     if objct is __.types.NoneType: return 'None'
     if objct is __.types.ModuleType: return 'types.ModuleType'
@@ -314,6 +321,18 @@ def _qualify_object_name( # noqa: PLR0911
     return name # pragma: no cover
 
 
+def _qualify_indexed_name(
+    entry: __.DocumentableEntry, context: __.Context
+) -> str:
+    ''' Qualifies name of indexed object for documentation. '''
+    name0 = entry.qname_head
+    if not name0: return entry.mname # module
+    if name0 in vars( __.builtins ): return entry.qname
+    if context.invoker_globals and name0 in context.invoker_globals:
+        return entry.qname
+    return entry.fqname
+
+
 def _stylize_delimiter(
     style: Style,
     delimiters: str,
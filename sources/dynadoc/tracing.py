@@ -0,0 +1,167 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Traces of docstring assembly by hierarchy of decorated objects.
+
+    If the ``DYNADOC_TRACE`` environment variable names a file, then a
+    trace is recorded and written to that file when the process exits.
+    The trace is written in speedscope JSON format, if the file name ends
+    with ``.json``, and in collapsed-stack format otherwise.
+'''
+
+
+from . import __
+from . import interfaces as _interfaces
+from . import nomina as _nomina
+
+
+trace_variable_name = 'DYNADOC_TRACE'
+
+
+class TraceFormats( __.enum.Enum ):
+    ''' Formats in which traces can be written. '''
+
+    Collapsed   = __.enum.auto( ) # 'frame;frame;frame weight' per line
+    Speedscope  = __.enum.auto( ) # https://www.speedscope.app
+
+
+@__.dcls.dataclass( kw_only = True, slots = True )
+class Tracer:
+    ''' Records self time of decorations by stacks of object names.
+
+        Frames are named for modules, classes, functions, and property
+        getters, so that time is attributed to the hierarchy of decorated
+        objects rather than to internal functions.
+    '''
+
+    weights: __.typx.Annotated[
+        __.collections.Counter[ tuple[ str, ... ] ],
+        _interfaces.Doc( ''' Nanoseconds of self time by stack. ''' ),
+    ] = __.dcls.field(
+        default_factory = __.collections.Counter[ tuple[ str, ... ] ] )
+    stacks: __.typx.Annotated[
+        __.threading.local,
+        _interfaces.Doc( ''' Stacks of open frames per thread. ''' ),
+    ] = __.dcls.field( default_factory = __.threading.local, repr = False )
+
+    def enter( self, objct: _nomina.Documentable ) -> None:
+        ''' Enters frame for decoration of object. '''
+        stack = self._access_stack( )
+        if stack: names = ( *stack[ -1 ][ 0 ], _name_frame( objct ) )
+        else: names = _name_frames( objct )
+        stack.append( [ names, __.time.perf_counter_ns( ), 0 ] )
+
+    def exit( self ) -> None:
+        ''' Exits frame for most recently entered decoration. '''
+        stack = self._access_stack( )
+        names, start, children = stack.pop( )
+        elapsed = __.time.perf_counter_ns( ) - start
+        self.weights[ names ] += elapsed - children
+        if stack: stack[ -1 ][ 2 ] += elapsed
+
+    def render_collapsed( self ) -> str:
+        ''' Renders trace in collapsed-stack format. '''
+        return ''.join(
+            "{} {}\n".format( ';'.join( names ), weight )
+            for names, weight in sorted( self.weights.items( ) ) )
+
+    def render_speedscope( self ) -> str:
+        ''' Renders trace in speedscope JSON format. '''
+        frames: dict[ str, int ] = { }
+        samples: list[ list[ int ] ] = [ ]
+        weights: list[ int ] = [ ]
+        for names, weight in sorted( self.weights.items( ) ):
+            samples.append( [
+                frames.setdefault( name, len( frames ) ) for name in names ] )
+            weights.append( weight )
+        document: dict[ str, __.typx.Any ] = {
+            '$schema': 'https://www.speedscope.app/file-format-schema.json',
+            'exporter': 'dynadoc',
+            'name': 'dynadoc',
+            'shared': { 'frames': [ { 'name': name } for name in frames ] },
+            'profiles': [ {
+                'type': 'sampled',
+                'name': 'docstring assembly',
+                'unit': 'nanoseconds',
+                'startValue': 0,
+                'endValue': sum( weights ),
+                'samples': samples,
+                'weights': weights,
+            } ],
+        }
+        return __.json.dumps( document )
+
+    def save(
+        self,
+        location: str | __.os.PathLike[ str ],
+        trace_format: __.typx.Optional[ TraceFormats ] = None,
+    ) -> None:
+        ''' Writes trace to file.
+
+            If no format is given, then it is inferred from the file name.
+        '''
+        location = __.Path( location )
+        if trace_format is None:
+            trace_format = (
+                TraceFormats.Speedscope if location.suffix == '.json'
+                else TraceFormats.Collapsed )
+        match trace_format:
+            case TraceFormats.Speedscope: content = self.render_speedscope( )
+            case TraceFormats.Collapsed: content = self.render_collapsed( )
+        location.write_text( content, encoding = 'utf-8' )
+
+    def _access_stack( self ) -> list[ list[ __.typx.Any ] ]:
+        ''' Accesses stack of open frames for current thread. '''
+        try: return self.stacks.stack
+        except AttributeError:
+            stack: list[ list[ __.typx.Any ] ] = [ ]
+            self.stacks.stack = stack
+            return stack
+
+
+def _name_frame( objct: _nomina.Documentable ) -> str:
+    ''' Names frame for object within frame of its possessor. '''
+    if __.inspect.ismodule( objct ): return objct.__name__
+    name = getattr( objct, '__qualname__', None ) or repr( objct )
+    return name.rpartition( '.' )[ 2 ]
+
+
+def _name_frames( objct: _nomina.Documentable ) -> tuple[ str, ... ]:
+    ''' Names frames for object and its enclosing packages and modules. '''
+    if __.inspect.ismodule( objct ): mname = objct.__name__
+    else: mname = getattr( objct, '__module__', None ) or ''
+    parts = mname.split( '.' ) if mname else [ ]
+    names = [ '.'.join( parts[ : i + 1 ] ) for i in range( len( parts ) ) ]
+    if not __.inspect.ismodule( objct ):
+        qname = getattr( objct, '__qualname__', None ) or repr( objct )
+        names.extend( qname.split( '.' ) )
+    return tuple( names )
+
+
+def _activate_from_environment( ) -> __.typx.Optional[ Tracer ]:
+    ''' Activates tracer, if environment names file for trace. '''
+    location = __.os.environ.get( trace_variable_name )
+    if not location: return None
+    tracer_ = Tracer( )
+    __.atexit.register( tracer_.save, location )
+    return tracer_
+
+
+tracer: __.typx.Optional[ Tracer ] = _activate_from_environment( )
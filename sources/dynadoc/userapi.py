@@ -23,8 +23,17 @@
 # ruff: noqa: F401,F403
 
 
-from .assembly import assign_module_docstring, exclude, with_docstring
+from .assembly import (
+    assign_module_docstring,
+    exclude,
+    produce_docstrings,
+    produce_fingerprint,
+    reset_visitees,
+    with_docstring,
+    with_docstring_template,
+)
 from .context import *
+from .counters import Statistics, access_statistics, reset_statistics
 from .factories import *
 from .interfaces import (
     Default,
@@ -32,8 +41,13 @@ from .interfaces import (
     Fname,
     FragmentRectifier,
     FragmentSources,
+    InstrumentationEvent,
+    InstrumentationStages,
+    Instrumenter,
+    Notification,
     Notifier,
     Raises,
+    ResolutionModes,
     ValuationModes,
     Visibilities,
     VisibilityDecider,
@@ -46,14 +46,30 @@ FragmentsArgumentMultivalent: __.typx.TypeAlias = __.typx.Annotated[
 ]
 FragmentsNameArgument: __.typx.TypeAlias = __.typx.Annotated[
     str, Fname( 'fragments name' ) ]
+IncrementalArgument: __.typx.TypeAlias = __.typx.Annotated[
+    bool,
+    Doc(
+        ''' Reuse docstrings for objects with unchanged inputs?
+
+            Allows modules to be decorated again after they are reloaded.
+            Docstrings are reassembled only for objects with changed
+            annotations, fragments, extant docstrings, or settings.
+        ''' ),
+]
+InstrumenterArgument: __.typx.TypeAlias = __.typx.Annotated[
+    __.typx.Optional[ Instrumenter ], Fname( 'instrumenter' ) ]
 IntrospectionLimitNameArgument: __.typx.TypeAlias = __.typx.Annotated[
     str, Fname( 'introspection limit name' ) ]
 InvokerGlobalsArgument: __.typx.TypeAlias = __.typx.Annotated[
     __.typx.Optional[ Variables ], Fname( 'invoker globals' ) ]
+InvokerGlobalsAutomaticArgument: __.typx.TypeAlias = __.typx.Annotated[
+    bool, Fname( 'invoker globals automatic' ) ]
 NotifierArgument: __.typx.TypeAlias = __.typx.Annotated[
     Notifier, Fname( 'notifier' ) ]
 PreserveArgument: __.typx.TypeAlias = __.typx.Annotated[
     bool, Doc( ''' Preserve extant docstring? ''' ) ]
+ResolutionModeArgument: __.typx.TypeAlias = __.typx.Annotated[
+    ResolutionModes, Fname( 'resolution mode' ) ]
 ResolverGlobalsArgument: __.typx.TypeAlias = __.typx.Annotated[
     __.typx.Optional[ Variables ], Fname( 'resolver globals' ) ]
 ResolverLocalsArgument: __.typx.TypeAlias = __.typx.Annotated[
@@ -21,6 +21,7 @@
 ''' Common test utilities and helpers. '''
 
 
+import textwrap
 import types
 
 from pathlib import Path
@@ -61,4 +62,99 @@ PACKAGES_NAMES_BY_MODULE_QNAME = types.MappingProxyType( {
 MODULES_QNAMES = tuple( PACKAGES_NAMES_BY_MODULE_QNAME.keys( ) )
 MODULES_NAMES_BY_MODULE_QNAME = types.MappingProxyType( {
     name: name.rsplit( '.', maxsplit = 1 )[ -1 ]
-    for name in PACKAGES_NAMES_BY_MODULE_QNAME } )
\ No newline at end of file
+    for name in PACKAGES_NAMES_BY_MODULE_QNAME } )
+
+
+SYNTHETIC_WORKLOADS = types.MappingProxyType( {
+    'small': dict( functions = 8, classes = 2, depth = 1, width = 2 ),
+    'wide': dict( functions = 32, classes = 8, depth = 1, width = 32 ),
+    'deep': dict( functions = 32, classes = 8, depth = 8, width = 4 ),
+    'large': dict(
+        functions = 256, parameters = 8, classes = 64, methods = 8,
+        depth = 2, width = 8 ),
+} )
+
+
+def decorate_synthetic_module( module: types.ModuleType ) -> None:
+    ''' Assigns docstrings to module and all of its members, silently. '''
+    assembly = cache_import_module( f"{PACKAGE_NAME}.assembly" )
+    context_module = cache_import_module( f"{PACKAGE_NAME}.context" )
+    factories = cache_import_module( f"{PACKAGE_NAME}.factories" )
+    context = factories.produce_context(
+        notifier = lambda level, message: None )
+    introspection = context_module.IntrospectionControl(
+        targets = context_module.IntrospectionTargetsOmni )
+    assembly.assign_module_docstring(
+        module, context = context, introspection = introspection )
+
+
+def produce_synthetic_module(
+    name: str, *,
+    functions: int = 16,
+    parameters: int = 4,
+    classes: int = 4,
+    attributes: int = 4,
+    methods: int = 4,
+    depth: int = 2,
+    width: int = 4,
+) -> types.ModuleType:
+    ''' Produces module with synthetic documentable objects.
+
+        Annotations are unions of ``width`` member classes, nested within
+        ``depth`` levels of alternating lists and dictionaries. Each function
+        and class uses a different rotation of the members, so that its
+        annotations are distinct objects.
+    '''
+    lines = [ 'import typing' ]
+    lines.extend(
+        f"class Member{i}:\n    ''' Member {i}. '''"
+        for i in range( width ) )
+    lines.extend(
+        _produce_synthetic_function(
+            f"function{i}", i, parameters, depth, width )
+        for i in range( functions ) )
+    for i in range( classes ):
+        lines.append( f"class Class{i}:\n    ''' Class {i}. '''" )
+        lines.extend(
+            f"    attribute{j}: "
+            f"{_produce_synthetic_annotation( i + j, depth, width )}"
+            for j in range( attributes ) )
+        lines.extend(
+            textwrap.indent(
+                _produce_synthetic_function(
+                    f"method{j}", i + j, parameters, depth, width,
+                    method = True ),
+                '    ' )
+            for j in range( methods ) )
+    module = types.ModuleType( name )
+    exec( '\n'.join( lines ), module.__dict__ ) # noqa: S102
+    return module
+
+
+def _produce_synthetic_annotation(
+    rotation: int, depth: int, width: int
+) -> str:
+    members = [ f"Member{( rotation + i ) % width}" for i in range( width ) ]
+    annotation = (
+        f"typing.Union[ {', '.join( members )} ]" if width > 1
+        else members[ 0 ] )
+    for level in range( depth ):
+        annotation = (
+            f"list[ {annotation} ]" if level % 2 == 0
+            else f"dict[ str, {annotation} ]" )
+    return annotation
+
+
+def _produce_synthetic_function(
+    name: str, rotation: int, parameters: int, depth: int, width: int,
+    method: bool = False,
+) -> str:
+    arguments = [ 'self' ] if method else [ ]
+    arguments.extend(
+        "argument{}: {}".format(
+            i, _produce_synthetic_annotation( rotation + i, depth, width ) )
+        for i in range( parameters ) )
+    freturn = _produce_synthetic_annotation( rotation, depth, width )
+    return (
+        f"def {name}( {', '.join( arguments )} ) -> {freturn}:\n"
+        f"    ''' Function {name}. '''" )
@@ -23,9 +23,9 @@
 
 import warnings
 
-from .__ import PACKAGE_NAME, cache_import_module
+import pytest
 
-# import pytest
+from .__ import PACKAGE_NAME, cache_import_module
 
 
 MODULE_QNAME = f"{PACKAGE_NAME}.context"
@@ -50,3 +50,133 @@ def test_020_context_with_invoker_globals( ):
     context_ig = context.with_invoker_globals( level = 1 )
     assert 'PACKAGE_NAME' in context_ig.invoker_globals
     assert PACKAGE_NAME == context_ig.invoker_globals[ 'PACKAGE_NAME' ]
+
+
+def test_021_context_with_invoker_globals_beyond_stack( ):
+    ''' Levels beyond the stack raise index error. '''
+    module = cache_import_module( MODULE_QNAME )
+    context = module.Context(
+        notifier = _notify,
+        fragment_rectifier = _rectify_fragment,
+        visibility_decider = _is_attribute_visible )
+    with pytest.raises( IndexError ):
+        context.with_invoker_globals( level = 10000 )
+    with pytest.raises( IndexError ):
+        module._access_frame_globals( 10000 )
+
+
+def test_030_context_notify_formats_lazily( ):
+    ''' Message factories are invoked only for enabled levels. '''
+    module = cache_import_module( MODULE_QNAME )
+    factories = cache_import_module( f"{PACKAGE_NAME}.factories" )
+    received = [ ]
+    invocations = [ ]
+    def produce_message( ):
+        invocations.append( None )
+        return 'Formatted message.'
+    context = module.Context(
+        notifier = factories.FilteredNotifier(
+            notifier = lambda level, message: received.append(
+                ( level, message ) ),
+            levels = frozenset( ( 'error', ) ) ),
+        fragment_rectifier = _rectify_fragment,
+        visibility_decider = _is_attribute_visible )
+    assert not context.is_notification_enabled( 'admonition' )
+    assert context.is_notification_enabled( 'error' )
+    context.notify( 'admonition', produce_message )
+    assert not invocations
+    assert not received
+    context.notify( 'error', produce_message )
+    assert len( invocations ) == 1
+    assert received == [ ( 'error', 'Formatted message.' ) ]
+    context_ = module.Context(
+        notifier = lambda level, message: received.append(
+            ( level, message ) ),
+        fragment_rectifier = _rectify_fragment,
+        visibility_decider = _is_attribute_visible )
+    assert context_.is_notification_enabled( 'admonition' )
+    context_.notify( 'admonition', produce_message )
+    assert len( invocations ) == 2
+
+
+def test_040_context_notify_filters_buffered_levels( ):
+    ''' Buffered notifications at disabled levels are not formatted. '''
+    module = cache_import_module( MODULE_QNAME )
+    factories = cache_import_module( f"{PACKAGE_NAME}.factories" )
+    notifier = factories.BufferedNotifier(
+        emitter = _notify,
+        flush_at_exit = False,
+        levels = frozenset( ( 'error', ) ) )
+    context = module.Context(
+        notifier = factories.FilteredNotifier(
+            notifier = notifier,
+            levels = frozenset( ( 'admonition', 'error' ) ) ),
+        fragment_rectifier = _rectify_fragment,
+        visibility_decider = _is_attribute_visible )
+    assert not context.is_notification_enabled( 'admonition' )
+    context.notify( 'admonition', lambda: 1 / 0 )
+    context.notify( 'error', lambda: 'Message.', code = 'example' )
+    assert list( notifier.notifications ) == [
+        module._interfaces.Notification(
+            level = 'error', code = 'example', message = 'Message.' ) ]
+
+
+def test_100_introspection_rules_evaluation( ):
+    ''' Introspection rules match by name, module, and kind, in order. '''
+    module = cache_import_module( MODULE_QNAME )
+    targets = module.IntrospectionTargets
+    ignore_attributes = module.IntrospectionLimit(
+        module_limit = module.ModuleIntrospectionLimit(
+            ignore_attributes = True ) )
+    rules = module.IntrospectionRules( rules = (
+        module.IntrospectionRule( name = '*._internal' ),
+        module.IntrospectionRule(
+            name = 'pkg.generated.*', kinds = targets.Function ),
+        module.IntrospectionRule(
+            module = 'pkg.sub*', limit = ignore_attributes ),
+    ) )
+    excluded = module.IntrospectionLimit( disable = True )
+    assert rules.evaluate( 'pkg.a._internal', 'pkg.a', targets.Module ) == (
+        excluded, )
+    assert rules.evaluate( 'pkg._internals', 'pkg', targets.Module ) == ( )
+    assert rules.evaluate(
+        'pkg.generated.f', 'pkg.generated', targets.Function ) == (
+            excluded, )
+    assert rules.evaluate(
+        'pkg.generated.C', 'pkg.generated', targets.Class ) == ( )
+    assert rules.evaluate(
+        'pkg.sub._internal', 'pkg.sub', targets.Class ) == (
+            excluded, ignore_attributes )
+    introspection = module.IntrospectionControl(
+        rules = rules, targets = module.IntrospectionTargetsOmni )
+    introspection_ = introspection.evaluate_rules_for(
+        'pkg.subsidiary.f', 'pkg.subsidiary', targets.Function )
+    assert introspection_.enable
+    assert introspection_.rules is rules
+    assert not introspection.evaluate_rules_for(
+        'pkg._internal', 'pkg', targets.Module ).enable
+
+
+def test_110_introspection_control_interned_derivations( ):
+    ''' Derived introspection controls are shared and no-ops are elided. '''
+    module = cache_import_module( MODULE_QNAME )
+    introspection = module.IntrospectionControl(
+        class_control = module.ClassIntrospectionControl( inheritance = True ),
+        targets = module.IntrospectionTargetsOmni )
+    assert introspection.with_limit( module.IntrospectionLimit( ) ) is (
+        introspection )
+    limit = module.IntrospectionLimit(
+        class_limit = module.ClassIntrospectionLimit(
+            avoid_inheritance = True ) )
+    introspection_ = introspection.with_limit( limit )
+    assert introspection_ is not introspection
+    assert not introspection_.class_control.inheritance
+    assert introspection_.module_control is introspection.module_control
+    assert introspection.with_limit( limit ) is introspection_
+    assert introspection_.with_limit( limit ) is introspection_
+    # Derivations are held by control, not by process-wide table.
+    assert not hasattr( module, '_derivations' )
+    assert introspection == module.IntrospectionControl(
+        class_control = module.ClassIntrospectionControl( inheritance = True ),
+        targets = module.IntrospectionTargetsOmni )
+    assert not module.IntrospectionControl( )._derivations
@@ -24,6 +24,7 @@
 
 
 import inspect
+import sys
 import types
 
 from .__ import PACKAGE_NAME, cache_import_module
@@ -117,6 +118,8 @@ def test_102_introspect_function_with_signature_error( ):
         pass
     # Add type annotations to make it worth introspecting
     problematic_function.__annotations__ = { 'return': int }
+    # Custom signature forces generic signature inspection.
+    problematic_function.__signature__ = inspect.Signature( )
     # Patch the signature method to raise ValueError
     original_signature = inspect.signature
     def mock_signature( func ):
@@ -199,6 +202,31 @@ def test_104_introspect_function_missing_return_annotation( ):
     assert result[ 0 ].name == 'x'
 
 
+def test_105_access_parameters_from_code( ):
+    ''' Parameter records from code match signature inspection. '''
+    introspection_module = cache_import_module(
+        f"{PACKAGE_NAME}.introspection" )
+    def function(
+        a: int, b = 1, /, c: str = 'c', *d: int, e, f: bool = True, **g
+    ) -> None: pass
+    annotations = function.__annotations__
+    records = introspection_module._access_parameters_from_code(
+        function, annotations )
+    parameters = inspect.signature( function ).parameters.values( )
+    assert len( records ) == len( parameters )
+    for record, parameter in zip( records, parameters ):
+        assert record.name == parameter.name
+        assert record.kind == parameter.kind
+        assert record.default == parameter.default
+        assert record.annotation == parameter.annotation
+    def wrapper( *posargs, **nomargs ): pass
+    wrapper.__wrapped__ = function
+    assert introspection_module._access_parameters_from_code(
+        wrapper, { } ) is None
+    assert introspection_module._access_parameters_from_code(
+        len, { } ) is None
+
+
 def test_200_is_attribute_visible_with_module_all( ):
     ''' is_attribute_visible respects module __all__ when present. '''
     introspection_module = cache_import_module(
@@ -568,3 +596,344 @@ def test_504_introspect_class_scan_attributes( ):
     )
     assert unannotated_info.annotation is interfaces_module.absent
     assert unannotated_info.description is None
+
+
+def test_505_introspect_module_lazy_attributes( ):
+    ''' _introspect_module documents lazy attributes without loading them. '''
+    introspection_module = cache_import_module(
+        f"{PACKAGE_NAME}.introspection" )
+    context_module = cache_import_module( f"{PACKAGE_NAME}.context" )
+    interfaces_module = cache_import_module( f"{PACKAGE_NAME}.interfaces" )
+    context = context_module.Context(
+        notifier = lambda level, msg: None,
+        fragment_rectifier = lambda fragment, source: fragment,
+        visibility_decider = introspection_module.is_attribute_visible )
+    loads = [ ]
+    def load_lazily( name ):
+        loads.append( name )
+        return 42
+    mock_module = types.ModuleType( 'test_lazy_module' )
+    mock_module.__getattr__ = load_lazily
+    mock_module.__all__ = [ 'eager', 'lazy' ]
+    mock_module.eager = 'eager'
+    cache = interfaces_module.AnnotationsCache( )
+    for lazy_attributes, expected_names in (
+        ( False, [ ] ), ( True, [ 'lazy' ] )
+    ):
+        introspection_control = context_module.IntrospectionControl(
+            module_control = context_module.ModuleIntrospectionControl(
+                lazy_attributes = lazy_attributes ) )
+        result = introspection_module._introspect_module(
+            mock_module, context, introspection_control, cache, { } )
+        assert [ info.name for info in result ] == expected_names
+    assert result[ 0 ].annotation is interfaces_module.absent
+    assert result[ 0 ].default.mode is (
+        interfaces_module.ValuationModes.Suppress )
+    limited = introspection_control.with_limit(
+        context_module.IntrospectionLimit(
+            module_limit = context_module.ModuleIntrospectionLimit(
+                ignore_attributes = True ) ) )
+    assert not limited.module_control.lazy_attributes
+    assert loads == [ ]
+
+
+def test_506_introspect_class_inherited_reductions_reused( ):
+    ''' Subclasses reuse reduced annotations of ancestors. '''
+    introspection_module = cache_import_module(
+        f"{PACKAGE_NAME}.introspection" )
+    context_module = cache_import_module( f"{PACKAGE_NAME}.context" )
+    interfaces_module = cache_import_module( f"{PACKAGE_NAME}.interfaces" )
+    possessors = [ ]
+    def visibility_decider( possessor, name, annotation, description ):
+        possessors.append( possessor )
+        return True
+    context = context_module.Context(
+        notifier = lambda level, msg: None,
+        fragment_rectifier = lambda fragment, source: fragment,
+        visibility_decider = visibility_decider )
+    introspection_control = context_module.IntrospectionControl(
+        class_control = context_module.ClassIntrospectionControl(
+            inheritance = True ) )
+    table = { }
+    class Base:
+        base_attr: int
+    class Leaf1( Base ):
+        leaf_attr: str
+    class Leaf2( Base ): pass
+    records = introspection_module._classes_annotations
+    result1 = introspection_module._introspect_class(
+        Leaf1, context, introspection_control,
+        interfaces_module.AnnotationsCache( ), table )
+    reductions = records[ Base ].reductions
+    result2 = introspection_module._introspect_class(
+        Leaf2, context, introspection_control,
+        interfaces_module.AnnotationsCache( ), table )
+    assert records[ Base ].reductions is reductions
+    assert [ info.name for info in result1 ] == [ 'base_attr', 'leaf_attr' ]
+    assert [ info.name for info in result2 ] == [ 'base_attr' ]
+    assert possessors == [ Leaf1, Leaf1, Leaf2 ]
+    Base.__annotations__ = { 'base_attr': float }
+    result2 = introspection_module._introspect_class(
+        Leaf2, context, introspection_control,
+        interfaces_module.AnnotationsCache( ), table )
+    assert records[ Base ].reductions is not reductions
+    assert result2[ 0 ].annotation is float
+
+
+def test_507_introspect_framework_classes( ):
+    ''' Framework introspectors read dataclass, named tuple, and typed
+        dictionary fields directly. '''
+    import dataclasses
+    import typing
+    introspection_module = cache_import_module(
+        f"{PACKAGE_NAME}.introspection" )
+    context_module = cache_import_module( f"{PACKAGE_NAME}.context" )
+    interfaces_module = cache_import_module( f"{PACKAGE_NAME}.interfaces" )
+    context = context_module.Context(
+        notifier = lambda level, msg: None,
+        fragment_rectifier = lambda fragment, source: fragment,
+        visibility_decider = (
+            lambda possessor, name, annotation, description: True ) )
+    introspection_control = context_module.IntrospectionControl(
+        class_control = context_module.ClassIntrospectionControl(
+            inheritance = True,
+            scan_attributes = True,
+            introspectors = (
+                introspection_module.introspect_dataclasses,
+                introspection_module.introspect_named_tuples,
+                introspection_module.introspect_typed_dicts ) ) )
+    associations = interfaces_module.AttributeAssociations
+    suppress = interfaces_module.ValuationModes.Suppress
+    @dataclasses.dataclass
+    class Base:
+        base: int
+    @dataclasses.dataclass
+    class Record( Base ):
+        count: typing.ClassVar[ int ] = 0
+        seed: dataclasses.InitVar[ int ] = 0
+        label: str = 'label'
+        tags: list[ str ] = dataclasses.field( default_factory = list )
+    class Point( typing.NamedTuple ):
+        x: int
+        y: int = 0
+    class Options( typing.TypedDict, total = False ):
+        verbose: bool
+    class Settings( Options ):
+        name: str
+    def introspect( possessor ):
+        return {
+            info.name: info for info in introspection_module.introspect(
+                possessor, context, introspection_control,
+                interfaces_module.AnnotationsCache( ), { } ) }
+    infos = introspect( Record )
+    assert list( infos ) == [ 'base', 'count', 'label', 'tags' ]
+    assert infos[ 'base' ].default.mode is suppress
+    assert infos[ 'count' ].association is associations.Class
+    assert infos[ 'label' ].association is associations.Instance
+    assert infos[ 'tags' ].default.mode is not suppress
+    infos = introspect( Point )
+    assert list( infos ) == [ 'x', 'y' ]
+    assert infos[ 'x' ].default.mode is suppress
+    assert infos[ 'y' ].annotation is int
+    infos = introspect( Settings )
+    assert list( infos ) == [ 'verbose', 'name' ]
+    assert infos[ 'name' ].annotation is str
+    assert introspection_module.introspect_dataclasses(
+        Point, context, introspection_control, { },
+        interfaces_module.AnnotationsCache( ), { } ) is None
+    # Postponed annotations are unresolved strings in default mode.
+    deferred_module = types.ModuleType( 'test_deferred_dataclasses' )
+    sys.modules[ deferred_module.__name__ ] = deferred_module
+    try:
+        exec( # noqa: S102
+            'from __future__ import annotations\n'
+            'import dataclasses, typing\n'
+            'from dataclasses import InitVar\n'
+            '@dataclasses.dataclass\n'
+            'class Deferred:\n'
+            '    count: typing.ClassVar[ int ] = 0\n'
+            '    seed: InitVar[ int ] = 0\n'
+            '    label: str = "label"\n'
+            'class Plain( Deferred ):\n'
+            '    extra: int = 3\n',
+            deferred_module.__dict__ )
+    finally: del sys.modules[ deferred_module.__name__ ]
+    infos = introspect( deferred_module.Deferred )
+    assert list( infos ) == [ 'count', 'label' ]
+    assert infos[ 'count' ].association is associations.Class
+    assert infos[ 'label' ].association is associations.Instance
+    assert introspection_module.introspect_dataclasses(
+        deferred_module.Plain, context, introspection_control, { },
+        interfaces_module.AnnotationsCache( ), { } ) is None
+    assert 'extra' in introspect( deferred_module.Plain )
+
+
+def test_508_access_annotations_evaluate_resolution( ):
+    ''' Evaluate resolution mode resolves strings with cached results. '''
+    import typing
+    introspection_module = cache_import_module(
+        f"{PACKAGE_NAME}.introspection" )
+    context_module = cache_import_module( f"{PACKAGE_NAME}.context" )
+    interfaces_module = cache_import_module( f"{PACKAGE_NAME}.interfaces" )
+    test_module = types.ModuleType( 'test_resolution_module' )
+    test_module.Widget = type( 'Widget', ( ), { } )
+    context = context_module.Context(
+        notifier = lambda level, msg: None,
+        fragment_rectifier = lambda fragment, source: fragment,
+        visibility_decider = (
+            lambda possessor, name, annotation, description: True ),
+        resolver_locals = { 'Alias': float },
+        resolution_mode = interfaces_module.ResolutionModes.Evaluate )
+    test_module.__annotations__ = {
+        'widget': 'Widget',
+        'widgets': typing.ForwardRef( 'list[ Widget ]' ),
+        'alias': 'Alias',
+        'gadget': 'Gadget',
+        'plain': int,
+    }
+    annotations = introspection_module._access_annotations(
+        test_module, context )
+    assert annotations[ 'widget' ] is test_module.Widget
+    assert annotations[ 'widgets' ] == list[ test_module.Widget ]
+    assert annotations[ 'alias' ] is float
+    assert annotations[ 'gadget' ] == 'Gadget'
+    assert annotations[ 'plain' ] is int
+    resolutions = introspection_module._resolutions[ test_module ]
+    assert len( resolutions ) == 4
+    # Failures are retried once module namespace grows.
+    test_module.Gadget = type( 'Gadget', ( ), { } )
+    annotations = introspection_module._access_annotations(
+        test_module, context )
+    assert annotations[ 'gadget' ] is test_module.Gadget
+    context_ = context_module.Context(
+        notifier = lambda level, msg: None,
+        fragment_rectifier = lambda fragment, source: fragment,
+        visibility_decider = (
+            lambda possessor, name, annotation, description: True ) )
+    annotations = introspection_module._access_annotations(
+        test_module, context_ )
+    assert annotations[ 'widget' ] == 'Widget'
+
+
+def test_509_access_annotations_deferred( ):
+    ''' Deferred annotations with undefined names become forward references
+        rather than being discarded. '''
+    import pytest
+    pytest.importorskip( 'annotationlib' )
+    introspection_module = cache_import_module(
+        f"{PACKAGE_NAME}.introspection" )
+    context_module = cache_import_module( f"{PACKAGE_NAME}.context" )
+    errors = [ ]
+    context = context_module.Context(
+        notifier = lambda level, msg: errors.append( msg ),
+        fragment_rectifier = lambda fragment, source: fragment,
+        visibility_decider = (
+            lambda possessor, name, annotation, description: True ) )
+    namespace = { }
+    exec( # noqa: S102
+        'class Deferred:\n    known: int\n    unknown: Undefined\n',
+        namespace )
+    annotations = introspection_module._access_annotations(
+        namespace[ 'Deferred' ], context )
+    assert errors == [ ]
+    assert annotations[ 'known' ] is int
+    assert annotations[ 'unknown' ].__forward_arg__ == 'Undefined'
+
+
+def test_510_access_annotations_parse_resolution( ):
+    ''' Parse resolution mode reconstructs partially resolvable strings and
+        extracts annotated metadata. '''
+    from typing import Annotated, ForwardRef, Optional
+    introspection_module = cache_import_module(
+        f"{PACKAGE_NAME}.introspection" )
+    context_module = cache_import_module( f"{PACKAGE_NAME}.context" )
+    interfaces_module = cache_import_module( f"{PACKAGE_NAME}.interfaces" )
+    test_module = types.ModuleType( 'test_parse_module' )
+    test_module.Annotated = Annotated
+    test_module.Optional = Optional
+    test_module.Doc = interfaces_module.Doc
+    context = context_module.Context(
+        notifier = lambda level, msg: None,
+        fragment_rectifier = lambda fragment, source: fragment,
+        visibility_decider = (
+            lambda possessor, name, annotation, description: True ),
+        resolution_mode = interfaces_module.ResolutionModes.Parse )
+    test_module.__annotations__ = {
+        'documented': "Annotated[ Optional[ Gadget ], Doc( 'A gadget.' ) ]",
+        'numbers': 'dict[ str, int | None ]',
+        'broken': 'list[',
+    }
+    annotations = introspection_module._access_annotations(
+        test_module, context )
+    documented = annotations[ 'documented' ]
+    assert documented.__metadata__ == ( interfaces_module.Doc( 'A gadget.' ), )
+    adjuncts = interfaces_module.AdjunctsData( )
+    reduction = introspection_module.reduce_annotation(
+        documented, context, adjuncts, interfaces_module.AnnotationsCache( ) )
+    assert reduction == Optional[ ForwardRef( 'Gadget' ) ]
+    assert interfaces_module.Doc( 'A gadget.' ) in adjuncts.extras
+    assert annotations[ 'numbers' ] == dict[ str, int | None ]
+    assert annotations[ 'broken' ] == 'list['
+    parsed = introspection_module._parse_annotation_string
+    hits = parsed.cache_info( ).hits
+    test_module.Gadget = type( 'Gadget', ( ), { } )
+    annotations = introspection_module._access_annotations(
+        test_module, context )
+    assert annotations[ 'documented' ].__origin__ == (
+        Optional[ test_module.Gadget ] )
+    assert parsed.cache_info( ).hits > hits
+
+
+def test_511_resolutions_release_self_referential_classes( ):
+    ''' Classes with annotations which resolve to themselves are not
+        retained by caches. '''
+    import gc
+    import weakref
+    introspection_module = cache_import_module(
+        f"{PACKAGE_NAME}.introspection" )
+    context_module = cache_import_module( f"{PACKAGE_NAME}.context" )
+    interfaces_module = cache_import_module( f"{PACKAGE_NAME}.interfaces" )
+    context = context_module.Context(
+        notifier = lambda level, msg: None,
+        fragment_rectifier = lambda fragment, source: fragment,
+        visibility_decider = (
+            lambda possessor, name, annotation, description: True ),
+        resolution_mode = interfaces_module.ResolutionModes.Evaluate )
+    namespace = { '__annotations__': {
+        'parent': 'Node', 'children': 'list[ Node ]' } }
+    Node = type( 'Node', ( ), namespace )
+    Node.Node = Node
+    informations = introspection_module.introspect(
+        Node, context, context_module.IntrospectionControl( ),
+        interfaces_module.AnnotationsCache( ), { } )
+    assert [ info.annotation for info in informations ] == [
+        Node, list[ Node ] ]
+    reference = weakref.ref( Node )
+    del Node, informations
+    gc.collect( )
+    assert reference( ) is None
+
+
+def test_512_introspect_module_publics_edited_in_place( ):
+    ''' _introspect_module follows in-place edits of module __all__. '''
+    introspection_module = cache_import_module(
+        f"{PACKAGE_NAME}.introspection" )
+    context_module = cache_import_module( f"{PACKAGE_NAME}.context" )
+    interfaces_module = cache_import_module( f"{PACKAGE_NAME}.interfaces" )
+    context = context_module.Context(
+        notifier = lambda level, msg: None,
+        fragment_rectifier = lambda fragment, source: fragment,
+        visibility_decider = introspection_module.is_attribute_visible )
+    mock_module = types.ModuleType( 'test_publics_module' )
+    mock_module.__annotations__ = {
+        'first': int, 'second': int, 'third': int }
+    mock_module.__all__ = [ 'first', 'second' ]
+    introspection_control = context_module.IntrospectionControl( )
+    cache = interfaces_module.AnnotationsCache( )
+    for expected_names in (
+        [ 'first', 'second' ], [ 'first', 'third' ]
+    ):
+        result = introspection_module._introspect_module(
+            mock_module, context, introspection_control, cache, { } )
+        assert [ info.name for info in result ] == expected_names
+        mock_module.__all__[ 1 ] = 'third'
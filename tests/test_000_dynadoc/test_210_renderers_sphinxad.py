@@ -228,3 +228,36 @@ def test_201_qualify_object_name_invoker_globals( ):
     result = renderers_module._qualify_object_name( test_obj, context )
     # Should return just the qualname since it's in invoker_globals
     assert result == 'TestClass'
+
+
+def test_202_qualify_object_name_from_index( ):
+    ''' _qualify_object_name uses precomputed names from index. '''
+    renderers_module = cache_import_module(
+        f"{PACKAGE_NAME}.renderers.sphinxad" )
+    context_module = cache_import_module( f"{PACKAGE_NAME}.context" )
+    class Indexed: pass
+    index = context_module.DocumentablesIndex( )
+    index.enter( context_module.DocumentableEntry(
+        objct = Indexed,
+        kind = context_module.IntrospectionTargets.Class,
+        mname = 'fictional.module',
+        qname = 'Outer.Indexed',
+        qname_head = 'Outer' ) )
+    context = context_module.Context(
+        notifier = lambda level, msg: None,
+        fragment_rectifier = lambda fragment, source: fragment,
+        visibility_decider = (
+            lambda possessor, name, annotation, description: True ) )
+    context = context.with_index( index )
+    result = renderers_module._qualify_object_name( Indexed, context )
+    assert result == 'fictional.module.Outer.Indexed'
+    context = context_module.Context(
+        notifier = context.notifier,
+        fragment_rectifier = context.fragment_rectifier,
+        visibility_decider = context.visibility_decider,
+        invoker_globals = { 'Outer': None },
+        index = index )
+    result = renderers_module._qualify_object_name( Indexed, context )
+    assert result == 'Outer.Indexed'
+    result = renderers_module._qualify_object_name( int, context )
+    assert result == 'int'
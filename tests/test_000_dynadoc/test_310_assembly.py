@@ -125,7 +125,7 @@ def test_104_decorate_object_already_visited( ):
             fragments = ( ),
             table = { } )
         assert True
-    finally: module._visitees.discard( TestClass )
+    finally: module._exclusions.discard( TestClass )
 
 
 def test_105_decorate_core_introspection_disabled( ):
@@ -391,3 +391,680 @@ def test_112_decorate_module_attributes_introspection_limiter_skip( ):
         table = { } )
     assert test_module.marked_attr.__doc__ is None
     assert ':introspected:' in test_module.unmarked_attr.__doc__
+
+
+def test_113_assign_module_docstring_lazy_attributes_untriggered( ):
+    ''' assign_module_docstring does not trigger module lazy loaders. '''
+    loads = [ ]
+    test_module = types.ModuleType( 'test_lazy_module' )
+    def load_lazily( name ):
+        loads.append( name )
+        if name == 'lazy_class': return type( 'LazyClass', ( ), { } )
+        raise AttributeError( name )
+    test_module.__getattr__ = load_lazily
+    test_module.__all__ = [ 'eager_function', 'lazy_class' ]
+    def eager_function( x: int ) -> int:
+        ''' Eager function. '''
+        return x
+    eager_function.__module__ = 'test_lazy_module'
+    test_module.eager_function = eager_function
+    test_module.__annotations__ = { 'lazy_class': type }
+    introspection = _context.IntrospectionControl(
+        module_control = _context.ModuleIntrospectionControl(
+            lazy_attributes = True, scan_attributes = True ),
+        targets = _context.IntrospectionTargetsOmni )
+    module.assign_module_docstring(
+        test_module, introspection = introspection )
+    assert loads == [ ]
+    assert ':argument x:' in test_module.eager_function.__doc__
+    assert '.. py:data:: lazy_class' in test_module.__doc__
+    assert ':value:' not in test_module.__doc__
+
+
+def test_114_assign_module_docstring_returns_index( ):
+    ''' assign_module_docstring returns queryable index of documentables. '''
+    test_module = types.ModuleType( 'test_indexed_module' )
+    class Indexed:
+        ''' Indexed class. '''
+        def method( self, x: int ) -> int:
+            ''' Indexed method. '''
+            return x
+        @property
+        def prop( self ) -> int:
+            ''' Indexed property. '''
+            return 42
+    Indexed.__module__ = 'test_indexed_module'
+    Indexed.__qualname__ = 'Indexed'
+    Indexed.method.__module__ = 'test_indexed_module'
+    Indexed.method.__qualname__ = 'Indexed.method'
+    Indexed.prop.fget.__module__ = 'test_indexed_module'
+    Indexed.prop.fget.__qualname__ = 'Indexed.prop'
+    test_module.Indexed = Indexed
+    test_module.Alias = Indexed
+    introspection = _context.IntrospectionControl(
+        targets = _context.IntrospectionTargetsOmni )
+    index = module.assign_module_docstring(
+        test_module, introspection = introspection )
+    assert len( index ) == 4
+    root = index.access( test_module )
+    assert root.kind is _context.IntrospectionTargets.Module
+    assert root.fqname == 'test_indexed_module'
+    entry = index.query( 'test_indexed_module.Indexed' )
+    assert entry.objct is Indexed
+    assert entry.owner is test_module
+    assert entry.kind is _context.IntrospectionTargets.Class
+    members = index.access_members( test_module )
+    assert [ member.name for member in members ] == [ 'Alias', 'Indexed' ]
+    getter = index.access( Indexed.prop.fget )
+    assert getter.kind is _context.IntrospectionTargets.Descriptor
+    assert getter.owner is Indexed
+    assert index.access( Indexed.method ).qname == 'Indexed.method'
+    assert ':argument x:' in Indexed.method.__doc__
+    assert ':rtype: int' in Indexed.prop.__doc__
+
+
+def test_115_survey_attributes_from_index_respects_targets( ):
+    ''' Surveys from index filter members by introspection targets. '''
+    context = _context.Context(
+        notifier = lambda level, msg: None,
+        fragment_rectifier = lambda fragment, source: fragment,
+        visibility_decider = (
+            lambda possessor, name, annotation, description: True ) )
+    test_module = types.ModuleType( 'test_indexed_module' )
+    class Indexed: pass
+    def function( ): pass
+    Indexed.__module__ = function.__module__ = 'test_indexed_module'
+    test_module.Indexed = Indexed
+    test_module.function = function
+    omni = _context.IntrospectionControl(
+        targets = _context.IntrospectionTargetsSansModule )
+    index = module._produce_index( test_module, context, omni )
+    context = context.with_index( index )
+    classes = _context.IntrospectionControl(
+        targets = _context.IntrospectionTargets.Class )
+    survey = module._survey_attributes_from_index(
+        test_module, context, classes )
+    assert survey == ( ( 'Indexed', Indexed, Indexed ), )
+    modules = _context.IntrospectionControl(
+        targets = _context.IntrospectionTargetsOmni )
+    assert module._survey_attributes_from_index(
+        test_module, context, modules ) is None
+
+
+def test_116_introspection_rules_prune_subtrees( ):
+    ''' Objects matched by exclusion rules are neither surveyed nor
+        decorated. '''
+    test_module = types.ModuleType( 'test_ruled_module' )
+    internal_module = types.ModuleType( 'test_ruled_module._internal' )
+    surveys = [ ]
+    class Surveyed:
+        ''' Surveyed class. '''
+    class Generated:
+        ''' Generated class. '''
+    class Metaclass( type ):
+        def __dir__( cls ):
+            surveys.append( cls )
+            return super( ).__dir__( )
+    Hidden = Metaclass( 'Hidden', ( ), { '__doc__': 'Hidden class.' } )
+    for class_ in ( Surveyed, Generated ):
+        class_.__module__ = 'test_ruled_module'
+        class_.__qualname__ = class_.__name__
+    Hidden.__module__ = 'test_ruled_module._internal'
+    internal_module.Hidden = Hidden
+    test_module._internal = internal_module
+    test_module.Surveyed = Surveyed
+    test_module.Generated = Generated
+    rules = _context.IntrospectionRules( rules = (
+        _context.IntrospectionRule( name = '*._internal' ),
+        _context.IntrospectionRule(
+            name = 'test_ruled_module.Gen*',
+            kinds = _context.IntrospectionTargets.Class ),
+    ) )
+    introspection = _context.IntrospectionControl(
+        rules = rules, targets = _context.IntrospectionTargetsOmni )
+    index = module.assign_module_docstring(
+        test_module,
+        introspection = introspection,
+        renderer = lambda obj, info, context: ':introspected:' )
+    assert surveys == [ ]
+    assert index.access( internal_module ) is None
+    assert index.access( Generated ) is None
+    assert Hidden.__doc__ == 'Hidden class.'
+    assert Generated.__doc__.strip( ) == 'Generated class.'
+    assert ':introspected:' in Surveyed.__doc__
+
+
+def test_117_invoker_globals_automatic( ):
+    ''' Automatic mode binds invoker globals from module of object. '''
+    captures = [ ]
+    def render( possessor, informations, context ):
+        captures.append( context.invoker_globals )
+        return ''
+    context = _context.Context(
+        notifier = lambda level, message: None,
+        fragment_rectifier = lambda fragment, source: fragment,
+        visibility_decider = (
+            lambda possessor, name, annotation, description: True ),
+        invoker_globals_automatic = True )
+    def function( ): pass
+    module.with_docstring( context = context, renderer = render )( function )
+    assert captures[ -1 ] is globals( )
+    test_module = types.ModuleType( 'test_automatic_module' )
+    module.assign_module_docstring(
+        test_module, context = context, renderer = render )
+    assert captures[ -1 ] is test_module.__dict__
+    context_ = context.with_invoker_globals( level = 1 )
+    def function_( ): pass
+    module.with_docstring( context = context_, renderer = render )(
+        function_ )
+    assert captures[ -1 ] is context_.invoker_globals
+
+
+def test_118_function_docstring_reused_for_shared_code( ):
+    ''' Functions sharing code objects reuse assembled docstrings. '''
+    renders = [ ]
+    def render( possessor, informations, context ):
+        renders.append( possessor )
+        return ':introspected:'
+    decorator = module.with_docstring( renderer = render )
+    def produce_callback( annotation ):
+        @decorator
+        def callback( value: annotation ) -> None:
+            ''' Handles value. '''
+        return callback
+    callback1 = produce_callback( int )
+    callback2 = produce_callback( int )
+    assert callback1 is not callback2
+    assert callback1.__code__ is callback2.__code__
+    assert renders == [ callback1 ]
+    assert callback2.__doc__ == callback1.__doc__
+    assert ':introspected:' in callback2.__doc__
+    callback3 = produce_callback( str )
+    assert renders == [ callback1, callback3 ]
+    def produce_plain( ):
+        def plain( value: int ) -> None:
+            ''' Handles value. '''
+        return plain
+    plain = produce_plain( )
+    plain.__module__ = 'test_shared_code_module'
+    test_module = types.ModuleType( 'test_shared_code_module' )
+    test_module.plain = plain
+    module.assign_module_docstring(
+        test_module,
+        introspection = _context.IntrospectionControl(
+            targets = _context.IntrospectionTargets.Function ) )
+    assert ':argument value:' in plain.__doc__
+    # Records from runs with indices of modules would retain the modules.
+    assert plain.__code__ not in module._functions_docstrings
+
+
+def test_119_docstring_template_for_class_factory( monkeypatch ):
+    ''' Template decorator reduces only annotations which vary. '''
+    from typing import Annotated
+    introspection_module = cache_import_module(
+        f"{PACKAGE_NAME}.introspection" )
+    reductions = [ ]
+    reduce_core = introspection_module._reduce_annotation_core
+    def reduce_core_( annotation, *posargs, **nomargs ):
+        reductions.append( annotation )
+        return reduce_core( annotation, *posargs, **nomargs )
+    monkeypatch.setattr(
+        introspection_module, '_reduce_annotation_core', reduce_core_ )
+    introspections = [ ]
+    introspect_class = introspection_module._introspect_class
+    def introspect_class_( possessor, *posargs, **nomargs ):
+        introspections.append( possessor )
+        return introspect_class( possessor, *posargs, **nomargs )
+    monkeypatch.setattr(
+        introspection_module, '_introspect_class', introspect_class_ )
+    decorator = module.with_docstring_template(
+        _interfaces.Doc( 'Produced model.' ) )
+    label = Annotated[ str, _interfaces.Doc( 'Label of model.' ) ]
+    def produce_model( kind, **annotations ):
+        return decorator( type(
+            'Model', ( ), { '__annotations__': {
+                'label': label, 'values': list[ kind ], **annotations } } ) )
+    model1 = produce_model( int )
+    count = len( reductions )
+    model2 = produce_model( float )
+    assert label not in reductions[ count : ]
+    assert list[ float ] in reductions[ count : ]
+    # Alike class only has its varying annotation substituted.
+    assert introspections == [ model1 ]
+    for model, kind in ( ( model1, 'int' ), ( model2, 'float' ) ):
+        assert 'Produced model.' in model.__doc__
+        assert 'Label of model.' in model.__doc__
+        assert f"list[ {kind} ]" in model.__doc__
+    # Unlike classes and described annotations need full introspection.
+    model3 = produce_model( int, extra = bytes )
+    model4 = produce_model(
+        int, extra = Annotated[ bytes, _interfaces.Doc( 'Extra data.' ) ] )
+    assert introspections == [ model1, model3, model4 ]
+    assert 'Extra data.' in model4.__doc__
+
+
+def test_120_visitees_registry_identities_and_generations( ):
+    ''' Visitees registry uses identities and supports resets. '''
+    class Metaclass( type ):
+        def __eq__( cls, other ): raise AssertionError( 'eq' )
+        def __hash__( cls ): raise AssertionError( 'hash' )
+    Hostile = Metaclass( 'Hostile', ( ), { '__module__': 'pkg.sub' } )
+    registry = _interfaces.VisiteesRegistry( )
+    unreferenceable = ( 'not', 'weakly', 'referenceable' )
+    registry.add( Hostile )
+    registry.add( unreferenceable )
+    assert Hostile in registry
+    assert unreferenceable in registry
+    assert ( 'not', 'weakly' ) not in registry
+    registry.discard_subtree( 'pkg' )
+    assert Hostile not in registry
+    assert unreferenceable in registry
+    registry.add( Hostile )
+    registry.advance( )
+    assert Hostile not in registry
+    assert len( registry ) == 0
+    registry.sweep( )
+    assert not registry.entries
+
+
+def test_121_reset_visitees_allows_redecoration( ):
+    ''' Objects may be decorated again after visitees are reset. '''
+    test_module = types.ModuleType( 'test_reset_module' )
+    class Documented:
+        ''' Documented class. '''
+    Documented.__module__ = 'test_reset_module'
+    test_module.Documented = Documented
+    introspection = _context.IntrospectionControl(
+        targets = _context.IntrospectionTargetsOmni )
+    renders = [ ]
+    def render( possessor, informations, context ):
+        renders.append( possessor )
+        return ''
+    for _ in range( 2 ):
+        module.assign_module_docstring(
+            test_module, introspection = introspection, renderer = render )
+    assert renders.count( Documented ) == 1
+    module.reset_visitees( test_module )
+    module.assign_module_docstring(
+        test_module, introspection = introspection, renderer = render )
+    assert renders.count( Documented ) == 2
+
+
+def test_122_incremental_reload_reuses_unchanged( monkeypatch ):
+    ''' Incremental mode reassembles only changed objects after reload. '''
+    test_module = types.ModuleType( 'test_incremental_module' )
+    source = '''
+        \'\'\' Module. \'\'\'
+        class Stable:
+            \'\'\' Stable class. \'\'\'
+            value: int
+        def changing( x: {annotation} ) -> None:
+            \'\'\' Changing function. \'\'\'
+    '''
+    introspection = _context.IntrospectionControl(
+        targets = _context.IntrospectionTargetsOmni )
+    renders = [ ]
+    def render( possessor, informations, context ):
+        renders.append( getattr( possessor, '__qualname__', None ) )
+        return f"rendered {len( informations )}"
+    def load( annotation ):
+        exec( # noqa: S102
+            inspect.cleandoc( source.format( annotation = annotation ) ),
+            test_module.__dict__ )
+        module.assign_module_docstring(
+            test_module,
+            introspection = introspection,
+            renderer = render,
+            incremental = True )
+    load( 'int' )
+    assert test_module.__doc__ == 'Module.\n\nrendered 0'
+    assert test_module.Stable.__doc__ == 'Stable class.\n\nrendered 1'
+    load( 'int' )
+    assert renders.count( 'Stable' ) == 1
+    assert renders.count( 'changing' ) == 1
+    assert test_module.__doc__ == 'Module.\n\nrendered 0'
+    assert test_module.Stable.__doc__ == 'Stable class.\n\nrendered 1'
+    load( 'str' )
+    assert renders.count( 'Stable' ) == 1
+    assert renders.count( 'changing' ) == 2
+    assert test_module.changing.__doc__ == 'Changing function.\n\nrendered 2'
+    # Least recently assembled docstrings are evicted beyond maximum.
+    monkeypatch.setattr( module, '_retentions_maximum', 1 )
+    load( 'bytes' )
+    assert list( module._retentions ) == [ 'test_incremental_module' ]
+
+
+def test_123_fingerprint_stable_and_sensitive( ):
+    ''' Fingerprints are stable across hash seeds and track inputs. '''
+    import os
+    import subprocess
+    import sys
+    source = inspect.cleandoc( '''
+        import dynadoc
+        class Example:
+            \'\'\' Example. \'\'\'
+            names: frozenset[ str ] = frozenset( ( 'a', 'b', 'c', 'd' ) )
+        print( dynadoc.produce_fingerprint( Example ) )
+    ''' )
+    digests = set( )
+    for seed in ( '0', '1' ):
+        environment = dict( os.environ, PYTHONHASHSEED = seed )
+        environment[ 'PYTHONPATH' ] = os.pathsep.join( sys.path )
+        result = subprocess.run( # noqa: S603
+            ( sys.executable, '-c', source ),
+            capture_output = True, check = True, env = environment,
+            text = True )
+        digests.add( result.stdout.strip( ) )
+    assert len( digests ) == 1
+    class Example:
+        ''' Example. '''
+        value: int = 1
+    digest = module.produce_fingerprint( Example )
+    assert Example.__doc__ == ''' Example. '''
+    assert Example not in module._visitees
+    assert digest == module.produce_fingerprint( Example )
+    assert digest != module.produce_fingerprint( Example, preserve = False )
+    Example.value = 2
+    assert digest != module.produce_fingerprint( Example )
+    class Example:
+        ''' Example. '''
+        value: str = 1
+    assert digest != module.produce_fingerprint( Example )
+    Example.value = ( 1, 2 )
+    digest = module.produce_fingerprint( Example )
+    Example.value = [ 1, 2 ]
+    assert digest != module.produce_fingerprint( Example )
+
+
+def test_124_produce_docstrings_without_mutation( ):
+    ''' Docstrings are produced without modifying objects or visitees. '''
+    test_module = types.ModuleType( 'test_pure_module' )
+    test_module.__doc__ = ''' Module. '''
+    class Documented:
+        ''' Documented class. '''
+        value: int
+        @property
+        def attribute( self ) -> int:
+            ''' Attribute. '''
+            return 0
+    Documented.__module__ = 'test_pure_module'
+    Documented.attribute.fget.__module__ = 'test_pure_module'
+    test_module.Documented = Documented
+    introspection = _context.IntrospectionControl(
+        targets = _context.IntrospectionTargetsOmni )
+    def render( possessor, informations, context ):
+        return f"rendered {len( informations )}"
+    qname = Documented.__qualname__
+    docstrings = module.produce_docstrings(
+        test_module, introspection = introspection, renderer = render )
+    assert docstrings == {
+        f"test_pure_module.{qname}.attribute": 'Attribute.\n\nrendered 2',
+        f"test_pure_module.{qname}": 'Documented class.\n\nrendered 1',
+        'test_pure_module': 'Module.\n\nrendered 0',
+    }
+    assert test_module.__doc__ == ''' Module. '''
+    assert Documented.__doc__ == ''' Documented class. '''
+    assert Documented.attribute.__doc__ == ''' Attribute. '''
+    assert test_module not in module._visitees
+    assert Documented not in module._visitees
+    assert docstrings == module.produce_docstrings(
+        test_module, introspection = introspection, renderer = render )
+    module.assign_module_docstring(
+        test_module, introspection = introspection, renderer = render )
+    assert test_module.__doc__ == docstrings[ 'test_pure_module' ]
+    assert Documented.__doc__ == docstrings[ f"test_pure_module.{qname}" ]
+    def function( value: int ) -> None:
+        ''' Function. '''
+    docstrings = module.produce_docstrings( function, renderer = render )
+    assert list( docstrings.values( ) ) == [ 'Function.\n\nrendered 2' ]
+    assert function.__code__ not in module._functions_docstrings
+
+
+def test_125_instrumenter_receives_stage_events( ):
+    ''' Instrumenter receives durations of stages and callbacks. '''
+    from dynadoc import factories as _factories
+    events = [ ]
+    context = _factories.produce_context( instrumenter = events.append )
+    test_module = types.ModuleType( 'test_instrumented_module' )
+    class Documented:
+        ''' Documented class. '''
+        value: int
+    Documented.__module__ = 'test_instrumented_module'
+    test_module.Documented = Documented
+    introspection = _context.IntrospectionControl(
+        targets = _context.IntrospectionTargetsOmni )
+    module.assign_module_docstring(
+        test_module, context = context, introspection = introspection )
+    stages = _interfaces.InstrumentationStages
+    recorded = { event.stage for event in events }
+    assert {
+        stages.Assignment, stages.Introspection, stages.Limitation,
+        stages.Rectification, stages.Reduction, stages.Rendering,
+        stages.Survey, stages.VisibilityDecision,
+    } <= recorded
+    assert all( event.elapsed >= 0 for event in events )
+    names = {
+        event.name for event in events if event.stage is stages.Rendering }
+    assert names == {
+        'test_instrumented_module',
+        f"test_instrumented_module.{Documented.__qualname__}" }
+    reductions = [
+        event for event in events if event.stage is stages.Reduction ]
+    assert reductions[ 0 ].objct is int
+    decisions = [
+        event for event in events
+        if event.stage is stages.VisibilityDecision ]
+    assert { event.objct for event in decisions } == { Documented }
+    assert { event.name for event in decisions } == {
+        f"test_instrumented_module.{Documented.__qualname__}" }
+    assert context.with_instrumented_callbacks( ) is not context
+    instrumented = context.with_instrumented_callbacks( )
+    _factories.produce_context(
+        notifier = lambda level, message: None,
+        instrumenter = events.append,
+    ).with_instrumented_callbacks( ).notify(
+        'admonition', 'Attributed.', qualname = 'example.Documented' )
+    assert events[ -1 ].stage is stages.Notification
+    assert events[ -1 ].name == 'example.Documented'
+    assert instrumented.with_instrumented_callbacks( ) is instrumented
+    assert module.context_default.with_instrumented_callbacks( ) is (
+        module.context_default )
+
+
+def test_126_statistics_accumulate_and_reset( ):
+    ''' Statistics accumulate across decorations and can be reset. '''
+    import pytest
+    from dynadoc import counters as _counters
+    from dynadoc import factories as _factories
+    _counters.reset_statistics( )
+    statistics = _counters.access_statistics( )
+    assert statistics.renditions == 0
+    assert not statistics.decorations
+    test_module = types.ModuleType( 'test_counted_module' )
+    class Documented:
+        ''' Documented class. '''
+        value: int
+    Documented.__module__ = 'test_counted_module'
+    test_module.Documented = Documented
+    test_module.other = 42
+    introspection = _context.IntrospectionControl(
+        targets = _context.IntrospectionTargetsOmni )
+    context = _factories.produce_context(
+        notifier = lambda level, message: None )
+    module.assign_module_docstring(
+        test_module, 'absent',
+        context = context, introspection = introspection )
+    statistics = _counters.access_statistics( )
+    assert statistics.decorations == { 'Class': 1, 'Module': 1 }
+    assert statistics.renditions == 2
+    assert statistics.reductions == 1
+    assert statistics.members_accepted == 1
+    assert statistics.members_examined > statistics.members_accepted
+    assert statistics.notifications == { 'error': 1 }
+    assert statistics.docstrings_size == (
+        len( test_module.__doc__ or '' ) + len( Documented.__doc__ ) )
+    assert statistics.duration > 0
+    _counters.reset_statistics( )
+    assert _counters.access_statistics( ).renditions == 0
+    # Failing runs are timed too.
+    def render( possessor, informations, context ):
+        raise RuntimeError
+    class Failing:
+        ''' Failing class. '''
+    with pytest.raises( RuntimeError ):
+        module.with_docstring( renderer = render )( Failing )
+    assert _counters.access_statistics( ).duration > 0
+
+
+def test_127_tracer_records_object_hierarchy( monkeypatch, tmp_path ):
+    ''' Tracer attributes time to stacks of decorated objects. '''
+    import json
+    from dynadoc import tracing as _tracing
+    tracer = _tracing.Tracer( )
+    monkeypatch.setattr( _tracing, 'tracer', tracer )
+    test_module = types.ModuleType( 'test_traced_package.module' )
+    class Documented:
+        ''' Documented class. '''
+        def method( self ) -> None:
+            ''' Method. '''
+    Documented.__module__ = 'test_traced_package.module'
+    Documented.__qualname__ = 'Documented'
+    Documented.method.__module__ = 'test_traced_package.module'
+    Documented.method.__qualname__ = 'Documented.method'
+    test_module.Documented = Documented
+    introspection = _context.IntrospectionControl(
+        targets = _context.IntrospectionTargetsOmni )
+    module.assign_module_docstring(
+        test_module, introspection = introspection )
+    assert set( tracer.weights ) == {
+        ( 'test_traced_package', 'test_traced_package.module' ),
+        ( 'test_traced_package', 'test_traced_package.module',
+          'Documented' ),
+        ( 'test_traced_package', 'test_traced_package.module',
+          'Documented', 'method' ),
+    }
+    assert all( weight >= 0 for weight in tracer.weights.values( ) )
+    collapsed = tmp_path / 'trace.folded'
+    tracer.save( collapsed )
+    lines = collapsed.read_text( ).splitlines( )
+    assert lines[ -1 ].startswith(
+        'test_traced_package;test_traced_package.module;Documented;method ' )
+    speedscope = tmp_path / 'trace.json'
+    tracer.save( speedscope )
+    document = json.loads( speedscope.read_text( ) )
+    profile = document[ 'profiles' ][ 0 ]
+    assert len( document[ 'shared' ][ 'frames' ] ) == 4
+    assert len( profile[ 'samples' ] ) == len( profile[ 'weights' ] ) == 3
+    assert profile[ 'endValue' ] == sum( tracer.weights.values( ) )
+
+
+def test_128_buffered_notifier_summarizes_duplicates( ):
+    ''' Buffered notifier emits one summary of duplicates per run. '''
+    from dynadoc import factories as _factories
+    summaries = [ ]
+    notifier = _factories.BufferedNotifier(
+        emitter = lambda level, message: summaries.append(
+            ( level, message ) ),
+        flush_at_exit = False )
+    context = _factories.produce_context( notifier = notifier )
+    test_module = types.ModuleType( 'test_buffered_module' )
+    alias = __import__( 'typing' ).Annotated[
+        int, _interfaces.Fname( 'absent' ) ]
+    def function0( value: alias ) -> None: pass
+    def function1( value: alias ) -> None: pass
+    def function2( value: alias ) -> None: pass
+    for function in ( function0, function1, function2 ):
+        function.__module__ = 'test_buffered_module'
+        function.__qualname__ = function.__name__
+        setattr( test_module, function.__name__, function )
+    introspection = _context.IntrospectionControl(
+        targets = _context.IntrospectionTargetsOmni )
+    module.assign_module_docstring(
+        test_module, 'missing',
+        context = context, introspection = introspection )
+    assert not notifier.notifications
+    assert len( summaries ) == 1
+    level, summary = summaries[ 0 ]
+    assert level == 'error'
+    lines = summary.splitlines( )
+    assert lines[ 0 ] == 'Summary of 4 notifications (2 distinct):'
+    assert lines[ 1 : ] == [
+        "  error [fragment-absent]: "
+        "Fragment 'absent' not in provided table. (x3)",
+        "    in test_buffered_module.function0",
+        "    in test_buffered_module.function1",
+        "    in test_buffered_module.function2",
+        "  error [fragment-absent]: "
+        "Fragment 'missing' not in provided table.",
+    ]
+
+
+def test_129_buffered_notifier_accumulates_across_runs( ):
+    ''' Buffered notifier without flushes after runs accumulates. '''
+    from dynadoc import factories as _factories
+    summaries = [ ]
+    notifier = _factories.BufferedNotifier(
+        emitter = lambda level, message: summaries.append(
+            ( level, message ) ),
+        flush_after_runs = False, flush_at_exit = False )
+    notifier( 'admonition', 'Plain message.' )
+    notifier( 'admonition', 'Plain message.' )
+    context = _factories.produce_context( notifier = notifier )
+    class Documented:
+        _dynadoc_fragments_ = 42
+    context.notify(
+        'admonition', 'Structured message.',
+        code = 'example', qualname = 'example.Documented' )
+    module.produce_docstrings( Documented, context = context )
+    assert not summaries
+    assert len( notifier.notifications ) == 3
+    notifier.flush( )
+    notifier.flush( )
+    assert len( summaries ) == 1
+    level, summary = summaries[ 0 ]
+    assert level == 'error'
+    assert summary.splitlines( )[ 1 : ] == [
+        "  admonition: Plain message. (x2)",
+        "  admonition [example] example.Documented: Structured message.",
+        "  error [fragments-invalid] "
+        f"{__name__}.test_129_buffered_notifier_accumulates_across_runs"
+        ".<locals>.Documented: Invalid fragments sequence on "
+        f"{__name__}.test_129_buffered_notifier_accumulates_across_runs"
+        ".<locals>.Documented: 42",
+    ]
+
+
+def test_130_ignored_notifications_not_formatted( ):
+    ''' Representations for notifications at disabled levels are avoided. '''
+    from dynadoc import factories as _factories
+    representations = [ ]
+    class Expensive:
+        def __repr__( self ):
+            representations.append( None )
+            return 'Expensive( )'
+    class Documented:
+        _dynadoc_fragments_ = ( Expensive( ), )
+    context = _factories.produce_context(
+        notifier = _factories.FilteredNotifier( levels = frozenset( ) ) )
+    module.produce_docstrings( Documented, context = context )
+    assert not representations
+    received = [ ]
+    context = _factories.produce_context(
+        notifier = lambda level, message: received.append( message ) )
+    module.produce_docstrings( Documented, context = context )
+    assert representations
+    assert received[ 0 ].endswith( ': Expensive( )' )
+
+
+def test_131_buffered_notifier_released_before_exit( ):
+    ''' Buffered notifiers, which flush at exit, can be collected. '''
+    import gc
+    import weakref
+    from dynadoc import factories as _factories
+    notifiers = [
+        _factories.BufferedNotifier( emitter = lambda level, message: None )
+        for _ in range( 3 ) ]
+    references = [ weakref.ref( notifier ) for notifier in notifiers ]
+    del notifiers
+    gc.collect( )
+    assert all( reference( ) is None for reference in references )
@@ -0,0 +1,180 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Benchmark stages of docstring assembly on synthetic workloads.
+
+    Results are written as JSON to the file named by the
+    ``DYNADOC_BENCHMARKS`` environment variable or, by default, to a
+    temporary directory. For each workload and stage, the best and median
+    durations in nanoseconds are recorded, so that results from different
+    runs can be compared.
+'''
+
+
+import json
+import os
+import platform
+import statistics
+import time
+
+from pathlib import Path
+
+import pytest
+
+from .__ import (
+    PACKAGE_NAME,
+    SYNTHETIC_WORKLOADS,
+    cache_import_module,
+    decorate_synthetic_module,
+    produce_synthetic_module,
+)
+
+
+_repetitions = 7
+_results: dict[ str, dict[ str, object ] ] = { }
+_stages = (
+    'reduce_annotation', 'introspect', 'produce_fragment',
+    'survey_attributes', 'assign_module_docstring' )
+
+
+@pytest.fixture( scope = 'module', autouse = True )
+def _save_results( tmp_path_factory ):
+    yield
+    if not _results: return
+    location = Path( os.environ.get(
+        'DYNADOC_BENCHMARKS',
+        tmp_path_factory.mktemp( 'benchmarks' ) / 'benchmarks.json' ) )
+    location.parent.mkdir( exist_ok = True, parents = True )
+    document = {
+        'implementation': platform.python_implementation( ),
+        'version': platform.python_version( ),
+        'repetitions': _repetitions,
+        'workloads': _results,
+    }
+    location.write_text( json.dumps( document, indent = 2 ) )
+
+
+def _measure( invocation, preparation = None, instrumented = False ):
+    # Instrumented invocations return their own elapsed times.
+    durations = [ ]
+    for _ in range( _repetitions ):
+        argument = preparation( ) if preparation else None
+        start = time.perf_counter_ns( )
+        elapsed = invocation( argument )
+        if not instrumented: elapsed = time.perf_counter_ns( ) - start
+        durations.append( elapsed )
+    return dict(
+        best = min( durations ), median = statistics.median( durations ) )
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize( 'workload', tuple( SYNTHETIC_WORKLOADS ) )
+def test_100_benchmark_stages( workload ):
+    ''' Times each stage of docstring assembly on synthetic workload. '''
+    assembly = cache_import_module( f"{PACKAGE_NAME}.assembly" )
+    context_module = cache_import_module( f"{PACKAGE_NAME}.context" )
+    factories = cache_import_module( f"{PACKAGE_NAME}.factories" )
+    interfaces = cache_import_module( f"{PACKAGE_NAME}.interfaces" )
+    introspection_module = cache_import_module(
+        f"{PACKAGE_NAME}.introspection" )
+    sphinxad = cache_import_module( f"{PACKAGE_NAME}.renderers.sphinxad" )
+    parameters = SYNTHETIC_WORKLOADS[ workload ]
+    name = f"benchmark_{workload}"
+    module = produce_synthetic_module( name, **parameters )
+    context = factories.produce_context(
+        notifier = lambda level, message: None )
+    introspection = context_module.IntrospectionControl(
+        targets = context_module.IntrospectionTargetsOmni )
+    functions = [
+        value for aname, value in sorted( vars( module ).items( ) )
+        if aname.startswith( 'function' ) ]
+    classes = [
+        value for aname, value in sorted( vars( module ).items( ) )
+        if aname.startswith( 'Class' ) ]
+    annotations = [
+        annotation for function in functions
+        for annotation in function.__annotations__.values( ) ]
+
+    def reduce( _ ):
+        for annotation in annotations:
+            introspection_module.reduce_annotation(
+                annotation, context,
+                interfaces.AdjunctsData( ), interfaces.AnnotationsCache( ) )
+
+    def introspect( _ ):
+        cache = interfaces.AnnotationsCache( )
+        return [
+            introspection_module.introspect(
+                objct, context = context, introspection = introspection,
+                cache = cache, table = { } )
+            for objct in ( *functions, *classes ) ]
+
+    informations = introspect( None )
+
+    def render( _ ):
+        for objct, informations_ in zip(
+            ( *functions, *classes ), informations, strict = True
+        ): sphinxad.produce_fragment( objct, informations_, context )
+
+    survey_stage = interfaces.InstrumentationStages.Survey
+    surveys = [ ]
+    context_instrumented = factories.produce_context(
+        notifier = lambda level, message: None,
+        instrumenter = lambda event: (
+            surveys.append( event ) if event.stage is survey_stage
+            else None ) )
+
+    def survey( module_ ):
+        surveys.clear( )
+        assembly.assign_module_docstring(
+            module_,
+            context = context_instrumented, introspection = introspection )
+        # Module is surveyed first, while being indexed.
+        assert surveys[ 0 ].objct is module_
+        return sum( event.elapsed for event in surveys )
+
+    def decorate( module_ ):
+        decorate_synthetic_module( module_ )
+        assert module_.function0.__doc__
+
+    _results[ workload ] = {
+        'parameters': parameters,
+        'stages': {
+            'reduce_annotation': _measure( reduce ),
+            'introspect': _measure( introspect ),
+            'produce_fragment': _measure( render ),
+            'survey_attributes': _measure(
+                survey,
+                lambda: produce_synthetic_module( name, **parameters ),
+                instrumented = True ),
+            'assign_module_docstring': _measure(
+                decorate,
+                lambda: produce_synthetic_module( name, **parameters ) ),
+        },
+    }
+    stages = _results[ workload ][ 'stages' ]
+    assert tuple( stages ) == _stages
+    assert all(
+        0 < measure[ 'best' ] <= measure[ 'median' ]
+        for measure in stages.values( ) )
+    # Surveys are part of the end-to-end assignment.
+    assert stages[ 'survey_attributes' ][ 'best' ] < (
+        stages[ 'assign_module_docstring' ][ 'median' ] )
+    assert len( json.dumps( _results ) ) # Results are serializable.
@@ -0,0 +1,147 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Assert that costs of docstring assembly grow linearly with workloads.
+
+    Operation counts are compared where possible, so that the assertions
+    are stable on shared machines. Timings are compared only as ratios of
+    best durations, in slow tests.
+'''
+
+
+import itertools
+import time
+import types
+
+import pytest
+
+from .__ import (
+    PACKAGE_NAME,
+    cache_import_module,
+    decorate_synthetic_module,
+    produce_synthetic_module,
+)
+
+
+_sizes = ( 8, 16, 32 )
+
+
+def _decorate_and_count( module ):
+    counters = cache_import_module( f"{PACKAGE_NAME}.counters" )
+    counters.reset_statistics( )
+    decorate_synthetic_module( module )
+    return counters.access_statistics( )
+
+
+def _assert_linear( counts, tolerance = 2.25 ):
+    for smaller, larger in itertools.pairwise( counts ):
+        assert larger <= smaller * tolerance, counts
+
+
+def _measure_best( invocation, repetitions = 5 ):
+    durations = [ ]
+    for _ in range( repetitions ):
+        start = time.perf_counter_ns( )
+        invocation( )
+        durations.append( time.perf_counter_ns( ) - start )
+    return min( durations )
+
+
+def test_100_module_operations_scale_linearly( ):
+    ''' Operations grow linearly with numbers of functions and classes. '''
+    statistics = [
+        _decorate_and_count( produce_synthetic_module(
+            f"scaling_module_{size}",
+            functions = size, classes = size, width = 4 ) )
+        for size in _sizes ]
+    for attribute in (
+        'members_examined', 'members_accepted',
+        'reductions', 'cache_misses', 'renditions', 'docstrings_size',
+    ):
+        _assert_linear( [
+            getattr( statistics_, attribute )
+            for statistics_ in statistics ] )
+
+
+def test_110_inheritance_operations_scale_linearly( ):
+    ''' Surveys of class chains do not examine inherited members again. '''
+    statistics = [ ]
+    for size in _sizes:
+        module = types.ModuleType( f"scaling_inheritance_{size}" )
+        base = object
+        for i in range( size ):
+            def method( self ) -> int:
+                ''' Method. '''
+                return 0
+            method.__module__ = module.__name__
+            method.__qualname__ = f"Class{i}.method{i}"
+            base = type(
+                f"Class{i}", ( base, ), {
+                    '__doc__': f''' Class {i}. ''',
+                    '__module__': module.__name__,
+                    f"method{i}": method } )
+            setattr( module, f"Class{i}", base )
+        statistics.append( _decorate_and_count( module ) )
+    _assert_linear( [
+        statistics_.members_examined for statistics_ in statistics ] )
+
+
+def test_120_union_width_operations_scale_linearly( ):
+    ''' Reductions grow linearly with widths of unions. '''
+    statistics = [
+        _decorate_and_count( produce_synthetic_module(
+            f"scaling_union_{size}",
+            functions = 4, classes = 1, width = size ) )
+        for size in _sizes ]
+    _assert_linear( [
+        statistics_.cache_misses for statistics_ in statistics ] )
+
+
+@pytest.mark.slow
+def test_200_module_publics_visibility_scales_linearly( ):
+    ''' Visibility by module publics does not scan '__all__' repeatedly. '''
+    introspection = cache_import_module( f"{PACKAGE_NAME}.introspection" )
+    durations = [ ]
+    for size in ( 1000, 4000 ):
+        module = types.ModuleType( f"scaling_publics_{size}" )
+        names = [ f"name{i}" for i in range( size ) ]
+        module.__all__ = names
+        def check( module = module, names = names ):
+            for name in names:
+                introspection.is_attribute_visible(
+                    module, name, None, None )
+        durations.append( _measure_best( check ) )
+    # Linear growth is 4; quadratic growth is 16.
+    assert durations[ 1 ] < durations[ 0 ] * 8
+
+
+@pytest.mark.slow
+def test_210_exception_union_scales_linearly( ):
+    ''' Unions of exception classes are built in one construction. '''
+    introspection = cache_import_module( f"{PACKAGE_NAME}.introspection" )
+    durations = [ ]
+    for size in ( 250, 1000 ):
+        classes = tuple(
+            type( f"Error{i}", ( Exception, ), { } ) for i in range( size ) )
+        durations.append( _measure_best(
+            lambda classes = classes:
+                introspection._classes_sequence_to_union( classes ) ) )
+    # Linear growth is 4; quadratic growth is 16.
+    assert durations[ 1 ] < durations[ 0 ] * 8
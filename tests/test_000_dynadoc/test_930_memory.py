@@ -0,0 +1,124 @@
+# vim: set filetype=python fileencoding=utf-8:
+# -*- coding: utf-8 -*-
+
+#============================================================================#
+#                                                                            #
+#  Licensed under the Apache License, Version 2.0 (the "License");           #
+#  you may not use this file except in compliance with the License.          #
+#  You may obtain a copy of the License at                                   #
+#                                                                            #
+#      http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                            #
+#  Unless required by applicable law or agreed to in writing, software       #
+#  distributed under the License is distributed on an "AS IS" BASIS,         #
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#  See the License for the specific language governing permissions and       #
+#  limitations under the License.                                            #
+#                                                                            #
+#============================================================================#
+
+
+''' Assert budgets for memory of docstring assembly and its retention.
+
+    Peak and retained traced memory are measured while decorating synthetic
+    workloads. Budgets are roughly twice the measurements on CPython, so
+    that they catch regressions rather than noise. After decoration, only
+    docstrings and weakly-keyed records should remain; intermediates, such
+    as annotations caches and informations, must be collectable.
+'''
+
+
+import gc
+import tracemalloc
+import weakref
+
+import pytest
+
+from .__ import (
+    PACKAGE_NAME,
+    SYNTHETIC_WORKLOADS,
+    cache_import_module,
+    decorate_synthetic_module,
+    produce_synthetic_module,
+)
+
+
+# Budgets in bytes: ( peak, retained ).
+_budgets = {
+    'small': ( 128 * 1024, 64 * 1024 ),
+    'wide': ( 1024 * 1024, 640 * 1024 ),
+    'deep': ( 512 * 1024, 320 * 1024 ),
+    'large': ( 8 * 1024 * 1024, 5 * 1024 * 1024 ),
+}
+
+
+def _count_intermediates( ):
+    interfaces = cache_import_module( f"{PACKAGE_NAME}.interfaces" )
+    classes = (
+        interfaces.AdjunctsData,
+        interfaces.AnnotationsCache,
+        interfaces.InformationBase,
+    )
+    gc.collect( )
+    counts = dict.fromkeys( classes, 0 )
+    for objct in gc.get_objects( ):
+        for class_ in classes:
+            if isinstance( objct, class_ ): counts[ class_ ] += 1
+    return counts
+
+
+@pytest.mark.parametrize( 'name', [
+    'small', 'wide', 'deep',
+    pytest.param( 'large', marks = pytest.mark.slow ),
+] )
+def test_100_memory_within_budgets( name ):
+    ''' Peak and retained traced memory stay within budgets. '''
+    module = produce_synthetic_module(
+        f"memory_{name}", **SYNTHETIC_WORKLOADS[ name ] )
+    gc.collect( )
+    tracemalloc.start( )
+    try:
+        decorate_synthetic_module( module )
+        gc.collect( )
+        retained, peak = tracemalloc.get_traced_memory( )
+    finally: tracemalloc.stop( )
+    peak_budget, retained_budget = _budgets[ name ]
+    assert peak <= peak_budget, ( peak, peak_budget )
+    assert retained <= retained_budget, ( retained, retained_budget )
+
+
+def test_200_intermediates_not_retained( ):
+    ''' Caches and informations are not retained after decoration. '''
+    interfaces = cache_import_module( f"{PACKAGE_NAME}.interfaces" )
+    counts_initial = _count_intermediates( )
+    module = produce_synthetic_module(
+        'memory_intermediates', **SYNTHETIC_WORKLOADS[ 'small' ] )
+    decorate_synthetic_module( module )
+    assert module.function0.__doc__
+    counts = _count_intermediates( )
+    assert counts[ interfaces.AnnotationsCache ] == (
+        counts_initial[ interfaces.AnnotationsCache ] )
+    assert counts[ interfaces.InformationBase ] == (
+        counts_initial[ interfaces.InformationBase ] )
+
+
+def test_210_module_collectable_after_decoration( ):
+    ''' Decorated module and its intermediates are collectable. '''
+    assembly = cache_import_module( f"{PACKAGE_NAME}.assembly" )
+    counts_initial = _count_intermediates( )
+    records_count = len( assembly._functions_docstrings )
+    module = produce_synthetic_module(
+        'memory_collectable', **SYNTHETIC_WORKLOADS[ 'small' ] )
+    # Classes with annotations which reference each other.
+    module.Class0.__annotations__[ 'peer' ] = module.Class1
+    module.Class1.__annotations__[ 'peer' ] = module.Class0
+    decorate_synthetic_module( module )
+    reference = weakref.ref( module )
+    classes_references = [
+        weakref.ref( module.Class0 ), weakref.ref( module.Class1 ) ]
+    del module
+    gc.collect( )
+    assert reference( ) is None
+    assert all( reference_( ) is None for reference_ in classes_references )
+    assert len( assembly._functions_docstrings ) == records_count
+    assert _count_intermediates( ) == counts_initial